@@ -0,0 +1,21 @@
+from django.apps import AppConfig
+from django.conf import settings
+
+
+class CctvConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'cctv'
+
+    def ready(self):
+        # 워커 시작 시 공간 인덱스를 미리 생성 (첫 요청 지연 방지)
+        if settings.CCTV_INDEX_PRELOAD:
+            from .search import search_store
+            from .store import cctv_store, cluster_store
+            cctv_store.get()
+            cluster_store.get()
+            search_store.get()
+
+        # 전국 스트림 URL 목록을 주기적으로 받아 bbox API 호출 없이 조회
+        if settings.CCTV_STREAM_URL_PREFETCH:
+            from .stream_urls import stream_url_cache
+            stream_url_cache.start_background_prefetch()
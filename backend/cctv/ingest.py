@@ -0,0 +1,131 @@
+"""
+CCTV 데이터 DB 적재
+
+파이프라인 결과 파일(cctv-data*-with-links.json)의 레코드를 (variant, cctvId) 기준으로 CCTV 테이블에 upsert합니다.
+레코드마다 저장할 열 값의 해시를 계산해 DB의 content_hash와 비교하므로, 다시 적재할 때는
+추가/변경된 행만 CCTV_INGEST_BATCH_SIZE개씩 별도 트랜잭션으로 씁니다.
+"""
+import hashlib
+import json
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from common.bulk import bulk_upsert
+
+from .models import CCTV
+
+DATA_FILE_PATTERN = 'cctv-data*-with-links.json'
+DEFAULT_VARIANT = 'http'
+
+UNIQUE_FIELDS = ['variant', 'cctv_id']
+# record_values 순서
+VALUE_FIELDS = [
+    'name', 'url', 'coord_x', 'coord_y', 'cctv_type', 'cctv_format', 'resolution', 'road_section_id',
+    'file_created', 'road_type', 'link_id', 'link_road_name', 'link_distance', 'health_status',
+]
+FIELDS = UNIQUE_FIELDS + VALUE_FIELDS + ['content_hash', 'updated_at']
+
+
+def data_files(directory=None):
+    """데이터 폴더의 결과 파일 목록 (기본: CCTV_DATA_FILE이 있는 폴더)"""
+    directory = directory or settings.CCTV_DATA_FILE.parent
+    return sorted(directory.glob(DATA_FILE_PATTERN))
+
+
+def variant_for(path):
+    """파일명 → 버전 (cctv-data-with-links.json → http, cctv-data-https-with-links.json → https)"""
+    middle = path.name[len('cctv-data'):-len('-with-links.json')].strip('-')
+    return middle or DEFAULT_VARIANT
+
+
+def load_records(path):
+    with open(path, encoding='utf-8') as f:
+        data = json.load(f)
+    return data.get('response', {}).get('data') or []
+
+
+def _text(value):
+    return '' if value is None else str(value)
+
+
+def record_values(record):
+    """레코드 → VALUE_FIELDS 순서의 열 값 튜플 (좌표가 없거나 잘못되면 ValueError/KeyError)"""
+    cctv_type = record.get('cctvtype')
+    link_distance = record.get('linkDistance')
+    health = record.get('health')
+    return (
+        _text(record.get('cctvname')),
+        _text(record.get('cctvurl')),
+        float(record['coordx']),
+        float(record['coordy']),
+        int(cctv_type) if cctv_type not in (None, '') else None,
+        _text(record.get('cctvformat')),
+        _text(record.get('cctvresolution')),
+        _text(record.get('roadsectionid')),
+        _text(record.get('filecreatetime')),
+        _text(record.get('roadType')),
+        record.get('linkId') or None,
+        _text(record.get('linkRoadName')),
+        float(link_distance) if link_distance is not None else None,
+        _text(health.get('status')) if isinstance(health, dict) else '',
+    )
+
+
+def content_hash(values):
+    encoded = json.dumps(values, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+def ingest_records(variant, records, batch_size=None, prune=False, dry_run=False):
+    """레코드 목록을 한 버전으로 적재 → 건수 dict
+
+    inserted/updated: 새로 추가/내용이 바뀌어 쓴 행, unchanged: 해시가 같아 건너뛴 행,
+    skipped: cctvId가 없거나(중복 포함) 좌표가 잘못된 레코드, absent: DB에는 있지만 파일에 없는 행
+    (prune이면 삭제하고 deleted에 기록), dry_run이면 DB에 쓰지 않고 건수만 계산
+    """
+    batch_size = batch_size or settings.CCTV_INGEST_BATCH_SIZE
+    existing = dict(CCTV.objects.filter(variant=variant).values_list('cctv_id', 'content_hash'))
+    now = timezone.now()
+    counts = dict.fromkeys(['inserted', 'updated', 'unchanged', 'skipped', 'absent', 'deleted'], 0)
+
+    rows = []
+    seen = set()
+    for record in records:
+        cctv_id = record.get('cctvId')
+        if not cctv_id or cctv_id in seen:
+            counts['skipped'] += 1
+            continue
+        seen.add(cctv_id)
+        try:
+            values = record_values(record)
+        except (KeyError, TypeError, ValueError):
+            counts['skipped'] += 1
+            continue
+
+        digest = content_hash(values)
+        previous = existing.get(cctv_id)
+        if previous == digest:
+            counts['unchanged'] += 1
+            continue
+        counts['inserted' if previous is None else 'updated'] += 1
+        rows.append((variant, cctv_id, *values, digest, now))
+
+    absent = [cctv_id for cctv_id in existing if cctv_id not in seen]
+    counts['absent'] = len(absent)
+    if dry_run:
+        return counts
+
+    # 청크마다 커밋 (국가 전체 재적재 중에도 트랜잭션과 잠금이 짧게 유지됨)
+    for start in range(0, len(rows), batch_size):
+        bulk_upsert(CCTV, FIELDS, rows[start:start + batch_size], UNIQUE_FIELDS, batch_size=batch_size)
+
+    if prune:
+        for start in range(0, len(absent), batch_size):
+            with transaction.atomic():
+                deleted, _ = CCTV.objects.filter(
+                    variant=variant, cctv_id__in=absent[start:start + batch_size],
+                ).delete()
+            counts['deleted'] += deleted
+    return counts
@@ -0,0 +1,77 @@
+"""
+클러스터 피라미드 벤치마크
+
+줌 레벨별로 화면 크기 bbox를 무작위로 골라 클러스터 조회 지연시간과 응답 크기를 측정하고,
+같은 bbox를 개별 CCTV로 응답했을 때(/api/cctv/)와 비교합니다.
+"""
+import gzip
+import math
+import random
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from cctv.store import cctv_store, cluster_store
+
+# 대한민국 범위 (bbox 중심 샘플링 범위)
+KOREA_BOUNDS = (126.0, 129.5, 34.5, 38.0)
+
+
+def viewport_bbox(center_x, center_y, zoom, width_px, height_px):
+    """화면 크기(px)와 줌 레벨로부터 bbox 계산 (Web Mercator)"""
+    world = 256 * (2 ** zoom)
+    deg_per_px = 360.0 / world
+    half_w = width_px / 2 * deg_per_px
+    # 위도 방향은 메르카토르 축척 보정
+    half_h = height_px / 2 * deg_per_px * math.cos(math.radians(center_y))
+    return center_x - half_w, center_x + half_w, center_y - half_h, center_y + half_h
+
+
+class Command(BaseCommand):
+    help = '줌 레벨별 클러스터 조회 지연시간/응답 크기 벤치마크'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--samples', type=int, default=200, help='줌 레벨별 측정 횟수')
+        parser.add_argument('--width', type=int, default=1280, help='화면 너비(px)')
+        parser.add_argument('--height', type=int, default=800, help='화면 높이(px)')
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        pyramid = cluster_store.get()
+        dataset = cctv_store.get()
+        if pyramid is None or dataset is None:
+            raise CommandError('CCTV 데이터/클러스터 파일이 없습니다 (CCTV_DATA_FILE, CCTV_CLUSTERS_FILE)')
+
+        rng = random.Random(options['seed'])
+        self.stdout.write(
+            f"{'zoom':>4} {'p50 ms':>8} {'p95 ms':>8} {'clusters':>9} {'KB':>8} {'gzip KB':>8} {'raw KB':>9}"
+        )
+
+        for zoom in range(pyramid.min_zoom, pyramid.max_zoom + 1):
+            latencies, sizes, gzip_sizes, raw_sizes, counts = [], [], [], [], []
+
+            for _ in range(options['samples']):
+                bbox = viewport_bbox(
+                    rng.uniform(KOREA_BOUNDS[0], KOREA_BOUNDS[1]),
+                    rng.uniform(KOREA_BOUNDS[2], KOREA_BOUNDS[3]),
+                    zoom, options['width'], options['height'],
+                )
+
+                start = time.perf_counter()
+                clusters = pyramid.query(zoom, *bbox)
+                body = pyramid.render(zoom, clusters)
+                latencies.append((time.perf_counter() - start) * 1000)
+
+                counts.append(len(clusters))
+                sizes.append(len(body))
+                gzip_sizes.append(len(gzip.compress(body)))
+                raw_sizes.append(len(dataset.render(dataset.query(*bbox))))
+
+            latencies.sort()
+            self.stdout.write(
+                f"{zoom:>4} {statistics.median(latencies):>8.3f} "
+                f"{latencies[int(len(latencies) * 0.95) - 1]:>8.3f} "
+                f"{max(counts):>9,} {max(sizes) / 1024:>8.1f} {max(gzip_sizes) / 1024:>8.1f} "
+                f"{max(raw_sizes) / 1024:>9.1f}"
+            )
@@ -0,0 +1,54 @@
+"""
+파이프라인 결과 CCTV 데이터를 DB에 적재 (바뀐 행만 upsert)
+"""
+import time
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from cctv.ingest import DATA_FILE_PATTERN, data_files, ingest_records, load_records, variant_for
+
+
+class Command(BaseCommand):
+    help = f'{DATA_FILE_PATTERN} 파일을 CCTV 테이블에 적재 (버전 + cctvId 기준, 내용 해시가 바뀐 행만 쓰기)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('paths', nargs='*', type=Path,
+                            help='적재할 파일 (기본: CCTV_DATA_FILE 폴더의 모든 결과 파일)')
+        parser.add_argument('--variant', help='버전 이름 지정 (파일 하나일 때만, 기본: 파일명에서 추출)')
+        parser.add_argument('--batch-size', type=int, help='트랜잭션 하나에 쓰는 행 수 (기본: CCTV_INGEST_BATCH_SIZE)')
+        parser.add_argument('--prune', action='store_true', help='파일에 없는 CCTV 행 삭제')
+        parser.add_argument('--dry-run', action='store_true', help='DB에 쓰지 않고 건수만 계산')
+
+    def handle(self, *args, **options):
+        paths = options['paths'] or data_files()
+        if not paths:
+            raise CommandError(f'적재할 파일이 없습니다 ({DATA_FILE_PATTERN})')
+        if options['variant'] and len(paths) != 1:
+            raise CommandError('--variant는 파일 하나를 지정할 때만 사용할 수 있습니다')
+
+        for path in paths:
+            if not path.exists():
+                raise CommandError(f'파일이 없습니다: {path}')
+            variant = options['variant'] or variant_for(path)
+
+            start = time.perf_counter()
+            records = load_records(path)
+            loaded = time.perf_counter()
+            counts = ingest_records(
+                variant, records,
+                batch_size=options['batch_size'],
+                prune=options['prune'],
+                dry_run=options['dry_run'],
+            )
+            elapsed = time.perf_counter() - start
+
+            self.stdout.write(
+                f"{path.name} ({variant}): 레코드 {len(records):,}개 → "
+                f"추가 {counts['inserted']:,}, 변경 {counts['updated']:,}, 동일 {counts['unchanged']:,}, "
+                f"건너뜀 {counts['skipped']:,}, 파일에 없음 {counts['absent']:,} (삭제 {counts['deleted']:,})"
+            )
+            self.stdout.write(
+                f"  {elapsed:.2f}초 (파일 읽기 {loaded - start:.2f}초)"
+                + (' - dry run, DB에 쓰지 않음' if options['dry_run'] else '')
+            )
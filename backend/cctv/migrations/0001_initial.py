@@ -0,0 +1,45 @@
+# Generated by Django 5.0 on 2026-10-18 07:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CCTV',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('variant', models.CharField(max_length=16)),
+                ('cctv_id', models.CharField(max_length=64)),
+                ('name', models.CharField(blank=True, max_length=200)),
+                ('url', models.TextField(blank=True)),
+                ('coord_x', models.FloatField()),
+                ('coord_y', models.FloatField()),
+                ('cctv_type', models.PositiveSmallIntegerField(null=True)),
+                ('cctv_format', models.CharField(blank=True, max_length=32)),
+                ('resolution', models.CharField(blank=True, max_length=32)),
+                ('road_section_id', models.CharField(blank=True, max_length=64)),
+                ('file_created', models.CharField(blank=True, max_length=32)),
+                ('road_type', models.CharField(blank=True, max_length=8)),
+                ('link_id', models.CharField(max_length=20, null=True)),
+                ('link_road_name', models.CharField(blank=True, max_length=200)),
+                ('link_distance', models.FloatField(null=True)),
+                ('health_status', models.CharField(blank=True, max_length=16)),
+                ('content_hash', models.CharField(max_length=32)),
+                ('updated_at', models.DateTimeField()),
+            ],
+            options={
+                'indexes': [models.Index(fields=['coord_x', 'coord_y'], name='cctv_coord_idx'), models.Index(fields=['link_id'], name='cctv_link_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='cctv',
+            constraint=models.UniqueConstraint(fields=('variant', 'cctv_id'), name='cctv_variant_cctvid_uniq'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+from django.db import models
+
+
+class CCTV(models.Model):
+    """파이프라인이 생성한 CCTV 레코드 (cctv-data*-with-links.json, 버전(variant) + cctvId 기준 한 행)
+
+    content_hash는 저장하는 열 값의 해시로, 다시 적재할 때 바뀐 행만 쓰는 데 사용합니다 (ingest 모듈 참고).
+    """
+
+    variant = models.CharField(max_length=16)  # 데이터 파일 버전 (http, https)
+    cctv_id = models.CharField(max_length=64)
+    name = models.CharField(max_length=200, blank=True)
+    url = models.TextField(blank=True)
+    coord_x = models.FloatField()
+    coord_y = models.FloatField()
+    cctv_type = models.PositiveSmallIntegerField(null=True)
+    cctv_format = models.CharField(max_length=32, blank=True)
+    resolution = models.CharField(max_length=32, blank=True)
+    road_section_id = models.CharField(max_length=64, blank=True)
+    file_created = models.CharField(max_length=32, blank=True)
+    road_type = models.CharField(max_length=8, blank=True)
+    link_id = models.CharField(max_length=20, null=True)
+    link_road_name = models.CharField(max_length=200, blank=True)
+    link_distance = models.FloatField(null=True)
+    health_status = models.CharField(max_length=16, blank=True)
+    content_hash = models.CharField(max_length=32)
+    updated_at = models.DateTimeField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['variant', 'cctv_id'], name='cctv_variant_cctvid_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['coord_x', 'coord_y'], name='cctv_coord_idx'),
+            models.Index(fields=['link_id'], name='cctv_link_idx'),
+        ]
@@ -0,0 +1,114 @@
+"""
+CCTV 이름 검색
+
+python-scripts/search_index.py가 생성한 n-gram 역색인(*.search.json)으로 후보를 좁힌 뒤
+자모형/초성형 부분 문자열 일치로 확인하고 순위를 매깁니다.
+정규화 규칙은 python-scripts/search_index.py와 같아야 합니다 (cctv/tests.py에서 확인).
+변환 후 CCTV_SEARCH_MIN_QUERY_LENGTH 글자 미만인 검색어는 거의 모든 문서와 일치하므로 검색하지 않습니다.
+"""
+import heapq
+import re
+import unicodedata
+from functools import lru_cache
+
+from django.conf import settings
+
+from .store import ReloadingFileStore
+
+HANGUL_BASE = 0xAC00
+HANGUL_END = 0xD7A3
+
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+JUNGSEONG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+JONGSEONG = ['', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ', 'ㄿ', 'ㅀ',
+             'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+
+_STRIP_PATTERN = re.compile(r'[^0-9a-z가-힣ㄱ-ㆎ]')
+
+# 문서 필드 위치: [cctvId, 이름 자모형, 도로명 자모형, 이름 초성형, 도로명 초성형]
+FORM_FIELDS = {'jamo': (1, 2), 'cho': (3, 4)}
+
+
+def normalize_text(text):
+    # 호환용 자모(ㄱ, ㅏ 등)는 NFKC에서 조합용 자모로 바뀌므로 그대로 둠
+    text = ''.join(
+        ch if 'ㄱ' <= ch <= 'ㆎ' else unicodedata.normalize('NFKC', ch)
+        for ch in text
+    )
+    return _STRIP_PATTERN.sub('', text.lower())
+
+
+def to_jamo(text):
+    result = []
+    for ch in text:
+        code = ord(ch)
+        if HANGUL_BASE <= code <= HANGUL_END:
+            offset = code - HANGUL_BASE
+            result.append(CHOSEONG[offset // 588])
+            result.append(JUNGSEONG[(offset % 588) // 28])
+            result.append(JONGSEONG[offset % 28])
+        else:
+            result.append(ch)
+    return ''.join(result)
+
+
+def parse_query(query):
+    """검색어 → (색인 형태, 변환된 검색어). 초성만으로 된 검색어는 초성형으로 검색"""
+    text = normalize_text(query)
+    if text and all(ch in CHOSEONG for ch in text):
+        return 'cho', text
+    return 'jamo', to_jamo(text)
+
+
+class SearchIndex:
+    """한 시점의 검색 인덱스 (ReloadingFileStore가 파일 변경 시 새로 생성 → 결과 캐시도 함께 초기화)"""
+
+    def __init__(self, data, version):
+        self.version = version
+        self.docs = data['docs']
+        self.postings = data['postings']
+        self.max_gram = max(data['ngramSizes'])
+        self._search_cached = lru_cache(maxsize=settings.CCTV_SEARCH_CACHE_SIZE)(self._search)
+
+    def _candidates(self, form, text):
+        """검색어의 n-gram 포스팅 목록 교집합 (짧은 목록부터)"""
+        n = min(self.max_gram, len(text))
+        grams = {text[i:i + n] for i in range(len(text) - n + 1)}
+        postings = sorted((self.postings[form].get(gram, ()) for gram in grams), key=len)
+        if not postings or not postings[0]:
+            return []
+        candidates = set(postings[0])
+        for posting in postings[1:]:
+            candidates.intersection_update(posting)
+            if not candidates:
+                break
+        return candidates
+
+    def _search(self, form, text, limit):
+        """순위: 이름 일치 > 도로명 일치, 접두 일치 우선, 앞쪽 위치 우선, 짧은 이름 우선"""
+        name_field, road_field = FORM_FIELDS[form]
+        ranked = []
+        for doc_id in self._candidates(form, text):
+            doc = self.docs[doc_id]
+            for field_rank, field in enumerate((name_field, road_field)):
+                position = doc[field].find(text)
+                if position >= 0:
+                    ranked.append((field_rank, position, len(doc[field]), doc_id))
+                    break
+        return tuple(doc_id for *_, doc_id in heapq.nsmallest(limit, ranked))
+
+    def search(self, query, limit):
+        """검색어 → 순위순 문서 번호 튜플"""
+        form, text = parse_query(query)
+        if len(text) < settings.CCTV_SEARCH_MIN_QUERY_LENGTH:
+            return ()
+        return self._search_cached(form, text, limit)
+
+    def cctv_ids(self, doc_ids):
+        return [self.docs[doc_id][0] for doc_id in doc_ids]
+
+    def cache_info(self):
+        return self._search_cached.cache_info()
+
+
+search_store = ReloadingFileStore(lambda: settings.CCTV_SEARCH_INDEX_FILE, SearchIndex)
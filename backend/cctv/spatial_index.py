@@ -0,0 +1,98 @@
+"""
+균일 격자(uniform grid) 공간 인덱스
+
+좌표를 고정 크기 셀로 나눠 저장하고, bbox와 겹치는 셀만 확인합니다.
+"""
+import math
+
+
+class GridIndex:
+    """좌표 목록에 대한 균일 격자 인덱스 (생성 후 읽기 전용)"""
+
+    def __init__(self, xs, ys, cell_size=0.05):
+        self.xs = xs
+        self.ys = ys
+        self.cell_size = cell_size
+        self.cells = {}
+
+        for i, (x, y) in enumerate(zip(xs, ys)):
+            self.cells.setdefault(self._cell(x, y), []).append(i)
+
+    def __len__(self):
+        return len(self.xs)
+
+    def _cell(self, x, y):
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def query(self, min_x, max_x, min_y, max_y):
+        """bbox 안의 좌표 인덱스 목록 (원본 순서)"""
+        if min_x > max_x or min_y > max_y:
+            return []
+
+        min_cx, min_cy = self._cell(min_x, min_y)
+        max_cx, max_cy = self._cell(max_x, max_y)
+
+        # 범위가 넓으면 빈 셀까지 훑지 않고 채워진 셀만 확인
+        if (max_cx - min_cx + 1) * (max_cy - min_cy + 1) > len(self.cells):
+            cells = (
+                (key, indices) for key, indices in self.cells.items()
+                if min_cx <= key[0] <= max_cx and min_cy <= key[1] <= max_cy
+            )
+        else:
+            cells = (
+                ((cx, cy), self.cells[(cx, cy)])
+                for cx in range(min_cx, max_cx + 1)
+                for cy in range(min_cy, max_cy + 1)
+                if (cx, cy) in self.cells
+            )
+
+        xs, ys = self.xs, self.ys
+        result = []
+        for (cx, cy), indices in cells:
+            # 경계에 걸치지 않은 셀은 좌표 비교 생략
+            if min_cx < cx < max_cx and min_cy < cy < max_cy:
+                result.extend(indices)
+            else:
+                result.extend(
+                    i for i in indices
+                    if min_x <= xs[i] <= max_x and min_y <= ys[i] <= max_y
+                )
+
+        result.sort()
+        return result
+
+    def nearest(self, x, y, max_distance):
+        """(x, y)에서 max_distance 이내 가장 가까운 좌표 인덱스 (없으면 None)"""
+        cx, cy = self._cell(x, y)
+        max_ring = math.ceil(max_distance / self.cell_size) + 1
+        xs, ys = self.xs, self.ys
+
+        best = None
+        best_distance = max_distance * max_distance
+
+        for ring in range(max_ring + 1):
+            for key in self._ring_cells(cx, cy, ring):
+                for i in self.cells.get(key, ()):
+                    distance = (xs[i] - x) ** 2 + (ys[i] - y) ** 2
+                    if distance <= best_distance:
+                        if best is None or distance < best_distance or i < best:
+                            best, best_distance = i, distance
+            # 다음 링의 좌표는 최소 ring * cell_size 이상 떨어져 있음
+            if best is not None and math.sqrt(best_distance) <= ring * self.cell_size:
+                break
+
+        return best
+
+    @staticmethod
+    def _ring_cells(cx, cy, ring):
+        """중심 셀에서 체비셰프 거리가 ring인 셀 목록"""
+        if ring == 0:
+            return [(cx, cy)]
+        cells = []
+        for dx in range(-ring, ring + 1):
+            cells.append((cx + dx, cy - ring))
+            cells.append((cx + dx, cy + ring))
+        for dy in range(-ring + 1, ring):
+            cells.append((cx - ring, cy + dy))
+            cells.append((cx + ring, cy + dy))
+        return cells
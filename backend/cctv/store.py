@@ -0,0 +1,161 @@
+"""
+CCTV 데이터 저장소
+
+파이프라인이 생성한 cctv-data-with-links.json / 클러스터 피라미드를 메모리에 올리고 공간 인덱스를 만듭니다.
+파일이 다시 생성되면(mtime 변경) 다음 요청에서 새로 로드합니다.
+새 파일을 읽거나 파싱하지 못하면 로그만 남기고 이전 데이터셋을 계속 사용합니다.
+"""
+import hashlib
+import json
+import logging
+import threading
+import time
+
+from django.conf import settings
+
+from .spatial_index import GridIndex
+
+logger = logging.getLogger(__name__)
+
+
+class CCTVDataset:
+    """한 시점의 CCTV 데이터 스냅샷 (레코드, 직렬화된 레코드, 공간 인덱스)"""
+
+    def __init__(self, data, version):
+        response = data.get('response', {})
+        self.coordtype = response.get('coordtype')
+        self.records = response.get('data') or []
+        self.version = version
+
+        # 응답 생성 시 레코드별 직렬화를 반복하지 않도록 미리 인코딩
+        self.encoded = [
+            json.dumps(record, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+            for record in self.records
+        ]
+        self.offsets = {
+            record['cctvId']: i for i, record in enumerate(self.records) if record.get('cctvId')
+        }
+        self.index = GridIndex(
+            [float(record['coordx']) for record in self.records],
+            [float(record['coordy']) for record in self.records],
+            settings.CCTV_GRID_CELL_SIZE,
+        )
+
+    def query(self, min_x, max_x, min_y, max_y):
+        return self.index.query(min_x, max_x, min_y, max_y)
+
+    def render(self, indices):
+        """선택된 레코드를 원본과 같은 응답 구조의 JSON 바이트로 변환"""
+        head = json.dumps({'coordtype': self.coordtype, 'datacount': len(indices)})[:-1]
+        return b''.join([
+            b'{"response":',
+            head.encode('utf-8'),
+            b',"data":[',
+            b','.join(self.encoded[i] for i in indices),
+            b']}}',
+        ])
+
+
+class ClusterPyramid:
+    """줌 레벨별 클러스터 (python-scripts/cluster_pyramid.py 결과) + 줌별 공간 인덱스"""
+
+    def __init__(self, data, version):
+        self.version = version
+        self.min_zoom = data['minZoom']
+        self.max_zoom = data['maxZoom']
+        self.fields = data['fields']
+        self.zooms = {}
+
+        pos = {field: i for i, field in enumerate(self.fields)}
+        for zoom, clusters in data['zooms'].items():
+            encoded = [
+                json.dumps({
+                    'x': c[pos['x']], 'y': c[pos['y']], 'count': c[pos['count']],
+                    'bounds': [c[pos['minX']], c[pos['minY']], c[pos['maxX']], c[pos['maxY']]],
+                    'ex': c[pos['ex']], 'its': c[pos['its']],
+                }, separators=(',', ':')).encode('utf-8')
+                for c in clusters
+            ]
+            index = GridIndex(
+                [c[pos['x']] for c in clusters],
+                [c[pos['y']] for c in clusters],
+                settings.CCTV_GRID_CELL_SIZE,
+            )
+            self.zooms[int(zoom)] = (encoded, index)
+
+    def clamp_zoom(self, zoom):
+        return min(max(zoom, self.min_zoom), self.max_zoom)
+
+    def query(self, zoom, min_x, max_x, min_y, max_y):
+        """bbox 안에 중심점이 있는 클러스터 인덱스 목록 (줌은 피라미드 범위로 보정)"""
+        _, index = self.zooms[self.clamp_zoom(zoom)]
+        return index.query(min_x, max_x, min_y, max_y)
+
+    def render(self, zoom, indices):
+        zoom = self.clamp_zoom(zoom)
+        encoded, _ = self.zooms[zoom]
+        return b''.join([
+            f'{{"zoom":{zoom},"count":{len(indices)},"clusters":['.encode('utf-8'),
+            b','.join(encoded[i] for i in indices),
+            b']}',
+        ])
+
+
+class ReloadingFileStore:
+    """JSON 파일 → 데이터셋 객체 (파일 변경 시 자동 재로드)
+
+    get_path: 파일 경로 반환 함수 (설정 변경을 반영하기 위해 매번 호출)
+    build: (파싱된 JSON, 버전 문자열) → 데이터셋 객체
+    """
+
+    def __init__(self, get_path, build, reload_interval=None):
+        self._get_path = get_path
+        self._build = build
+        self._reload_interval = reload_interval
+        self._dataset = None
+        self._mtime = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def path(self):
+        return self._get_path()
+
+    @property
+    def reload_interval(self):
+        if self._reload_interval is None:
+            return settings.CCTV_DATA_RELOAD_INTERVAL
+        return self._reload_interval
+
+    def get(self):
+        """현재 데이터셋 반환 (파일이 없거나 한 번도 로드하지 못했으면 None)"""
+        now = time.monotonic()
+        if self._dataset is not None and now - self._checked_at < self.reload_interval:
+            return self._dataset
+
+        with self._lock:
+            self._checked_at = now
+            try:
+                mtime = self.path.stat().st_mtime_ns
+            except FileNotFoundError:
+                # 파일이 삭제되면 이전 데이터도 내림 (삭제된 파일의 데이터를 계속 응답하지 않도록)
+                self._dataset = None
+                self._mtime = None
+                return None
+
+            if mtime != self._mtime:
+                # 실패해도 mtime을 기록해 같은 파일을 주기마다 다시 파싱하지 않음 (파일이 바뀌면 재시도)
+                self._mtime = mtime
+                try:
+                    with open(self.path, 'rb') as f:
+                        raw = f.read()
+                    version = hashlib.sha1(raw).hexdigest()[:16]
+                    self._dataset = self._build(json.loads(raw), version)
+                except (OSError, ValueError, KeyError, TypeError):
+                    logger.exception('데이터 파일 로드 실패 - 이전 데이터 유지: %s', self.path)
+
+        return self._dataset
+
+
+cctv_store = ReloadingFileStore(lambda: settings.CCTV_DATA_FILE, CCTVDataset)
+cluster_store = ReloadingFileStore(lambda: settings.CCTV_CLUSTERS_FILE, ClusterPyramid)
@@ -0,0 +1,232 @@
+"""
+CCTV 스트림(HLS) URL 갱신 서비스
+
+ITS의 CCTV URL에는 만료 시간이 있는 토큰이 붙어 있어 재생 시점에 새 URL이 필요합니다.
+- 카메라별 URL을 토큰 만료 직전까지 캐시
+- 같은 카메라의 동시 요청은 upstream 호출 1회로 합침 (single-flight)
+- 전국 URL 목록을 미리 받아두면 bbox API 호출 없이 최근접 좌표 인덱스로 조회
+"""
+import base64
+import logging
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from urllib.parse import parse_qs, urlparse
+
+from django.conf import settings
+
+from .singleflight import SingleFlight
+from .spatial_index import GridIndex
+from .upstream import fetch_cctv_info, fetch_national_cctv_info
+
+logger = logging.getLogger(__name__)
+
+ROAD_TYPES = ('its', 'ex')
+
+
+def parse_url_expiry(url):
+    """스트림 URL 토큰의 만료 시각 (epoch 초, 알 수 없으면 None)
+
+    - expires / Expires 쿼리 파라미터 (epoch 초)
+    - wmsAuthSign (base64: server_time=M/D/YYYY h:mm:ss AM&...&validminutes=N)
+    """
+    query = parse_qs(urlparse(url).query)
+
+    for name in ('expires', 'Expires'):
+        if name in query:
+            try:
+                return float(query[name][0])
+            except ValueError:
+                return None
+
+    if 'wmsAuthSign' in query:
+        try:
+            token = query['wmsAuthSign'][0]
+            decoded = base64.b64decode(token + '=' * (-len(token) % 4)).decode('utf-8')
+            fields = parse_qs(decoded)
+            server_time = datetime.strptime(fields['server_time'][0], '%m/%d/%Y %I:%M:%S %p')
+            valid_minutes = int(fields['validminutes'][0])
+        except (ValueError, KeyError, UnicodeDecodeError):
+            return None
+        return server_time.replace(tzinfo=timezone.utc).timestamp() + valid_minutes * 60
+
+    return None
+
+
+def get_expires_at(url, now):
+    """캐시 만료 시각 (토큰 만료 - 여유 시간, 토큰 정보가 없으면 기본 TTL)"""
+    expiry = parse_url_expiry(url)
+    if expiry is None:
+        return now + settings.CCTV_STREAM_URL_TTL
+    return expiry - settings.CCTV_STREAM_URL_EXPIRY_MARGIN
+
+
+def to_refresh_response(item):
+    """프론트엔드 CCTVUrlRefreshResponse 형식"""
+    return {
+        'cctvurl': item['cctvurl'],
+        'cctvname': item['cctvname'],
+        'coordx': str(item['coordx']),
+        'coordy': str(item['coordy']),
+    }
+
+
+def find_closest(items, x, y):
+    """목록에서 (x, y)와 가장 가까운 CCTV"""
+    return min(
+        items,
+        key=lambda item: (float(item['coordx']) - x) ** 2 + (float(item['coordy']) - y) ** 2,
+        default=None,
+    )
+
+
+class NationalUrlIndex:
+    """전국 CCTV URL 목록 + 도로 유형별 최근접 좌표 인덱스"""
+
+    def __init__(self, items, now):
+        self.expires_at = min((get_expires_at(item['cctvurl'], now) for item in items), default=now)
+        self.by_road_type = {}
+        for road_type in ROAD_TYPES:
+            typed = [item for item in items if item.get('roadType') == road_type]
+            index = GridIndex(
+                [float(item['coordx']) for item in typed],
+                [float(item['coordy']) for item in typed],
+                settings.CCTV_GRID_CELL_SIZE,
+            )
+            self.by_road_type[road_type] = (typed, index)
+
+    def __len__(self):
+        return sum(len(typed) for typed, _ in self.by_road_type.values())
+
+    def nearest(self, road_type, x, y, max_distance):
+        candidates = []
+        for rt in ([road_type] if road_type else ROAD_TYPES):
+            typed, index = self.by_road_type[rt]
+            i = index.nearest(x, y, max_distance)
+            if i is not None:
+                candidates.append(typed[i])
+        return find_closest(candidates, x, y)
+
+
+class StreamUrlCache:
+    """카메라별 스트림 URL 캐시 (만료 인지 + LRU + single-flight + 전국 목록 최근접 조회)
+
+    항목 수가 CCTV_STREAM_URL_CACHE_SIZE를 넘으면 가장 오래 조회되지 않은 항목부터 제거
+
+    fetch_nearby / fetch_national: upstream 호출 함수 (테스트 시 로컬 스텁으로 교체)
+    """
+
+    def __init__(self, fetch_nearby=fetch_cctv_info, fetch_national=fetch_national_cctv_info):
+        self._fetch_nearby = fetch_nearby
+        self._fetch_national = fetch_national
+        self._entries = OrderedDict()
+        self._national = {}
+        self._flight = SingleFlight()
+        self._lock = threading.Lock()
+        self._prefetcher = None
+        self._metrics = {
+            'hits': 0, 'misses': 0, 'coalesced': 0, 'evictions': 0, 'indexLookups': 0, 'liveLookups': 0,
+        }
+
+    def _count(self, name):
+        with self._lock:
+            self._metrics[name] += 1
+
+    def get(self, x, y, road_type=None, cctv_type=None):
+        """좌표에 해당하는 CCTV의 최신 스트림 URL (없으면 None)"""
+        cctv_type = cctv_type or settings.CCTV_STREAM_TYPE
+        key = (cctv_type, road_type or '', round(x, 6), round(y, 6))
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > time.time():
+                self._entries.move_to_end(key)
+                self._metrics['hits'] += 1
+                return entry
+
+        self._count('misses')
+        entry, shared = self._flight.do(key, lambda: self._resolve(key, x, y, road_type, cctv_type))
+        if shared:
+            self._count('coalesced')
+        return entry
+
+    def _resolve(self, key, x, y, road_type, cctv_type):
+        """전국 인덱스 → 없으면 bbox API 호출로 URL 조회 후 캐시 (응답, 만료 시각)"""
+        now = time.time()
+        tolerance = settings.CCTV_COORD_TOLERANCE
+
+        item = None
+        national = self._get_national(cctv_type, now)
+        if national is not None:
+            self._count('indexLookups')
+            item = national.nearest(road_type, x, y, tolerance)
+
+        if item is None:
+            self._count('liveLookups')
+            for rt in ([road_type] if road_type else ROAD_TYPES):
+                items = self._fetch_nearby(rt, cctv_type, x - tolerance, x + tolerance, y - tolerance, y + tolerance)
+                item = find_closest(items, x, y)
+                if item is not None:
+                    break
+
+        if item is None:
+            return None
+
+        entry = (to_refresh_response(item), get_expires_at(item['cctvurl'], now))
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > settings.CCTV_STREAM_URL_CACHE_SIZE:
+                self._entries.popitem(last=False)
+                self._metrics['evictions'] += 1
+        return entry
+
+    def _get_national(self, cctv_type, now):
+        national = self._national.get(cctv_type)
+        if national is not None and national.expires_at > now:
+            return national
+        return None
+
+    def prefetch_national(self, cctv_type=None):
+        """전국 URL 목록을 받아 최근접 인덱스 생성 (동시 호출은 1회로 합침)"""
+        cctv_type = cctv_type or settings.CCTV_STREAM_TYPE
+
+        def load():
+            items = [item for rt in ROAD_TYPES for item in self._fetch_national(rt, cctv_type)]
+            national = NationalUrlIndex(items, time.time())
+            self._national[cctv_type] = national
+            logger.info('전국 CCTV URL %d개 갱신 (cctvType=%s)', len(national), cctv_type)
+            return national
+
+        national, _ = self._flight.do(('national', cctv_type), load)
+        return national
+
+    def start_background_prefetch(self, cctv_types=None):
+        """전국 URL 목록이 만료되기 전에 주기적으로 다시 받는 데몬 스레드 시작"""
+        if self._prefetcher is not None:
+            return
+        cctv_types = cctv_types or [settings.CCTV_STREAM_TYPE]
+
+        def loop():
+            while True:
+                next_run = time.time() + settings.CCTV_STREAM_URL_TTL
+                for cctv_type in cctv_types:
+                    try:
+                        next_run = min(next_run, self.prefetch_national(cctv_type).expires_at)
+                    except Exception:
+                        logger.exception('전국 CCTV URL 목록 갱신 실패 (cctvType=%s)', cctv_type)
+                time.sleep(max(next_run - time.time(), settings.CCTV_STREAM_URL_MIN_PREFETCH_INTERVAL))
+
+        self._prefetcher = threading.Thread(target=loop, daemon=True, name='stream-url-prefetch')
+        self._prefetcher.start()
+
+    def metrics(self):
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics['entries'] = len(self._entries)
+        metrics['national'] = {cctv_type: len(index) for cctv_type, index in self._national.items()}
+        return metrics
+
+
+stream_url_cache = StreamUrlCache()
@@ -0,0 +1,74 @@
+"""
+CCTV 검색 테스트 (DJANGO_DB_ENGINE=sqlite python manage.py test cctv)
+
+python-scripts/search_index.py(인덱스 생성)와 cctv/search.py(검색)는 같은 정규화 코드를 따로 갖고 있으므로
+두 사본이 같은 결과를 내는지 확인합니다. 백엔드 이미지처럼 python-scripts 폴더가 없으면 건너뜁니다.
+"""
+import importlib.util
+from unittest import skipUnless
+
+from django.conf import settings
+from django.test import SimpleTestCase
+
+from . import search
+
+SEARCH_INDEX_SCRIPT = settings.BASE_DIR.parent / 'python-scripts' / 'search_index.py'
+
+SAMPLES = [
+    '강남역 사거리', '서울외곽순환(판교)', 'ㄱㄴㅇ', 'ㄳ ㅘ', 'Ｓｅｏｕｌ　１２３', 'ＡＢＣ-ⅰ', '①번 교차로',
+    '뷁', '햏', 'é', '가', '', '   ', '경부고속도로 [하행] 123.4km',
+]
+
+
+def load_script_module():
+    spec = importlib.util.spec_from_file_location('search_index_script', SEARCH_INDEX_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+@skipUnless(SEARCH_INDEX_SCRIPT.exists(), 'python-scripts/search_index.py 없음')
+class SharedNormalizationTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.script = load_script_module()
+
+    def test_tables_match(self):
+        for name in ('HANGUL_BASE', 'HANGUL_END', 'CHOSEONG', 'JUNGSEONG', 'JONGSEONG'):
+            self.assertEqual(getattr(search, name), getattr(self.script, name), name)
+        self.assertEqual(search._STRIP_PATTERN.pattern, self.script._STRIP_PATTERN.pattern)
+
+    def test_functions_match(self):
+        all_syllables = ''.join(chr(code) for code in range(search.HANGUL_BASE, search.HANGUL_END + 1))
+        for text in [*SAMPLES, all_syllables]:
+            with self.subTest(text=text[:20]):
+                self.assertEqual(search.normalize_text(text), self.script.normalize_text(text))
+                self.assertEqual(search.to_jamo(text), self.script.to_jamo(text))
+
+    def test_search_built_index(self):
+        data = {'response': {'data': [
+            {'cctvId': 'A', 'cctvname': '강남역 사거리', 'linkRoadName': '테헤란로'},
+            {'cctvId': 'B', 'cctvname': '[경부선] 서초IC', 'linkRoadName': '경부고속도로'},
+            {'cctvId': 'C', 'cctvname': '양재IC', 'linkRoadName': None},
+        ]}}
+        index = search.SearchIndex(self.script.build_search_index(data), version=1)
+
+        def ids(query):
+            return index.cctv_ids(index.search(query, 10))
+
+        self.assertEqual(ids('강남'), ['A'])
+        self.assertEqual(ids('가'), ['A'])
+        self.assertEqual(ids('ㄱㄴ'), ['A'])
+        self.assertEqual(ids('경부'), ['B'])
+        self.assertEqual(ids('ic'), ['C', 'B'])
+        self.assertEqual(ids('테헤란'), ['A'])
+
+
+class MinQueryLengthTests(SimpleTestCase):
+    def test_short_queries_are_not_searched(self):
+        data = {'docs': [['A', 'ㄱㅏㅇ', '', 'ㄱ', '']], 'postings': {'jamo': {}, 'cho': {}}, 'ngramSizes': [2]}
+        index = search.SearchIndex(data, version=1)
+        for query in ('', ' ', 'ㄱ', 'a', '1', '(ㄱ)'):
+            with self.subTest(query=query):
+                self.assertEqual(index.search(query, 10), ())
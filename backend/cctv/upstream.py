@@ -0,0 +1,42 @@
+"""
+ITS CCTV 정보 API 호출
+"""
+import json
+from urllib.parse import urlencode
+from urllib.request import urlopen
+
+from django.conf import settings
+
+
+def get_response_items(data):
+    """cctvInfo 응답의 data를 리스트로 정규화 (결과가 1개면 객체, 0개면 누락될 수 있음)"""
+    items = (data.get('response') or {}).get('data') or []
+    return items if isinstance(items, list) else [items]
+
+
+def fetch_cctv_info(road_type, cctv_type, min_x, max_x, min_y, max_y, timeout=None):
+    """특정 영역의 CCTV 목록 조회 (road_type: ex=고속도로, its=국도)"""
+    params = urlencode({
+        'apiKey': settings.ITS_API_KEY,
+        'type': road_type,
+        'cctvType': cctv_type,
+        'minX': min_x,
+        'maxX': max_x,
+        'minY': min_y,
+        'maxY': max_y,
+        'getType': 'json',
+    })
+    url = f"{settings.ITS_API_BASE_URL}/cctvInfo?{params}"
+
+    with urlopen(url, timeout=timeout or settings.ITS_API_TIMEOUT) as response:
+        data = json.loads(response.read())
+
+    items = get_response_items(data)
+    for item in items:
+        item['roadType'] = road_type
+    return items
+
+
+def fetch_national_cctv_info(road_type, cctv_type):
+    """전국 CCTV 목록 조회"""
+    return fetch_cctv_info(road_type, cctv_type, *settings.TRAFFIC_SNAPSHOT_BOUNDS)
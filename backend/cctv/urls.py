@@ -0,0 +1,11 @@
+from django.urls import path
+
+from . import views
+
+urlpatterns = [
+    path('', views.cctv_list),
+    path('clusters/', views.cctv_clusters),
+    path('search/', views.cctv_search),
+    path('stream-url/', views.cctv_stream_url),
+    path('stream-url/metrics/', views.cctv_stream_url_metrics),
+]
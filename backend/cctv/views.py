@@ -0,0 +1,142 @@
+import hashlib
+import time
+
+from django.conf import settings
+from django.http import HttpResponse, JsonResponse
+from django.views.decorators.gzip import gzip_page
+from django.views.decorators.http import condition, require_GET
+
+from .search import search_store
+from .store import cctv_store, cluster_store
+from .stream_urls import stream_url_cache
+
+BBOX_PARAMS = ('minX', 'maxX', 'minY', 'maxY')
+
+
+def parse_bbox(request):
+    """minX/maxX/minY/maxY 쿼리 파라미터 파싱 (오류 시 ValueError)"""
+    missing = [name for name in BBOX_PARAMS if name not in request.GET]
+    if missing:
+        raise ValueError(f"Missing required parameters: {', '.join(missing)}")
+    try:
+        return tuple(float(request.GET[name]) for name in BBOX_PARAMS)
+    except ValueError:
+        raise ValueError('Invalid coordinate parameters')
+
+
+def parse_zoom(request):
+    """zoom 쿼리 파라미터 파싱 (오류 시 ValueError)"""
+    if 'zoom' not in request.GET:
+        raise ValueError('Missing required parameters: zoom')
+    try:
+        return int(request.GET['zoom'])
+    except ValueError:
+        raise ValueError('Invalid zoom parameter')
+
+
+def make_etag(store):
+    """데이터 버전 + 쿼리 문자열 기반 ETag 함수"""
+    def etag_func(request):
+        dataset = store.get()
+        if dataset is None:
+            return None
+        key = f"{dataset.version}:{request.GET.urlencode()}"
+        return hashlib.md5(key.encode('utf-8')).hexdigest()
+    return etag_func
+
+
+@require_GET
+@gzip_page
+@condition(etag_func=make_etag(cctv_store))
+def cctv_list(request):
+    """bbox 안의 CCTV 목록 (응답 구조는 cctv-data-with-links.json과 동일)"""
+    try:
+        min_x, max_x, min_y, max_y = parse_bbox(request)
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+    dataset = cctv_store.get()
+    if dataset is None:
+        return JsonResponse({'error': 'CCTV data not loaded'}, status=503)
+
+    indices = dataset.query(min_x, max_x, min_y, max_y)
+    return HttpResponse(dataset.render(indices), content_type='application/json')
+
+
+@require_GET
+@gzip_page
+@condition(etag_func=make_etag(cluster_store))
+def cctv_clusters(request):
+    """bbox + 줌 레벨의 CCTV 클러스터 목록 (줌은 피라미드 범위로 보정)"""
+    try:
+        min_x, max_x, min_y, max_y = parse_bbox(request)
+        zoom = parse_zoom(request)
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+    pyramid = cluster_store.get()
+    if pyramid is None:
+        return JsonResponse({'error': 'CCTV cluster data not loaded'}, status=503)
+
+    clusters = pyramid.query(zoom, min_x, max_x, min_y, max_y)
+    return HttpResponse(pyramid.render(zoom, clusters), content_type='application/json')
+
+
+@require_GET
+@gzip_page
+def cctv_search(request):
+    """CCTV 이름/도로명 검색 (초성, 입력 중인 음절 포함) 상위 limit개"""
+    query = request.GET.get('q', '')
+    try:
+        limit = int(request.GET.get('limit', settings.CCTV_SEARCH_DEFAULT_LIMIT))
+    except ValueError:
+        return JsonResponse({'error': 'Invalid limit parameter'}, status=400)
+    limit = min(max(limit, 1), settings.CCTV_SEARCH_MAX_LIMIT)
+
+    index = search_store.get()
+    dataset = cctv_store.get()
+    if index is None or dataset is None:
+        return JsonResponse({'error': 'CCTV search index not loaded'}, status=503)
+
+    # 검색 인덱스와 데이터 파일은 cctvId로 연결 (두 파일의 갱신 시점이 달라도 안전)
+    offsets = [
+        dataset.offsets[cctv_id]
+        for cctv_id in index.cctv_ids(index.search(query, limit))
+        if cctv_id in dataset.offsets
+    ]
+    return HttpResponse(dataset.render(offsets), content_type='application/json')
+
+
+@require_GET
+def cctv_stream_url(request):
+    """좌표(x, y)에 해당하는 CCTV의 최신 스트림 URL (토큰 만료 직전까지 캐시)"""
+    try:
+        x = float(request.GET['x'])
+        y = float(request.GET['y'])
+    except KeyError:
+        return JsonResponse({'error': 'Missing required parameters: x, y'}, status=400)
+    except ValueError:
+        return JsonResponse({'error': 'Invalid coordinate parameters'}, status=400)
+
+    road_type = request.GET.get('roadType') or None
+    if road_type not in (None, 'ex', 'its'):
+        return JsonResponse({'error': 'Invalid roadType'}, status=400)
+
+    try:
+        entry = stream_url_cache.get(x, y, road_type, request.GET.get('cctvType'))
+    except Exception:
+        return JsonResponse({'error': 'Failed to fetch CCTV info'}, status=502)
+
+    if entry is None:
+        return JsonResponse({'error': 'CCTV not found'}, status=404)
+
+    body, expires_at = entry
+    response = JsonResponse(body)
+    response['Cache-Control'] = f"private, max-age={max(int(expires_at - time.time()), 0)}"
+    return response
+
+
+@require_GET
+def cctv_stream_url_metrics(request):
+    """스트림 URL 캐시 hit/miss 및 전국 인덱스 지표"""
+    return JsonResponse(stream_url_cache.metrics())
@@ -0,0 +1,3 @@
+"""
+앱 공통 유틸리티 (Django 앱이 아닌 일반 패키지)
+"""
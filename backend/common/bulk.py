@@ -0,0 +1,84 @@
+"""
+대량 upsert (traffic_history, cctv 적재에서 공용)
+
+PostgreSQL: 임시 테이블에 COPY(CSV)로 적재한 뒤 INSERT ... ON CONFLICT DO UPDATE 한 번으로 반영
+그 밖의 DB: bulk_create(update_conflicts=True)로 대체
+"""
+import csv
+import io
+
+from django.conf import settings
+from django.db import connection, transaction
+
+# COPY CSV의 NULL 표기 (기본값인 빈 문자열은 빈 문자열 값과 구분되지 않음)
+CSV_NULL = '\\N'
+
+
+def _csv_value(value):
+    if value is None:
+        return CSV_NULL
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return '\\x' + bytes(value).hex()
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return value
+
+
+def _copy_upsert(model, fields, rows, unique_fields):
+    """rows: fields 순서의 튜플 목록"""
+    meta = model._meta
+    table = connection.ops.quote_name(meta.db_table)
+    columns = [meta.get_field(name).column for name in fields]
+    column_list = ', '.join(connection.ops.quote_name(c) for c in columns)
+    conflict = ', '.join(connection.ops.quote_name(meta.get_field(name).column) for name in unique_fields)
+    updates = ', '.join(
+        f"{connection.ops.quote_name(c)} = EXCLUDED.{connection.ops.quote_name(c)}"
+        for name, c in zip(fields, columns) if name not in unique_fields
+    )
+    stage = f"{meta.db_table}_stage"
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for row in rows:
+        writer.writerow([_csv_value(v) for v in row])
+    buffer.seek(0)
+
+    with connection.cursor() as cursor:
+        # 제약 조건 없이 필요한 열만 가진 세션 임시 테이블 (커밋 시 비워짐)
+        cursor.execute(
+            f'CREATE TEMP TABLE IF NOT EXISTS "{stage}" ON COMMIT DELETE ROWS '
+            f'AS SELECT {column_list} FROM {table} WITH NO DATA'
+        )
+        cursor.copy_expert(
+            f'COPY "{stage}" ({column_list}) FROM STDIN WITH (FORMAT csv, NULL \'{CSV_NULL}\')',
+            buffer,
+        )
+        cursor.execute(
+            f'INSERT INTO {table} ({column_list}) SELECT {column_list} FROM "{stage}" '
+            f'ON CONFLICT ({conflict}) DO UPDATE SET {updates}'
+        )
+        cursor.execute(f'TRUNCATE "{stage}"')
+
+
+def bulk_upsert(model, fields, rows, unique_fields, batch_size=None):
+    """(unique_fields) 기준 upsert, 처리한 행 수 반환
+
+    rows: fields 순서의 튜플 목록 (한 트랜잭션 안에서 batch_size씩 전송)
+    """
+    batch_size = batch_size or settings.BULK_UPSERT_BATCH_SIZE
+    rows = list(rows)
+    update_fields = [name for name in fields if name not in unique_fields]
+
+    with transaction.atomic():
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            if connection.vendor == 'postgresql':
+                _copy_upsert(model, fields, batch, unique_fields)
+            else:
+                model.objects.bulk_create(
+                    [model(**dict(zip(fields, row))) for row in batch],
+                    update_conflicts=True,
+                    unique_fields=unique_fields,
+                    update_fields=update_fields,
+                )
+    return len(rows)
@@ -5,4 +5,6 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
+# 요청을 받는 프로세스만 시작 시 CCTV 데이터/인덱스를 미리 읽음 (관리 명령은 settings 기본값 False)
+os.environ.setdefault('CCTV_INDEX_PRELOAD', 'True')
 application = get_asgi_application()
@@ -21,6 +21,11 @@ INSTALLED_APPS = [
     'django.contrib.staticfiles',
     'rest_framework',
     'corsheaders',
+    'cctv',
+    'traffic',
+    'proxy',
+    'traffic_history',
+    'view_stats',
 ]
 
 MIDDLEWARE = [
@@ -65,6 +70,13 @@ DATABASES = {
     }
 }
 
+# 로컬 개발/테스트용 SQLite (PostgreSQL 없이 실행, 파티셔닝과 COPY는 일반 테이블과 bulk_create로 대체)
+if os.environ.get('DJANGO_DB_ENGINE') == 'sqlite':
+    DATABASES['default'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.environ.get('SQLITE_PATH', BASE_DIR / 'db.sqlite3'),
+    }
+
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
     {'NAME': 'django.contrib.auth.password_validation.MinimumLengthValidator'},
@@ -95,3 +107,87 @@ REST_FRAMEWORK = {
         'rest_framework.permissions.AllowAny',
     ],
 }
+
+# CCTV 데이터 설정 (python-scripts 파이프라인 결과 파일)
+CCTV_DATA_FILE = Path(os.environ.get(
+    'CCTV_DATA_FILE',
+    BASE_DIR.parent / 'frontend' / 'src' / 'datas' / 'cctv' / 'cctv-data-with-links.json',
+))
+CCTV_CLUSTERS_FILE = Path(os.environ.get(
+    'CCTV_CLUSTERS_FILE',
+    CCTV_DATA_FILE.with_name(f'{CCTV_DATA_FILE.stem}.clusters.json'),
+))
+CCTV_SEARCH_INDEX_FILE = Path(os.environ.get(
+    'CCTV_SEARCH_INDEX_FILE',
+    CCTV_DATA_FILE.with_name(f'{CCTV_DATA_FILE.stem}.search.json'),
+))
+CCTV_SEARCH_DEFAULT_LIMIT = 10
+CCTV_SEARCH_MAX_LIMIT = 50
+CCTV_SEARCH_MIN_QUERY_LENGTH = 2  # 자모/초성 변환 후 최소 글자 수 ('ㄱ'은 검색 안 함, '가'='ㄱㅏ'는 검색)
+CCTV_SEARCH_CACHE_SIZE = 1024  # 최근 검색어(입력 중 접두어) 결과 캐시 개수
+CCTV_GRID_CELL_SIZE = 0.05  # 공간 인덱스 격자 크기 (도)
+CCTV_DATA_RELOAD_INTERVAL = 2  # 데이터 파일 변경 확인 간격 (초)
+# 앱 로드 시 데이터/인덱스 미리 읽기 - 서버 진입점(config/asgi.py, config/wsgi.py)에서만 기본값을 True로 설정
+# (migrate, ingest_cctv_data 등 관리 명령은 데이터 파일이 깨져 있어도 실행되도록)
+CCTV_INDEX_PRELOAD = os.environ.get('CCTV_INDEX_PRELOAD', 'False') == 'True'
+CCTV_INGEST_BATCH_SIZE = 5000  # DB 적재(ingest_cctv_data) 시 트랜잭션 하나에 쓰는 행 수
+
+# ITS 오픈 API 설정 (API 키는 서버에만 보관)
+ITS_API_BASE_URL = os.environ.get('ITS_API_BASE_URL', 'https://openapi.its.go.kr:9443')
+ITS_API_KEY = os.environ.get('OPENAPI_ITS_KEY') or os.environ.get('REACT_APP_OPENAPI_ITS_KEY', '')
+ITS_API_TIMEOUT = 30  # 초
+
+# ITS 비동기 프록시 설정 (api/proxy/, 업스트림별 동시 요청 수 제한과 전체 타임아웃(초))
+ITS_PROXY_UPSTREAMS = {
+    'cctvInfo': {'max_concurrency': 8, 'timeout': 10},
+    'trafficInfo': {'max_concurrency': 4, 'timeout': 20},
+}
+ITS_PROXY_CONNECT_TIMEOUT = 3  # 초
+ITS_PROXY_MAX_CONNECTIONS = 20  # 이벤트 루프(워커)당 공유 연결 풀 크기
+ITS_PROXY_MAX_KEEPALIVE = 10
+ITS_PROXY_QUEUE_TIMEOUT = 2  # 동시 요청 수 제한에 걸렸을 때 대기할 최대 시간 (초, 넘으면 503)
+ITS_PROXY_MAX_RETRIES = 1  # 5xx/연결 오류 재시도 횟수
+ITS_PROXY_RETRY_BACKOFF = 0.2  # 재시도 대기 기준 시간 (초, 지터 적용)
+ITS_PROXY_BREAKER_FAILURES = 5  # 연속 실패 이 횟수에서 서킷 차단
+ITS_PROXY_BREAKER_RESET_TIMEOUT = 30  # 차단 유지 시간 (초)
+ITS_PROXY_LATENCY_BUCKETS_MS = (50, 100, 250, 500, 1000, 2500, 5000, 10000, 20000)
+
+# 전국 교통정보 스냅샷 캐시 설정
+TRAFFIC_SNAPSHOT_BOUNDS = (124.0, 132.0, 33.0, 43.0)  # minX, maxX, minY, maxY
+TRAFFIC_SNAPSHOT_TTL = 60  # 초 (프론트엔드 TRAFFIC_REFRESH_INTERVAL_MS와 동일)
+TRAFFIC_SNAPSHOT_STALE_TTL = 300  # TTL 이후 기존 스냅샷을 응답하며 갱신하는 시간 (초)
+LINK_ID_MIN_PREFIX_LENGTH = 4  # linkId prefix 매칭 최소 길이 (프론트엔드와 동일)
+TRAFFIC_RESOLVE_MAX_LINKS = 1000  # 일괄 매칭 요청당 최대 linkId 수
+TRAFFIC_SNAPSHOT_AUTOSTART = os.environ.get('TRAFFIC_SNAPSHOT_AUTOSTART', 'False') == 'True'
+
+# 구간 정체 알림 설정
+TRAFFIC_SPEED_THRESHOLDS = (80, 60, 40)  # 원활/보통/서행 기준 속도 (km/h, 프론트엔드 SPEED_THRESHOLDS와 동일)
+TRAFFIC_ALERT_HYSTERESIS = 5  # 혼잡도가 좋아지는 방향으로 바뀌려면 기준보다 이만큼 더 빨라야 함 (km/h)
+TRAFFIC_ALERT_USER_COOLDOWN = 900  # 사용자별 알림 최소 간격 (초)
+
+# CCTV 조회 이벤트 버퍼 설정 (요청 중에는 메모리 카운터만 증가, DB 저장은 백그라운드 스레드)
+VIEW_EVENTS_FLUSH_INTERVAL = 5  # 저장 주기 (초)
+VIEW_EVENTS_FLUSH_SIZE = 5000  # 대기 중인 (cctvId, 시간) 키가 이 수를 넘으면 즉시 저장
+VIEW_EVENTS_MAX_BATCH = 100  # 요청당 최대 이벤트 수
+VIEW_EVENTS_TRENDING_WINDOW = 900  # "지금 많이 보는 CCTV" 집계 기간 (초)
+VIEW_EVENTS_TRENDING_DEFAULT_LIMIT = 10
+VIEW_EVENTS_TRENDING_MAX_LIMIT = 50
+
+# 대량 upsert 설정 (common.bulk, 교통 속도 이력과 CCTV 적재에서 공용)
+BULK_UPSERT_BATCH_SIZE = 20000  # COPY/bulk_create 한 번에 보낼 행 수
+
+# 교통 속도 이력 저장 설정 (collect_traffic_history 명령으로 수집)
+TRAFFIC_HISTORY_SLOT_SECONDS = 60  # 시간 블록 안의 슬롯 간격 (초, 3600의 약수)
+TRAFFIC_HISTORY_FLUSH_INTERVAL = 600  # 진행 중인 시간 블록을 DB에 중간 저장하는 주기 (초)
+TRAFFIC_HISTORY_RAW_RETENTION_DAYS = 90  # 원본 시간 블록 보관 기간 (일별 집계는 계속 보관)
+TRAFFIC_HISTORY_PARTITIONS_AHEAD = 1  # 미리 만들어 둘 다음 달 파티션 수 (PostgreSQL)
+TRAFFIC_HISTORY_MAX_DAYS = 366  # 속도 프로필 조회 최대 기간 (일)
+
+# CCTV 스트림 URL 갱신 설정
+CCTV_STREAM_TYPE = os.environ.get('CCTV_STREAM_TYPE', '1')  # 1=HLS(HTTP), 4=HLS(HTTPS)
+CCTV_COORD_TOLERANCE = 0.005  # 좌표 매칭 오차 범위 (도, 프론트엔드 CCTV_COORD_TOLERANCE와 동일)
+CCTV_STREAM_URL_TTL = 300  # 토큰 만료 정보가 없는 URL의 캐시 시간 (초)
+CCTV_STREAM_URL_EXPIRY_MARGIN = 60  # 토큰 만료 이 시간(초) 전에 캐시 만료
+CCTV_STREAM_URL_CACHE_SIZE = 50000  # 카메라별 URL 캐시 최대 항목 수 (넘으면 LRU로 제거)
+CCTV_STREAM_URL_PREFETCH = os.environ.get('CCTV_STREAM_URL_PREFETCH', 'False') == 'True'
+CCTV_STREAM_URL_MIN_PREFETCH_INTERVAL = 60  # 초
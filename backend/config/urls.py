@@ -2,7 +2,7 @@
 URL configuration for config project.
 """
 from django.contrib import admin
-from django.urls import path
+from django.urls import include, path
 from django.http import JsonResponse
 from django.db import connection
 
@@ -26,4 +26,9 @@ urlpatterns = [
     path('admin/', admin.site.urls),
     path('api/health/', health_check),
     path('api/db-check/', db_check),
+    path('api/cctv/views/', include('view_stats.urls')),
+    path('api/cctv/', include('cctv.urls')),
+    path('api/traffic/history/', include('traffic_history.urls')),
+    path('api/traffic/', include('traffic.urls')),
+    path('api/proxy/', include('proxy.urls')),
 ]
@@ -0,0 +1,205 @@
+"""
+ITS 오픈 API 비동기 프록시 클라이언트
+
+이벤트 루프마다 httpx.AsyncClient 하나를 공유하여 연결을 재사용(keep-alive)하고,
+업스트림(cctvInfo, trafficInfo)별로 동시 요청 수 제한, 타임아웃, 서킷 브레이커, 지연 시간 히스토그램을 둡니다.
+API 키는 서버에서만 붙입니다.
+"""
+import asyncio
+import random
+import time
+import weakref
+
+import httpx
+from django.conf import settings
+
+from .resilience import CircuitBreaker, LatencyHistogram
+
+
+class UpstreamError(Exception):
+    """프록시 응답으로 바로 변환할 수 있는 업스트림 오류 (status: 응답 상태 코드)"""
+
+    def __init__(self, message, status, retry_after=None):
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+class Upstream:
+    """업스트림 하나의 설정과 상태 (브레이커, 히스토그램, 카운터는 이벤트 루프와 무관하게 공유)"""
+
+    def __init__(self, name, max_concurrency, timeout):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.breaker = CircuitBreaker(
+            settings.ITS_PROXY_BREAKER_FAILURES,
+            settings.ITS_PROXY_BREAKER_RESET_TIMEOUT,
+        )
+        self.latency = LatencyHistogram(settings.ITS_PROXY_LATENCY_BUCKETS_MS)
+        self.in_flight = 0
+        self.counters = {
+            'requests': 0,
+            'success': 0,
+            'clientErrors': 0,
+            'upstreamErrors': 0,
+            'timeouts': 0,
+            'retries': 0,
+            'rejectedBusy': 0,
+            'rejectedOpen': 0,
+        }
+
+    def metrics(self):
+        return {
+            'maxConcurrency': self.max_concurrency,
+            'timeout': self.timeout,
+            'inFlight': self.in_flight,
+            **self.counters,
+            'breaker': self.breaker.snapshot(),
+            'latency': self.latency.snapshot(),
+        }
+
+
+class _LoopState:
+    """이벤트 루프에 묶이는 객체 (AsyncClient 연결 풀, 업스트림별 세마포어)"""
+
+    def __init__(self, upstreams):
+        self.client = httpx.AsyncClient(
+            base_url=settings.ITS_API_BASE_URL,
+            limits=httpx.Limits(
+                max_connections=settings.ITS_PROXY_MAX_CONNECTIONS,
+                max_keepalive_connections=settings.ITS_PROXY_MAX_KEEPALIVE,
+            ),
+            headers={'Accept': 'application/json'},
+        )
+        self.semaphores = {
+            name: asyncio.Semaphore(upstream.max_concurrency)
+            for name, upstream in upstreams.items()
+        }
+
+
+class UpstreamPool:
+    """업스트림 호출 진입점
+
+    ASGI(uvicorn) 워커는 이벤트 루프가 하나라 연결 풀이 프로세스 전체에서 재사용됩니다.
+    WSGI로 실행하면 요청마다 루프가 새로 생기므로 풀링 효과가 없고,
+    호출 측이 close_client=True로 요청이 끝날 때 그 루프의 클라이언트를 닫아야 합니다.
+    """
+
+    def __init__(self, upstreams):
+        self.upstreams = {
+            name: Upstream(name, config['max_concurrency'], config['timeout'])
+            for name, config in upstreams.items()
+        }
+        self._states = weakref.WeakKeyDictionary()
+        self.clients_created = 0
+
+    def _state(self):
+        loop = asyncio.get_running_loop()
+        state = self._states.get(loop)
+        if state is None or state.client.is_closed:
+            state = self._states[loop] = _LoopState(self.upstreams)
+            self.clients_created += 1
+        return state
+
+    async def get_json(self, name, params, close_client=False):
+        """업스트림 GET → JSON (실패 시 UpstreamError)
+
+        close_client: 호출 후 현재 이벤트 루프의 클라이언트 종료 (요청마다 루프가 새로 생기는 WSGI용)
+
+        1. 동시 요청 수 제한: 자리가 나기를 ITS_PROXY_QUEUE_TIMEOUT초까지 기다리고 넘으면 503
+        2. 서킷 브레이커가 열려 있으면 업스트림을 호출하지 않고 503 (Retry-After)
+        3. 5xx/연결 오류는 지터를 둔 백오프 후 ITS_PROXY_MAX_RETRIES회까지 재시도
+        """
+        try:
+            return await self._get_json(name, params)
+        finally:
+            if close_client:
+                await self.aclose()
+
+    async def _get_json(self, name, params):
+        upstream = self.upstreams[name]
+        state = self._state()
+        upstream.counters['requests'] += 1
+
+        semaphore = state.semaphores[name]
+        try:
+            await asyncio.wait_for(semaphore.acquire(), settings.ITS_PROXY_QUEUE_TIMEOUT)
+        except asyncio.TimeoutError:
+            upstream.counters['rejectedBusy'] += 1
+            raise UpstreamError(f'{name} is busy', 503, retry_after=1)
+
+        upstream.in_flight += 1
+        try:
+            return await self._call(state.client, upstream, params)
+        finally:
+            upstream.in_flight -= 1
+            semaphore.release()
+
+    async def _call(self, client, upstream, params):
+        query = {**params, 'apiKey': settings.ITS_API_KEY, 'getType': 'json'}
+        timeout = httpx.Timeout(upstream.timeout, connect=settings.ITS_PROXY_CONNECT_TIMEOUT)
+
+        for attempt in range(settings.ITS_PROXY_MAX_RETRIES + 1):
+            if not upstream.breaker.allow():
+                upstream.counters['rejectedOpen'] += 1
+                raise UpstreamError(
+                    f'{upstream.name} circuit open', 503,
+                    retry_after=max(1, round(upstream.breaker.retry_after())),
+                )
+            if attempt:
+                upstream.counters['retries'] += 1
+                await asyncio.sleep(settings.ITS_PROXY_RETRY_BACKOFF * attempt * (0.5 + random.random()))
+
+            start = time.perf_counter()
+            try:
+                response = await client.get(f'/{upstream.name}', params=query, timeout=timeout)
+            except httpx.TimeoutException:
+                upstream.latency.observe((time.perf_counter() - start) * 1000)
+                upstream.counters['timeouts'] += 1
+                upstream.breaker.record_failure()
+                error = UpstreamError(f'{upstream.name} timed out', 504)
+                continue
+            except httpx.TransportError as e:
+                upstream.counters['upstreamErrors'] += 1
+                upstream.breaker.record_failure()
+                error = UpstreamError(f'{upstream.name} request failed: {e}', 502)
+                continue
+            upstream.latency.observe((time.perf_counter() - start) * 1000)
+
+            if response.status_code >= 500:
+                upstream.counters['upstreamErrors'] += 1
+                upstream.breaker.record_failure()
+                error = UpstreamError(f'{upstream.name} returned {response.status_code}', 502)
+                continue
+
+            # 4xx는 요청 문제라 업스트림 장애로 세지 않고 재시도하지 않음
+            upstream.breaker.record_success()
+            if response.status_code >= 400:
+                upstream.counters['clientErrors'] += 1
+                raise UpstreamError(f'{upstream.name} returned {response.status_code}', 502)
+            try:
+                data = response.json()
+            except ValueError:
+                upstream.counters['upstreamErrors'] += 1
+                raise UpstreamError(f'{upstream.name} returned invalid JSON', 502)
+            upstream.counters['success'] += 1
+            return data
+
+        raise error
+
+    def metrics(self):
+        return {
+            'clientsCreated': self.clients_created,
+            'clientsOpen': len(self._states),
+            'upstreams': {name: upstream.metrics() for name, upstream in self.upstreams.items()},
+        }
+
+    async def aclose(self):
+        """현재 이벤트 루프의 AsyncClient 종료"""
+        state = self._states.pop(asyncio.get_running_loop(), None)
+        if state is not None:
+            await state.client.aclose()
+
+
+upstream_pool = UpstreamPool(settings.ITS_PROXY_UPSTREAMS)
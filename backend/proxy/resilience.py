@@ -0,0 +1,127 @@
+"""
+업스트림 호출 보호 도구 (서킷 브레이커, 지연 시간 히스토그램)
+"""
+import bisect
+import threading
+import time
+
+
+class CircuitBreaker:
+    """연속 실패가 failure_threshold회에 도달하면 reset_timeout초 동안 호출 차단
+
+    차단 시간이 지나면 요청 하나만 통과시켜(half-open) 성공하면 복구, 실패하면 다시 차단합니다.
+    시험 요청이 결과 없이 끝나면(클라이언트 연결 끊김 등) reset_timeout 뒤 다른 요청에 기회를 줍니다.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold, reset_timeout):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.opened_count = 0
+        self._probe_started = None
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """호출 가능 여부 (half-open 상태에서는 시험 요청 1개만 허용)"""
+        with self._lock:
+            if self.state == self.OPEN:
+                if time.monotonic() - self.opened_at < self.reset_timeout:
+                    return False
+                self.state = self.HALF_OPEN
+                self._probe_started = None
+
+            if self.state == self.HALF_OPEN:
+                now = time.monotonic()
+                if self._probe_started is not None and now - self._probe_started < self.reset_timeout:
+                    return False
+                self._probe_started = now
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._probe_started = None
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                if self.state != self.OPEN:
+                    self.opened_count += 1
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+            self._probe_started = None
+
+    def retry_after(self):
+        """차단 해제까지 남은 시간 (초)"""
+        with self._lock:
+            if self.state != self.OPEN:
+                return 0
+            return max(0.0, self.reset_timeout - (time.monotonic() - self.opened_at))
+
+    def snapshot(self):
+        return {
+            'state': self.state,
+            'failures': self.failures,
+            'openedCount': self.opened_count,
+            'retryAfter': round(self.retry_after(), 1),
+        }
+
+
+class LatencyHistogram:
+    """고정 버킷(ms) 지연 시간 히스토그램 (백분위수는 버킷 상한으로 근사)"""
+
+    def __init__(self, buckets_ms):
+        self.buckets = sorted(buckets_ms)
+        self.counts = [0] * (len(self.buckets) + 1)  # 마지막 칸은 최대 버킷 초과
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, ms):
+        with self._lock:
+            self.counts[bisect.bisect_left(self.buckets, ms)] += 1
+            self.count += 1
+            self.sum_ms += ms
+            self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, q):
+        """q(0~1) 백분위수가 속한 버킷의 상한 (최대 버킷 초과 시 관측 최대값)"""
+        with self._lock:
+            if not self.count:
+                return None
+            rank = q * self.count
+            seen = 0
+            for i, n in enumerate(self.counts):
+                seen += n
+                if seen >= rank:
+                    return self.buckets[i] if i < len(self.buckets) else round(self.max_ms, 1)
+            return round(self.max_ms, 1)
+
+    def snapshot(self):
+        with self._lock:
+            cumulative = 0
+            buckets = []
+            for bound, n in zip(self.buckets, self.counts):
+                cumulative += n
+                buckets.append({'le': bound, 'count': cumulative})
+            buckets.append({'le': 'inf', 'count': self.count})
+            count, sum_ms, max_ms = self.count, self.sum_ms, self.max_ms
+
+        return {
+            'count': count,
+            'avgMs': round(sum_ms / count, 1) if count else None,
+            'maxMs': round(max_ms, 1),
+            'p50Ms': self.percentile(0.5),
+            'p95Ms': self.percentile(0.95),
+            'p99Ms': self.percentile(0.99),
+            'buckets': buckets,
+        }
@@ -0,0 +1,9 @@
+from django.urls import path
+
+from . import views
+
+urlpatterns = [
+    path('cctv-info/', views.cctv_info),
+    path('traffic-info/', views.traffic_info),
+    path('metrics/', views.proxy_metrics),
+]
@@ -0,0 +1,85 @@
+from django.conf import settings
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse
+from django.views.decorators.gzip import gzip_page
+from django.views.decorators.http import require_GET
+
+from cctv.views import parse_bbox
+
+from .client import UpstreamError, upstream_pool
+
+ROAD_TYPES = ('ex', 'its', 'all')
+CCTV_TYPES = ('1', '2', '3', '4', '5')
+
+
+def upstream_error_response(error):
+    response = JsonResponse({'error': str(error)}, status=error.status)
+    if error.retry_after:
+        response['Retry-After'] = str(error.retry_after)
+    return response
+
+
+async def proxy_json(request, name, params):
+    """업스트림 JSON을 그대로 응답 (netlify 함수 응답과 동일한 구조)
+
+    WSGI(runserver 등)로 받은 요청은 요청마다 이벤트 루프가 새로 생기므로 응답 후 클라이언트를 닫습니다.
+    """
+    if not settings.ITS_API_KEY:
+        return JsonResponse({'error': 'API key not configured'}, status=500)
+    try:
+        data = await upstream_pool.get_json(
+            name, params, close_client=not isinstance(request, ASGIRequest),
+        )
+    except UpstreamError as e:
+        return upstream_error_response(e)
+    return JsonResponse(data, safe=False, json_dumps_params={'ensure_ascii': False})
+
+
+@require_GET
+@gzip_page
+async def cctv_info(request):
+    """ITS cctvInfo 프록시 (netlify cctv-url 함수 대체)"""
+    try:
+        min_x, max_x, min_y, max_y = parse_bbox(request)
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+    road_type = request.GET.get('type') or 'all'
+    cctv_type = request.GET.get('cctvType') or '1'
+    if road_type not in ROAD_TYPES:
+        return JsonResponse({'error': 'Invalid type'}, status=400)
+    if cctv_type not in CCTV_TYPES:
+        return JsonResponse({'error': 'Invalid cctvType'}, status=400)
+
+    return await proxy_json(request, 'cctvInfo', {
+        'type': road_type,
+        'cctvType': cctv_type,
+        'minX': min_x,
+        'maxX': max_x,
+        'minY': min_y,
+        'maxY': max_y,
+    })
+
+
+@require_GET
+@gzip_page
+async def traffic_info(request):
+    """ITS trafficInfo 프록시 (netlify traffic-info 함수 대체)"""
+    try:
+        min_x, max_x, min_y, max_y = parse_bbox(request)
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+    return await proxy_json(request, 'trafficInfo', {
+        'type': 'all',
+        'minX': min_x,
+        'maxX': max_x,
+        'minY': min_y,
+        'maxY': max_y,
+    })
+
+
+@require_GET
+async def proxy_metrics(request):
+    """업스트림별 동시 요청 수, 브레이커 상태, 지연 시간 히스토그램"""
+    return JsonResponse(upstream_pool.metrics())
@@ -0,0 +1,282 @@
+"""
+구간 정체 알림 평가기
+
+구독(사용자 + 구독한 CCTV의 linkId)을 linkId별로 색인해 두고, 새 교통정보 스냅샷이 들어오면
+스냅샷이 갱신 시 계산해 둔 변경 링크 집합(TrafficSnapshot.changed) 중 구독된 링크만 다시 봅니다.
+속도가 바뀐 링크만 혼잡도 구간(band)을 다시 계산하고, 구간이 바뀐 링크의 구독만 평가하므로
+한 주기 비용은 전체 구독 수가 아니라 변경된 구독 링크 수에 비례합니다.
+변경 집합이 없거나 직전에 평가한 스냅샷 기준이 아니면 모든 구독 링크를 확인합니다.
+
+혼잡도 구간은 프론트엔드 SPEED_THRESHOLDS와 같은 기준(원활/보통/서행/정체)이며,
+경계 근처에서 구간이 오가며 알림이 반복되지 않도록 좋아지는 방향은 TRAFFIC_ALERT_HYSTERESIS만큼
+더 빨라져야 인정합니다. 알림은 사용자별로 묶고 TRAFFIC_ALERT_USER_COOLDOWN 동안 보내지 않되,
+그동안의 알림은 보류했다가 쿨다운이 끝났을 때 여전히 혼잡하면 보냅니다.
+"""
+import time
+
+from django.conf import settings
+
+# 혼잡도 구간 (숫자가 클수록 혼잡)
+SMOOTH, NORMAL, SLOW, CONGESTED = range(4)
+BAND_NAMES = ('원활', '보통', '서행', '정체')
+
+
+def speed_band(speed, thresholds=None):
+    """속도(km/h) → 혼잡도 구간 (프론트엔드 getTrafficStatus와 같은 기준)"""
+    smooth, normal, slow = thresholds or settings.TRAFFIC_SPEED_THRESHOLDS
+    if speed >= smooth:
+        return SMOOTH
+    if speed >= normal:
+        return NORMAL
+    if speed >= slow:
+        return SLOW
+    return CONGESTED
+
+
+def band_with_hysteresis(speed, previous, hysteresis, thresholds=None):
+    """직전 구간을 고려한 새 구간
+
+    나빠지는 방향은 기준값 그대로, 좋아지는 방향은 기준값 + hysteresis 이상이어야 이동합니다.
+    """
+    band = speed_band(speed, thresholds)
+    if previous is None or band >= previous:
+        return band
+    return min(previous, speed_band(speed - hysteresis, thresholds))
+
+
+def parse_speed(item):
+    try:
+        return float(item['speed'])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
+class Subscription:
+    """구간 알림 구독 (min_band 이상으로 혼잡해지면 알림)"""
+
+    __slots__ = ('subscription_id', 'user_id', 'link_id', 'cctv_id', 'min_band')
+
+    def __init__(self, subscription_id, user_id, link_id, cctv_id=None, min_band=CONGESTED):
+        self.subscription_id = subscription_id
+        self.user_id = user_id
+        self.link_id = link_id
+        self.cctv_id = cctv_id
+        self.min_band = min_band
+
+
+class Alert:
+    """구독 하나의 알림 (구간이 previous → band로 바뀜)"""
+
+    __slots__ = ('subscription', 'band', 'previous', 'speed', 'matched_link_id')
+
+    def __init__(self, subscription, band, previous, speed, matched_link_id):
+        self.subscription = subscription
+        self.band = band
+        self.previous = previous
+        self.speed = speed
+        self.matched_link_id = matched_link_id
+
+    def to_dict(self):
+        return {
+            'subscriptionId': self.subscription.subscription_id,
+            'cctvId': self.subscription.cctv_id,
+            'linkId': self.subscription.link_id,
+            'matchedLinkId': self.matched_link_id,
+            'speed': self.speed,
+            'status': BAND_NAMES[self.band],
+            'previousStatus': BAND_NAMES[self.previous],
+        }
+
+
+class CongestionAlertEvaluator:
+    """스냅샷마다 구독을 평가하는 알림 평가기 (한 스레드에서 evaluate 호출)
+
+    hysteresis: 좋아지는 방향 구간 이동에 필요한 추가 속도 (km/h)
+    user_cooldown: 사용자별 알림 최소 간격 (초)
+    """
+
+    def __init__(self, hysteresis=None, user_cooldown=None, thresholds=None):
+        self.hysteresis = settings.TRAFFIC_ALERT_HYSTERESIS if hysteresis is None else hysteresis
+        self.user_cooldown = settings.TRAFFIC_ALERT_USER_COOLDOWN if user_cooldown is None else user_cooldown
+        self.thresholds = tuple(thresholds or settings.TRAFFIC_SPEED_THRESHOLDS)
+        self._by_link = {}  # 구독 linkId → [Subscription]
+        self._subscriptions = {}  # subscription_id → Subscription
+        self._speeds = {}  # 구독 linkId → 직전 속도
+        self._bands = {}  # 구독 linkId → 현재 구간
+        self._matched = {}  # 구독 linkId → 스냅샷에서 매칭된 linkId (prefix 매칭 결과 재사용)
+        self._watchers = {}  # 스냅샷 linkId → {구독 linkId} (변경 집합에서 구독 링크를 찾는 역색인)
+        self._unresolved = set()  # 아직 스냅샷에서 찾지 못한 구독 linkId (새 구독 포함)
+        self._last_alert = {}  # user_id → 마지막 알림 시각
+        self._deferred = {}  # user_id → {subscription_id: Alert} (쿨다운 중 보류된 알림)
+        self._last_serial = None
+        self.last_cycle = None
+
+    def __len__(self):
+        return len(self._subscriptions)
+
+    def subscribe(self, subscription):
+        self.unsubscribe(subscription.subscription_id)
+        self._subscriptions[subscription.subscription_id] = subscription
+        subscriptions = self._by_link.setdefault(subscription.link_id, [])
+        if not subscriptions:
+            self._unresolved.add(subscription.link_id)
+        subscriptions.append(subscription)
+
+    def unsubscribe(self, subscription_id):
+        subscription = self._subscriptions.pop(subscription_id, None)
+        if subscription is None:
+            return
+        deferred = self._deferred.get(subscription.user_id)
+        if deferred:
+            deferred.pop(subscription_id, None)
+        link_id = subscription.link_id
+        subscriptions = self._by_link[link_id]
+        subscriptions.remove(subscription)
+        if not subscriptions:
+            # 구독이 없는 링크는 상태도 버려 평가 대상에서 제외
+            del self._by_link[link_id]
+            self._unwatch(link_id)
+            self._unresolved.discard(link_id)
+            self._speeds.pop(link_id, None)
+            self._bands.pop(link_id, None)
+
+    def _watch(self, link_id, matched):
+        previous = self._matched.get(link_id)
+        if previous == matched:
+            return
+        if previous is not None:
+            self._unwatch(link_id)
+        self._matched[link_id] = matched
+        self._watchers.setdefault(matched, set()).add(link_id)
+
+    def _unwatch(self, link_id):
+        matched = self._matched.pop(link_id, None)
+        if matched is None:
+            return
+        watchers = self._watchers[matched]
+        watchers.discard(link_id)
+        if not watchers:
+            del self._watchers[matched]
+
+    def _lookup(self, snapshot, link_id):
+        """구독 linkId → (스냅샷 item, 매칭된 linkId) - 정확히 일치하지 않으면 prefix 매칭"""
+        links = snapshot.links
+        matched = self._matched.get(link_id)
+        if matched is None or matched not in links:
+            if link_id in links:
+                matched = link_id
+            else:
+                _, matched, _ = snapshot.resolve(link_id)
+                if matched is None:
+                    self._unwatch(link_id)
+                    return None, None
+            self._watch(link_id, matched)
+        return links[matched], matched
+
+    def _candidates(self, snapshot):
+        """이번 스냅샷에서 확인할 구독 linkId (변경 집합이 있으면 그중 구독된 링크 + 미해결 링크)"""
+        changed = snapshot.changed
+        if changed is None or snapshot.base_serial != self._last_serial:
+            return list(self._by_link)
+
+        candidates = set(self._unresolved)
+        watchers = self._watchers
+        # 교집합은 작은 쪽을 순회 (C 수준)
+        for link_id in watchers.keys() & changed:
+            candidates.update(watchers[link_id])
+        return candidates
+
+    def evaluate(self, snapshot, now=None):
+        """스냅샷(TrafficSnapshot: links, resolve, serial, changed) 평가 → {user_id: [Alert]}
+
+        첫 스냅샷과 새로 구독한 링크의 첫 값은 기준 구간만 기록하고 알림을 보내지 않습니다.
+        쿨다운 중인 사용자의 알림은 보류하고, 쿨다운이 끝난 뒤 구독 링크가 여전히
+        알림 구간 이상이면 현재 구간/속도로 보냅니다.
+        """
+        now = now or time.time()
+        start = time.perf_counter()
+        cycle = {
+            'links': len(self._by_link),
+            'checked': 0,
+            'speedChanges': 0,
+            'bandChanges': 0,
+            'evaluated': 0,
+            'alerts': 0,
+            'users': 0,
+            'deferred': 0,
+            'released': 0,
+            'missing': 0,
+        }
+        if snapshot.serial == self._last_serial:
+            cycle['elapsedMs'] = 0.0
+            self.last_cycle = cycle
+            return {}
+
+        candidates = self._candidates(snapshot)
+        self._last_serial = snapshot.serial
+        cycle['checked'] = len(candidates)
+
+        speeds, bands = self._speeds, self._bands
+        pending = {}
+        for link_id in candidates:
+            item, matched = self._lookup(snapshot, link_id)
+            if item is None:
+                self._unresolved.add(link_id)
+                cycle['missing'] += 1
+                continue
+            self._unresolved.discard(link_id)
+
+            speed = parse_speed(item)
+            if speed is None or speeds.get(link_id) == speed:
+                continue
+            speeds[link_id] = speed
+            cycle['speedChanges'] += 1
+
+            previous = bands.get(link_id)
+            band = band_with_hysteresis(speed, previous, self.hysteresis, self.thresholds)
+            if band == previous:
+                continue
+            bands[link_id] = band
+            if previous is None:
+                continue
+            cycle['bandChanges'] += 1
+
+            for subscription in self._by_link[link_id]:
+                cycle['evaluated'] += 1
+                if band >= subscription.min_band > previous:
+                    pending.setdefault(subscription.user_id, {})[subscription.subscription_id] = (
+                        Alert(subscription, band, previous, speed, matched)
+                    )
+
+        # 쿨다운이 끝난 사용자의 보류 알림: 아직 혼잡한 구독만 현재 값으로 다시 포함
+        for user_id in list(self._deferred):
+            last = self._last_alert.get(user_id)
+            if last is not None and now - last < self.user_cooldown:
+                continue
+            user_pending = pending.setdefault(user_id, {})
+            for subscription_id, alert in self._deferred.pop(user_id).items():
+                band = bands.get(alert.subscription.link_id)
+                if subscription_id in user_pending or band is None or band < alert.subscription.min_band:
+                    continue
+                alert.band = band
+                alert.speed = speeds.get(alert.subscription.link_id, alert.speed)
+                user_pending[subscription_id] = alert
+                cycle['released'] += 1
+            if not user_pending:
+                del pending[user_id]
+
+        alerts = {}
+        for user_id, user_alerts in pending.items():
+            last = self._last_alert.get(user_id)
+            if last is not None and now - last < self.user_cooldown:
+                self._deferred.setdefault(user_id, {}).update(user_alerts)
+                cycle['deferred'] += len(user_alerts)
+                continue
+            self._last_alert[user_id] = now
+            alerts[user_id] = list(user_alerts.values())
+            cycle['alerts'] += len(user_alerts)
+        cycle['users'] = len(alerts)
+
+        cycle['elapsedMs'] = round((time.perf_counter() - start) * 1000, 3)
+        self.last_cycle = cycle
+        return alerts
@@ -0,0 +1,13 @@
+from django.apps import AppConfig
+from django.conf import settings
+
+
+class TrafficConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'traffic'
+
+    def ready(self):
+        # 주기적으로 전국 교통정보 스냅샷 갱신 (워커마다 1개 스레드)
+        if settings.TRAFFIC_SNAPSHOT_AUTOSTART:
+            from .snapshot import traffic_cache
+            traffic_cache.start_background_refresh()
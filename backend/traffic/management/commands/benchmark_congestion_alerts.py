@@ -0,0 +1,116 @@
+"""
+구간 정체 알림 평가 벤치마크
+
+전국 규모의 합성 교통정보 스냅샷을 주기마다 일부 링크만 속도를 바꿔 만들고,
+linkId 색인 + 스냅샷 변경 집합 기반 평가기와 매 주기 모든 구독을 훑는 방식의 주기당 소요 시간을 비교합니다.
+"""
+import random
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from traffic.alerts import CONGESTED, CongestionAlertEvaluator, Subscription, speed_band
+from traffic.management.commands.benchmark_link_prefix import synthetic_link_ids
+from traffic.snapshot import TrafficSnapshot
+
+
+def full_scan(subscriptions, links, last_bands, thresholds):
+    """기존 방식: 모든 구독마다 속도 조회 → 구간 계산 → 직전 구간과 비교 (알림 수 반환)"""
+    alerts = 0
+    for subscription in subscriptions:
+        item = links.get(subscription.link_id)
+        if item is None:
+            continue
+        band = speed_band(float(item['speed']), thresholds)
+        previous = last_bands.get(subscription.subscription_id)
+        last_bands[subscription.subscription_id] = band
+        if previous is not None and band >= subscription.min_band > previous:
+            alerts += 1
+    return alerts
+
+
+def percentile(values, q):
+    values = sorted(values)
+    return values[min(int(len(values) * q), len(values) - 1)]
+
+
+class Command(BaseCommand):
+    help = '구간 정체 알림: linkId 색인 + 스냅샷 변경 집합 평가기 vs 전체 구독 스캔 벤치마크'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--links', type=int, default=200000, help='전국 교통정보 링크 수')
+        parser.add_argument('--subscriptions', type=int, default=100000)
+        parser.add_argument('--cctv-links', type=int, default=20000, help='구독 대상 CCTV의 서로 다른 linkId 수')
+        parser.add_argument('--users', type=int, default=30000)
+        parser.add_argument('--cycles', type=int, default=20)
+        parser.add_argument('--change-rate', type=float, default=0.1, help='주기마다 속도가 바뀌는 링크 비율')
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        thresholds = settings.TRAFFIC_SPEED_THRESHOLDS
+
+        link_ids = synthetic_link_ids(options['links'], rng)
+        speeds = {link_id: rng.uniform(20, 110) for link_id in link_ids}
+
+        # CCTV linkId 일부(10%)는 끝자리가 달라 prefix 매칭으로 찾음
+        cctv_links = rng.sample(link_ids, min(options['cctv_links'], len(link_ids)))
+        cctv_links = [
+            link_id[:-2] + f"{rng.randint(0, 99):02d}" if rng.random() < 0.1 else link_id
+            for link_id in cctv_links
+        ]
+
+        evaluator = CongestionAlertEvaluator(user_cooldown=0)
+        subscriptions = []
+        for i in range(options['subscriptions']):
+            subscription = Subscription(
+                i, rng.randrange(options['users']), rng.choice(cctv_links),
+                min_band=CONGESTED if rng.random() < 0.7 else CONGESTED - 1,
+            )
+            subscriptions.append(subscription)
+            evaluator.subscribe(subscription)
+
+        def make_snapshot(previous=None):
+            # 변경 집합(changed) 계산은 실제로도 갱신 스레드에서 하므로 스냅샷 생성 시간에 포함
+            return TrafficSnapshot([{'linkId': k, 'speed': f"{v:.1f}"} for k, v in speeds.items()], previous)
+
+        # 기준 스냅샷 (첫 주기는 알림 없이 구간만 기록)
+        snapshot = make_snapshot()
+        evaluator.evaluate(snapshot)
+        scan_bands = {}
+        full_scan(subscriptions, snapshot.links, scan_bands, thresholds)
+
+        change_count = int(len(link_ids) * options['change_rate'])
+        indexed_ms, scan_ms, cycles = [], [], []
+        build_ms = []
+        for _ in range(options['cycles']):
+            for link_id in rng.sample(link_ids, change_count):
+                speeds[link_id] = min(max(speeds[link_id] + rng.uniform(-25, 25), 0.0), 120.0)
+            start = time.perf_counter()
+            snapshot = make_snapshot(snapshot)
+            build_ms.append((time.perf_counter() - start) * 1000)
+
+            evaluator.evaluate(snapshot)
+            indexed_ms.append(evaluator.last_cycle['elapsedMs'])
+            cycles.append(evaluator.last_cycle)
+
+            start = time.perf_counter()
+            full_scan(subscriptions, snapshot.links, scan_bands, thresholds)
+            scan_ms.append((time.perf_counter() - start) * 1000)
+
+        def mean(key):
+            return statistics.mean(cycle[key] for cycle in cycles)
+
+        self.stdout.write(f"링크 {len(link_ids):,}개, 구독 {len(evaluator):,}개 "
+                          f"(구독 링크 {cycles[0]['links']:,}개, 사용자 {options['users']:,}명), "
+                          f"주기 {options['cycles']}회, 주기당 속도 변경 {change_count:,}개 링크")
+        self.stdout.write(f"스냅샷 생성(참고): 평균 {statistics.mean(build_ms):,.0f}ms")
+        self.stdout.write(f"색인 평가기: p50 {percentile(indexed_ms, 0.5):.1f}ms, "
+                          f"p95 {percentile(indexed_ms, 0.95):.1f}ms, 최대 {max(indexed_ms):.1f}ms")
+        self.stdout.write(f"전체 구독 스캔: p50 {percentile(scan_ms, 0.5):.1f}ms, "
+                          f"p95 {percentile(scan_ms, 0.95):.1f}ms, 최대 {max(scan_ms):.1f}ms")
+        self.stdout.write(f"주기 평균: 확인한 구독 링크 {mean('checked'):,.0f}, "
+                          f"속도 변경 링크 {mean('speedChanges'):,.0f}, 구간 변경 {mean('bandChanges'):,.0f}, "
+                          f"평가 구독 {mean('evaluated'):,.0f}, 알림 {mean('alerts'):,.0f}")
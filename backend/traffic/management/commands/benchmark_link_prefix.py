@@ -0,0 +1,82 @@
+"""
+linkId prefix 매칭 마이크로벤치마크
+
+전국 규모의 합성 linkId로 기존 방식(교통정보 전체를 순회하며 공통 prefix 비교)과
+정렬 배열 prefix 인덱스의 조회 시간을 비교합니다.
+"""
+import random
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from traffic.prefix_index import LinkPrefixIndex, common_prefix_length
+
+
+def linear_resolve(link_id, link_ids, min_prefix_length):
+    """기존 프론트엔드 방식 (getTrafficInfoForCCTV의 선형 탐색)"""
+    if link_id in link_ids:
+        return link_id, len(link_id)
+    best, best_length = None, 0
+    for candidate in link_ids:
+        length = common_prefix_length(link_id, candidate)
+        if length > best_length:
+            best, best_length = candidate, length
+    if best is None or best_length < min_prefix_length:
+        return None, 0
+    return best, best_length
+
+
+def synthetic_link_ids(count, rng):
+    """표준노드링크 형식(10자리, 앞 3자리 권역 코드)의 합성 linkId"""
+    regions = [f"{rng.randint(100, 999)}" for _ in range(200)]
+    ids = set()
+    while len(ids) < count:
+        ids.add(f"{rng.choice(regions)}{rng.randint(0, 9999999):07d}")
+    return list(ids)
+
+
+class Command(BaseCommand):
+    help = 'linkId prefix 매칭: 선형 탐색 vs 정렬 배열 인덱스 벤치마크'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--links', type=int, default=500000, help='전국 linkId 수')
+        parser.add_argument('--queries', type=int, default=10000, help='인덱스 조회 횟수')
+        parser.add_argument('--linear-queries', type=int, default=50, help='선형 탐색 조회 횟수 (느림)')
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        min_length = settings.LINK_ID_MIN_PREFIX_LENGTH
+
+        link_ids = synthetic_link_ids(options['links'], rng)
+        link_set = set(link_ids)
+
+        # 절반은 존재하는 linkId, 절반은 끝자리가 다른(prefix 매칭 대상) linkId
+        queries = []
+        for _ in range(options['queries']):
+            link_id = rng.choice(link_ids)
+            if rng.random() < 0.5:
+                link_id = link_id[:-3] + f"{rng.randint(0, 999):03d}"
+            queries.append(link_id)
+
+        start = time.perf_counter()
+        index = LinkPrefixIndex(link_ids)
+        build_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        indexed = [index.resolve(q, min_length) for q in queries]
+        index_us = (time.perf_counter() - start) / len(queries) * 1e6
+
+        linear_queries = queries[:options['linear_queries']]
+        start = time.perf_counter()
+        linear = [linear_resolve(q, link_set, min_length) for q in linear_queries]
+        linear_us = (time.perf_counter() - start) / max(len(linear_queries), 1) * 1e6
+
+        # 매칭된 prefix 길이가 같아야 함 (길이가 같은 후보가 여럿이면 linkId는 다를 수 있음)
+        mismatches = sum(1 for a, b in zip(linear, indexed) if a[1] != b[1])
+
+        self.stdout.write(f"linkId {len(index):,}개, 인덱스 생성 {build_ms:,.0f}ms")
+        self.stdout.write(f"선형 탐색: {linear_us:,.1f}us/조회 ({len(linear_queries):,}회)")
+        self.stdout.write(f"prefix 인덱스: {index_us:,.2f}us/조회 ({len(queries):,}회)")
+        self.stdout.write(f"속도 향상: {linear_us / index_us:,.0f}배, prefix 길이 불일치: {mismatches}")
@@ -0,0 +1,49 @@
+"""
+linkId 최장 공통 prefix 인덱스
+
+정렬된 linkId 배열에서 조회 키의 삽입 위치 양옆만 비교하면
+전체 중 공통 prefix가 가장 긴 linkId를 찾을 수 있습니다. (O(log n · 키 길이))
+"""
+from bisect import bisect_left
+
+
+def common_prefix_length(a, b):
+    """두 문자열의 공통 prefix 길이"""
+    n = min(len(a), len(b))
+    i = 0
+    while i < n and a[i] == b[i]:
+        i += 1
+    return i
+
+
+class LinkPrefixIndex:
+    """전국 linkId에 대한 정렬 배열 기반 prefix 인덱스 (생성 후 읽기 전용)"""
+
+    def __init__(self, link_ids):
+        self.keys = sorted(set(link_ids))
+
+    def __len__(self):
+        return len(self.keys)
+
+    def resolve(self, link_id, min_prefix_length):
+        """정확히 일치하는 linkId, 없으면 공통 prefix가 가장 긴 linkId
+
+        반환: (매칭된 linkId, 공통 prefix 길이) / min_prefix_length 미만이면 (None, 0)
+        공통 prefix 길이가 같으면 정렬 순서상 앞쪽 linkId를 사용합니다.
+        """
+        keys = self.keys
+        pos = bisect_left(keys, link_id)
+
+        if pos < len(keys) and keys[pos] == link_id:
+            return link_id, len(link_id)
+
+        best, best_length = None, 0
+        for i in (pos - 1, pos):
+            if 0 <= i < len(keys):
+                length = common_prefix_length(link_id, keys[i])
+                if length > best_length:
+                    best, best_length = keys[i], length
+
+        if best is None or best_length < min_prefix_length:
+            return None, 0
+        return best, best_length
@@ -0,0 +1,212 @@
+"""
+전국 교통정보 스냅샷 캐시
+
+전국 trafficInfo를 한 번에 받아 linkId → 교통정보 맵으로 메모리에 보관합니다.
+- TTL 이내: 캐시 응답
+- TTL 초과 ~ stale 허용 시간: 기존 스냅샷 응답 + 백그라운드 갱신 (stale-while-revalidate)
+- 그 이후 / 최초: 동기 갱신 (동시 요청은 하나의 upstream 호출로 합침)
+"""
+import itertools
+import logging
+import threading
+import time
+
+from django.conf import settings
+
+from cctv.singleflight import SingleFlight
+
+from .prefix_index import LinkPrefixIndex
+from .upstream import fetch_national_traffic
+
+logger = logging.getLogger(__name__)
+
+_serials = itertools.count(1)
+
+
+class TrafficSnapshot:
+    """한 시점의 전국 교통정보 (읽기 전용)
+
+    previous를 주면 직전 스냅샷 대비 speed가 바뀌었거나 새로 생긴 linkId 집합을 changed에 담습니다
+    (base_serial == previous.serial). 갱신 스레드에서 한 번 계산해 두고 알림 평가 등이 변경분만 보게 합니다.
+    """
+
+    def __init__(self, items, previous=None):
+        self.links = {item['linkId']: item for item in items if item.get('linkId')}
+        self.prefix_index = LinkPrefixIndex(self.links)
+        self.fetched_at = time.time()
+        self._created = time.monotonic()
+        self.serial = next(_serials)
+        self.base_serial = None
+        self.changed = None
+        if previous is not None:
+            # 직전 스냅샷은 참조로 남기지 않음 (스냅샷이 줄줄이 메모리에 남지 않도록)
+            self.base_serial = previous.serial
+            previous_links = previous.links
+            self.changed = frozenset(
+                link_id for link_id, item in self.links.items()
+                if (old := previous_links.get(link_id)) is None or old.get('speed') != item.get('speed')
+            )
+
+    def resolve(self, link_id):
+        """linkId → (교통정보, 매칭된 linkId, 공통 prefix 길이)
+
+        정확히 일치하지 않으면 LINK_ID_MIN_PREFIX_LENGTH 이상 일치하는 가장 유사한 링크 사용
+        """
+        matched, length = self.prefix_index.resolve(link_id, settings.LINK_ID_MIN_PREFIX_LENGTH)
+        if matched is None:
+            return None, None, 0
+        return self.links[matched], matched, length
+
+    @property
+    def age(self):
+        return time.monotonic() - self._created
+
+    def __len__(self):
+        return len(self.links)
+
+
+class TrafficSnapshotCache:
+    """TTL + stale-while-revalidate 교통정보 스냅샷 캐시
+
+    fetch: 교통정보 item 목록을 반환하는 함수 (테스트 시 로컬 스텁으로 교체)
+    """
+
+    def __init__(self, fetch=fetch_national_traffic, ttl=None, stale_ttl=None):
+        self._fetch = fetch
+        self._ttl = ttl
+        self._stale_ttl = stale_ttl
+        self._snapshot = None
+        self._flight = SingleFlight()
+        self._lock = threading.Lock()
+        self._refresher = None
+        self._metrics = {
+            'hits': 0,
+            'staleHits': 0,
+            'misses': 0,
+            'refreshes': 0,
+            'refreshErrors': 0,
+            'coalesced': 0,
+            'linkHits': 0,
+            'linkMisses': 0,
+            'lastRefreshSeconds': None,
+        }
+
+    @property
+    def ttl(self):
+        return settings.TRAFFIC_SNAPSHOT_TTL if self._ttl is None else self._ttl
+
+    @property
+    def stale_ttl(self):
+        return settings.TRAFFIC_SNAPSHOT_STALE_TTL if self._stale_ttl is None else self._stale_ttl
+
+    def _count(self, name, amount=1):
+        with self._lock:
+            self._metrics[name] += amount
+
+    def refresh(self):
+        """스냅샷 갱신 (이미 갱신 중이면 그 결과를 기다려 반환)"""
+        snapshot, shared = self._flight.do('snapshot', self._load)
+        if shared:
+            self._count('coalesced')
+        return snapshot
+
+    def _load(self):
+        start = time.perf_counter()
+        try:
+            snapshot = TrafficSnapshot(self._fetch(), previous=self._snapshot)
+        except Exception:
+            self._count('refreshErrors')
+            raise
+
+        self._snapshot = snapshot
+        with self._lock:
+            self._metrics['refreshes'] += 1
+            self._metrics['lastRefreshSeconds'] = round(time.perf_counter() - start, 3)
+        return snapshot
+
+    def _refresh_in_background(self):
+        if self._flight.in_flight('snapshot'):
+            return
+
+        def run():
+            try:
+                self.refresh()
+            except Exception:
+                logger.exception('교통정보 스냅샷 백그라운드 갱신 실패')
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def get(self):
+        """현재 스냅샷 반환 (필요 시 갱신)"""
+        snapshot = self._snapshot
+        if snapshot is not None:
+            if snapshot.age < self.ttl:
+                self._count('hits')
+                return snapshot
+            if snapshot.age < self.ttl + self.stale_ttl:
+                self._count('staleHits')
+                self._refresh_in_background()
+                return snapshot
+
+        self._count('misses')
+        try:
+            return self.refresh()
+        except Exception:
+            # upstream 장애 시 오래된 스냅샷이라도 응답
+            if snapshot is not None:
+                logger.warning('교통정보 갱신 실패 - 기존 스냅샷 사용 (%.0f초 경과)', snapshot.age)
+                return snapshot
+            raise
+
+    def get_link(self, link_id):
+        """linkId의 교통정보 (없으면 prefix가 가장 유사한 링크, 그래도 없으면 None)"""
+        item, _, _ = self.get().resolve(link_id)
+        self._count('linkHits' if item is not None else 'linkMisses')
+        return item
+
+    def resolve_links(self, link_ids):
+        """여러 linkId를 한 번에 매칭 {linkId: (교통정보, 매칭된 linkId, 공통 prefix 길이)}"""
+        snapshot = self.get()
+        results = {link_id: snapshot.resolve(link_id) for link_id in link_ids}
+        found = sum(1 for item, _, _ in results.values() if item is not None)
+        with self._lock:
+            self._metrics['linkHits'] += found
+            self._metrics['linkMisses'] += len(results) - found
+        return results
+
+    def get_links(self, link_ids):
+        """여러 linkId의 교통정보 {linkId: item} (없는 linkId는 제외)"""
+        links = self.get().links
+        found = {link_id: links[link_id] for link_id in link_ids if link_id in links}
+        with self._lock:
+            self._metrics['linkHits'] += len(found)
+            self._metrics['linkMisses'] += len(link_ids) - len(found)
+        return found
+
+    def metrics(self):
+        with self._lock:
+            metrics = dict(self._metrics)
+        snapshot = self._snapshot
+        metrics['snapshotAge'] = round(snapshot.age, 1) if snapshot is not None else None
+        metrics['linkCount'] = len(snapshot) if snapshot is not None else 0
+        return metrics
+
+    def start_background_refresh(self, interval=None):
+        """TTL 주기로 스냅샷을 미리 갱신하는 데몬 스레드 시작 (중복 호출 무시)"""
+        if self._refresher is not None:
+            return
+        interval = interval or self.ttl
+
+        def loop():
+            while True:
+                try:
+                    self.refresh()
+                except Exception:
+                    logger.exception('교통정보 스냅샷 주기 갱신 실패')
+                time.sleep(interval)
+
+        self._refresher = threading.Thread(target=loop, daemon=True, name='traffic-snapshot-refresh')
+        self._refresher.start()
+
+
+traffic_cache = TrafficSnapshotCache()
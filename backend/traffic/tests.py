@@ -0,0 +1,276 @@
+"""
+교통정보 스냅샷 캐시 / 정체 알림 평가 테스트 (DJANGO_DB_ENGINE=sqlite python manage.py test traffic)
+
+upstream 대신 스텁 fetch를 넣고, 스냅샷 나이는 생성 시각을 당겨서 조절합니다.
+"""
+import threading
+import time
+
+from django.test import SimpleTestCase
+
+from .alerts import CONGESTED, SLOW, CongestionAlertEvaluator, Subscription
+from .snapshot import TrafficSnapshot, TrafficSnapshotCache
+
+TTL = 60
+STALE_TTL = 60
+
+# 알림 기준: 원활 80 / 보통 60 / 서행 40 km/h, 회복은 +5 km/h, 사용자 쿨다운 15분
+THRESHOLDS = (80, 60, 40)
+HYSTERESIS = 5
+COOLDOWN = 900
+NOW = 1767614400.0
+
+
+def items(**speeds):
+    return [{'linkId': link_id, 'speed': speed} for link_id, speed in speeds.items()]
+
+
+def age_snapshot(snapshot, seconds):
+    snapshot._created -= seconds
+
+
+def wait_for(predicate, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError('시간 초과')
+        time.sleep(0.005)
+
+
+class StubUpstream:
+    """호출 횟수를 세는 fetch 스텁 (gate를 주면 set될 때까지 응답을 붙잡음)"""
+
+    def __init__(self, responses, gate=None):
+        self.responses = list(responses)
+        self.gate = gate
+        self.calls = 0
+        self.error = None
+
+    def __call__(self):
+        self.calls += 1
+        if self.gate is not None:
+            self.gate.wait(2.0)
+        if self.error is not None:
+            raise self.error
+        return self.responses[min(self.calls, len(self.responses)) - 1]
+
+
+class TrafficSnapshotTests(SimpleTestCase):
+    def test_changed_links(self):
+        first = TrafficSnapshot(items(A=30, B=50))
+        self.assertIsNone(first.changed)
+        self.assertIsNone(first.base_serial)
+
+        second = TrafficSnapshot(items(A=30, B=45, C=70), previous=first)
+        self.assertEqual(second.base_serial, first.serial)
+        self.assertGreater(second.serial, first.serial)
+        self.assertEqual(second.changed, {'B', 'C'})
+
+        third = TrafficSnapshot(items(A=30, B=45), previous=second)
+        self.assertEqual(third.changed, frozenset())
+
+
+class TrafficSnapshotCacheTests(SimpleTestCase):
+    def setUp(self):
+        self.upstream = StubUpstream([items(A=30), items(A=40), items(A=50)])
+        self.cache = TrafficSnapshotCache(fetch=self.upstream, ttl=TTL, stale_ttl=STALE_TTL)
+
+    def test_fresh_snapshot_is_cached(self):
+        first = self.cache.get()
+        self.assertIs(self.cache.get(), first)
+        self.assertIs(self.cache.get(), first)
+
+        metrics = self.cache.metrics()
+        self.assertEqual((metrics['misses'], metrics['hits'], metrics['refreshes']), (1, 2, 1))
+        self.assertEqual(self.upstream.calls, 1)
+
+    def test_stale_snapshot_served_while_revalidating(self):
+        first = self.cache.get()
+        age_snapshot(first, TTL + 1)
+
+        self.assertIs(self.cache.get(), first)
+        wait_for(lambda: self.cache.metrics()['refreshes'] == 2)
+
+        second = self.cache.get()
+        self.assertIsNot(second, first)
+        self.assertEqual(second.links['A']['speed'], 40)
+        self.assertEqual(second.changed, {'A'})
+
+        metrics = self.cache.metrics()
+        self.assertEqual((metrics['misses'], metrics['staleHits'], metrics['hits']), (1, 1, 1))
+        self.assertEqual(self.upstream.calls, 2)
+
+    def test_expired_snapshot_refreshed_synchronously(self):
+        first = self.cache.get()
+        age_snapshot(first, TTL + STALE_TTL + 1)
+
+        second = self.cache.get()
+        self.assertIsNot(second, first)
+        self.assertEqual(second.base_serial, first.serial)
+
+        metrics = self.cache.metrics()
+        self.assertEqual((metrics['misses'], metrics['staleHits'], metrics['refreshes']), (2, 0, 2))
+
+    def test_expired_snapshot_used_when_upstream_fails(self):
+        first = self.cache.get()
+        age_snapshot(first, TTL + STALE_TTL + 1)
+        self.upstream.error = RuntimeError('upstream down')
+
+        with self.assertLogs('traffic.snapshot', 'WARNING'):
+            self.assertIs(self.cache.get(), first)
+        self.assertEqual(self.cache.metrics()['refreshErrors'], 1)
+
+    def test_cold_start_failure_raises(self):
+        self.upstream.error = RuntimeError('upstream down')
+        with self.assertRaises(RuntimeError):
+            self.cache.get()
+
+    def test_concurrent_cold_requests_share_one_fetch(self):
+        self.upstream.gate = threading.Event()
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(self.cache.get())) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+
+        wait_for(lambda: self.cache.metrics()['misses'] == 5)
+        # 마지막 요청이 진행 중인 갱신에 합류할 시간
+        time.sleep(0.05)
+        self.upstream.gate.set()
+        for thread in threads:
+            thread.join(2.0)
+
+        self.assertEqual(self.upstream.calls, 1)
+        self.assertEqual(len(results), 5)
+        self.assertEqual(len({id(snapshot) for snapshot in results}), 1)
+        self.assertEqual(self.cache.metrics()['coalesced'], 4)
+
+    def test_link_metrics(self):
+        self.cache.get_links(['A', 'Z'])
+        metrics = self.cache.metrics()
+        self.assertEqual((metrics['linkHits'], metrics['linkMisses']), (1, 1))
+
+
+class CongestionAlertEvaluatorTests(SimpleTestCase):
+    def setUp(self):
+        self.evaluator = CongestionAlertEvaluator(hysteresis=HYSTERESIS, user_cooldown=COOLDOWN, thresholds=THRESHOLDS)
+        self.snapshot = None
+
+    def subscribe(self, subscription_id, user_id, link_id, min_band=CONGESTED):
+        self.evaluator.subscribe(Subscription(subscription_id, user_id, link_id, min_band=min_band))
+
+    def next_snapshot(self, **speeds):
+        self.snapshot = TrafficSnapshot(items(**speeds), previous=self.snapshot)
+        return self.snapshot
+
+    def evaluate(self, now=NOW, **speeds):
+        alerts = self.evaluator.evaluate(self.next_snapshot(**speeds), now=now)
+        return {user_id: sorted(alert.subscription.subscription_id for alert in user_alerts)
+                for user_id, user_alerts in alerts.items()}
+
+    def test_first_value_is_baseline(self):
+        self.subscribe('s1', 'u1', 'A')
+        self.assertEqual(self.evaluate(A=20), {})
+        self.assertEqual(self.evaluator._bands['A'], CONGESTED)
+        self.assertEqual(self.evaluate(A=25), {})
+        self.assertEqual(self.evaluator.last_cycle['bandChanges'], 0)
+
+    def test_recovery_needs_hysteresis(self):
+        self.subscribe('s1', 'u1', 'A')
+        self.evaluate(A=45)
+        self.assertEqual(self.evaluate(A=39), {'u1': ['s1']})
+
+        # 서행 기준(40)을 넘었지만 +5 km/h 미만이면 정체 유지
+        for speed in (41, 44):
+            self.assertEqual(self.evaluate(now=NOW + COOLDOWN, A=speed), {})
+            self.assertEqual(self.evaluator._bands['A'], CONGESTED)
+        self.evaluate(now=NOW + COOLDOWN, A=45)
+        self.assertEqual(self.evaluator._bands['A'], SLOW)
+        # 나빠지는 방향은 기준값 그대로
+        self.assertEqual(self.evaluate(now=NOW + COOLDOWN, A=39), {'u1': ['s1']})
+
+    def test_user_cooldown_defers_and_releases(self):
+        self.subscribe('s1', 'u1', 'A')
+        self.subscribe('s2', 'u1', 'B')
+        self.subscribe('s3', 'u2', 'B')
+        self.evaluate(A=50, B=50, C=50)
+        self.assertEqual(self.evaluate(A=30, B=50, C=50), {'u1': ['s1']})
+
+        # u1은 쿨다운 중이라 보류, u2는 바로 알림
+        self.assertEqual(self.evaluate(now=NOW + 100, A=30, B=30, C=50), {'u2': ['s3']})
+        self.assertEqual(self.evaluator.last_cycle['deferred'], 1)
+
+        # 쿨다운 중에는 다른 링크가 바뀌어도 보류 유지
+        self.assertEqual(self.evaluate(now=NOW + COOLDOWN - 1, A=30, B=30, C=55), {})
+
+        # 쿨다운이 끝나면 여전히 정체인 구독을 현재 속도로 보냄
+        alerts = self.evaluator.evaluate(self.next_snapshot(A=30, B=25, C=60), now=NOW + COOLDOWN)
+        self.assertEqual([alert.subscription.subscription_id for alert in alerts['u1']], ['s2'])
+        self.assertEqual(alerts['u1'][0].speed, 25)
+        self.assertEqual(self.evaluator.last_cycle['released'], 1)
+        self.assertEqual(self.evaluator._deferred, {})
+
+    def test_deferred_alert_dropped_after_recovery(self):
+        self.subscribe('s1', 'u1', 'A')
+        self.subscribe('s2', 'u1', 'B')
+        self.evaluate(A=50, B=50)
+        self.evaluate(A=30, B=50)
+        self.evaluate(now=NOW + 100, A=30, B=30)
+        self.evaluate(now=NOW + 200, A=30, B=45)
+
+        self.assertEqual(self.evaluate(now=NOW + COOLDOWN, A=30, B=46), {})
+        self.assertEqual(self.evaluator.last_cycle['released'], 0)
+        self.assertEqual(self.evaluator._deferred, {})
+
+    def test_unsubscribe_cleans_link_state(self):
+        self.subscribe('s1', 'u1', 'A')
+        self.subscribe('s2', 'u2', 'A')
+        self.subscribe('s3', 'u1', 'B')
+        self.evaluate(A=50, B=50)
+        self.evaluate(A=50, B=30)
+        self.evaluate(now=NOW + 100, A=30, B=30)
+        self.assertIn('s1', self.evaluator._deferred['u1'])
+
+        self.evaluator.unsubscribe('s1')
+        self.assertNotIn('s1', self.evaluator._deferred['u1'])
+        self.assertEqual(self.evaluator._watchers['A'], {'A'})
+
+        self.evaluator.unsubscribe('s2')
+        self.evaluator.unsubscribe('s2')
+        self.assertEqual(len(self.evaluator), 1)
+        for state in (self.evaluator._by_link, self.evaluator._watchers, self.evaluator._matched,
+                      self.evaluator._speeds, self.evaluator._bands):
+            self.assertNotIn('A', state)
+
+        self.assertEqual(self.evaluate(now=NOW + COOLDOWN, A=50, B=30), {})
+        self.assertEqual(self.evaluator.last_cycle['checked'], 0)
+
+    def test_only_changed_links_are_checked(self):
+        for link_id in 'ABC':
+            self.subscribe(f's{link_id}', 'u1', link_id)
+        self.evaluate(A=50, B=50, C=50)
+        self.assertEqual(self.evaluator.last_cycle['checked'], 3)
+        self.evaluate(A=55, B=50, C=50)
+        self.assertEqual(self.evaluator.last_cycle['checked'], 1)
+
+    def test_full_scan_when_base_serial_is_stale(self):
+        for link_id in 'ABC':
+            self.subscribe(f's{link_id}', f'u{link_id}', link_id)
+        self.evaluate(A=50, B=50, C=50)
+
+        # 평가하지 않고 지나간 스냅샷의 변경(C)도 놓치지 않음
+        self.next_snapshot(A=50, B=50, C=30)
+        self.assertEqual(self.evaluate(A=50, B=30, C=30), {'uB': ['sB'], 'uC': ['sC']})
+        self.assertEqual(self.evaluator.last_cycle['checked'], 3)
+
+        # 변경 집합이 없는 스냅샷도 전체 확인
+        self.snapshot = None
+        self.assertEqual(self.evaluate(now=NOW + COOLDOWN, A=30, B=30, C=30), {'uA': ['sA']})
+        self.assertEqual(self.evaluator.last_cycle['checked'], 3)
+
+    def test_same_snapshot_is_not_evaluated_twice(self):
+        self.subscribe('s1', 'u1', 'A')
+        self.evaluate(A=50)
+        snapshot = self.next_snapshot(A=30)
+        self.assertEqual(len(self.evaluator.evaluate(snapshot, now=NOW)), 1)
+        self.assertEqual(self.evaluator.evaluate(snapshot, now=NOW + COOLDOWN), {})
+        self.assertEqual(self.evaluator.last_cycle['checked'], 0)
@@ -0,0 +1,37 @@
+"""
+ITS 교통정보 API 호출
+"""
+import json
+from urllib.parse import urlencode
+from urllib.request import urlopen
+
+from django.conf import settings
+
+
+def get_response_items(data):
+    """trafficInfo 응답의 items를 리스트로 정규화 (결과가 1개면 객체로 올 수 있음)"""
+    items = (data.get('body') or {}).get('items') or []
+    return items if isinstance(items, list) else [items]
+
+
+def fetch_traffic_info(min_x, max_x, min_y, max_y, timeout=None):
+    """특정 영역의 교통정보 목록 조회"""
+    params = urlencode({
+        'apiKey': settings.ITS_API_KEY,
+        'type': 'all',
+        'minX': min_x,
+        'maxX': max_x,
+        'minY': min_y,
+        'maxY': max_y,
+        'getType': 'json',
+    })
+    url = f"{settings.ITS_API_BASE_URL}/trafficInfo?{params}"
+
+    with urlopen(url, timeout=timeout or settings.ITS_API_TIMEOUT) as response:
+        data = json.loads(response.read())
+    return get_response_items(data)
+
+
+def fetch_national_traffic():
+    """전국 교통정보 스냅샷 조회"""
+    return fetch_traffic_info(*settings.TRAFFIC_SNAPSHOT_BOUNDS)
@@ -0,0 +1,10 @@
+from django.urls import path
+
+from . import views
+
+urlpatterns = [
+    path('', views.traffic_by_area),
+    path('links/<str:link_id>/', views.traffic_link),
+    path('resolve/', views.traffic_resolve),
+    path('metrics/', views.traffic_metrics),
+]
@@ -0,0 +1,104 @@
+import json
+
+from django.conf import settings
+from django.http import JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.gzip import gzip_page
+from django.views.decorators.http import require_GET, require_http_methods
+
+from cctv.store import cctv_store
+from cctv.views import parse_bbox
+
+from .snapshot import traffic_cache
+
+
+def upstream_unavailable():
+    return JsonResponse({'error': 'Traffic data unavailable'}, status=503)
+
+
+@require_GET
+def traffic_link(request, link_id):
+    """linkId 하나의 교통정보 (정확히 일치하지 않으면 최장 prefix 매칭)"""
+    try:
+        item = traffic_cache.get_link(link_id)
+    except Exception:
+        return upstream_unavailable()
+
+    if item is None:
+        return JsonResponse({'error': 'Link not found'}, status=404)
+    return JsonResponse(item)
+
+
+@require_GET
+@gzip_page
+def traffic_by_area(request):
+    """bbox 안 CCTV들의 linkId 교통정보 (응답 구조는 ITS trafficInfo와 동일)"""
+    try:
+        min_x, max_x, min_y, max_y = parse_bbox(request)
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+    dataset = cctv_store.get()
+    if dataset is None:
+        return JsonResponse({'error': 'CCTV data not loaded'}, status=503)
+
+    link_ids = {
+        dataset.records[i]['linkId']
+        for i in dataset.query(min_x, max_x, min_y, max_y)
+        if dataset.records[i].get('linkId')
+    }
+
+    try:
+        items = list(traffic_cache.get_links(sorted(link_ids)).values())
+    except Exception:
+        return upstream_unavailable()
+
+    return JsonResponse({
+        'header': {'resultCode': 0, 'resultMsg': 'success'},
+        'body': {'totalCount': len(items), 'items': items},
+    })
+
+
+@csrf_exempt
+@require_http_methods(['GET', 'POST'])
+@gzip_page
+def traffic_resolve(request):
+    """여러 CCTV linkId의 교통정보를 한 번에 매칭 (정확히 일치 → 최장 prefix 순)
+
+    GET ?linkIds=a,b,c 또는 POST {"linkIds": [...]}
+    """
+    if request.method == 'POST':
+        try:
+            link_ids = json.loads(request.body).get('linkIds')
+        except (ValueError, AttributeError):
+            return JsonResponse({'error': 'Invalid JSON body'}, status=400)
+    else:
+        link_ids = [v for v in request.GET.get('linkIds', '').split(',') if v]
+
+    if not isinstance(link_ids, list) or not link_ids:
+        return JsonResponse({'error': 'Missing required parameters: linkIds'}, status=400)
+    if len(link_ids) > settings.TRAFFIC_RESOLVE_MAX_LINKS:
+        return JsonResponse({'error': f'Too many linkIds (max {settings.TRAFFIC_RESOLVE_MAX_LINKS})'}, status=400)
+
+    try:
+        resolved = traffic_cache.resolve_links([str(v) for v in link_ids])
+    except Exception:
+        return upstream_unavailable()
+
+    return JsonResponse({
+        'results': {
+            link_id: None if item is None else {
+                'matchedLinkId': matched,
+                'prefixLength': length,
+                'exact': matched == link_id,
+                'item': item,
+            }
+            for link_id, (item, matched, length) in resolved.items()
+        }
+    })
+
+
+@require_GET
+def traffic_metrics(request):
+    """스냅샷 캐시 hit/miss 및 갱신 지표"""
+    return JsonResponse(traffic_cache.metrics())
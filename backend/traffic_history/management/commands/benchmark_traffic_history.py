@@ -0,0 +1,121 @@
+"""
+속도 이력 저장/조회 벤치마크
+
+합성 linkId로 (1) 스냅샷 기록 + 시간 블록 저장/일별 집계 속도와
+(2) 수개월치 일별 집계에서 링크 속도 프로필 조회 시간을 측정합니다.
+합성 데이터의 linkId는 BENCH_PREFIX로 시작하며 종료 시 삭제합니다 (--keep 지정 시 유지).
+"""
+import random
+import time
+from datetime import datetime, timedelta, timezone as dt_timezone
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+from common.bulk import bulk_upsert
+from traffic.management.commands.benchmark_link_prefix import synthetic_link_ids
+from traffic_history.models import SpeedBlock, SpeedDaily
+from traffic_history.query import speed_profile
+from traffic_history.rollup import DAILY_FIELDS, DAILY_UNIQUE, daily_row
+from traffic_history.writer import TrafficHistoryWriter
+
+BENCH_PREFIX = 'B'
+
+
+def table_size_mb(model):
+    """테이블 + 인덱스 크기 (MB, PostgreSQL만, 파티션 포함)"""
+    if connection.vendor != 'postgresql':
+        return None
+    with connection.cursor() as cursor:
+        cursor.execute("""
+            SELECT coalesce(sum(pg_total_relation_size(c.oid)), 0)
+            FROM pg_class c
+            WHERE c.oid = %s::regclass
+               OR (c.relkind = 'r' AND c.oid IN (SELECT inhrelid FROM pg_inherits WHERE inhparent = %s::regclass))
+        """, [model._meta.db_table] * 2)
+        return cursor.fetchone()[0] / (1024 * 1024)
+
+
+class Command(BaseCommand):
+    help = '교통 속도 이력 저장(COPY upsert)/조회(일별 집계) 벤치마크'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--links', type=int, default=50000, help='링크 수 (전국 규모)')
+        parser.add_argument('--snapshots', type=int, default=60, help='기록할 스냅샷 수 (1분 간격)')
+        parser.add_argument('--days', type=int, default=90, help='조회용으로 합성할 일별 집계 기간 (일)')
+        parser.add_argument('--daily-links', type=int, default=2000, help='일별 집계를 합성할 링크 수')
+        parser.add_argument('--queries', type=int, default=200)
+        parser.add_argument('--range-days', type=int, default=30, help='조회 기간 (일)')
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument('--keep', action='store_true', help='합성 데이터 유지')
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        link_ids = [BENCH_PREFIX + link_id for link_id in synthetic_link_ids(options['links'], rng)]
+        try:
+            self.bench_ingest(link_ids, options['snapshots'], rng)
+            self.bench_query(link_ids[:options['daily_links']], options, rng)
+        finally:
+            if not options['keep']:
+                SpeedBlock.objects.filter(link_id__startswith=BENCH_PREFIX).delete()
+                SpeedDaily.objects.filter(link_id__startswith=BENCH_PREFIX).delete()
+
+    def bench_ingest(self, link_ids, snapshot_count, rng):
+        writer = TrafficHistoryWriter()
+        # 과거 시점의 한 시간 (현재 수집 중인 시간 블록과 겹치지 않도록)
+        base = datetime(2020, 1, 6, 3, tzinfo=dt_timezone.utc).timestamp()
+
+        start = time.perf_counter()
+        for i in range(snapshot_count):
+            items = [{'linkId': link_id, 'speed': str(rng.randint(5, 110))} for link_id in link_ids]
+            writer.add_snapshot(items, base + i * writer.slot_seconds)
+        record_sec = time.perf_counter() - start
+        readings = writer.metrics['readings']
+
+        start = time.perf_counter()
+        written = writer.flush()
+        flush_sec = time.perf_counter() - start
+
+        self.stdout.write(f"스냅샷 {snapshot_count}개 × 링크 {len(link_ids):,}개 = {readings:,}건")
+        self.stdout.write(f"  기록: {record_sec:.2f}초 ({readings / record_sec:,.0f}건/초)")
+        self.stdout.write(f"  저장: 블록 {written:,}개 + 일별 집계 {flush_sec:.2f}초 "
+                          f"({written / flush_sec:,.0f}블록/초, DB {connection.vendor})")
+        size = table_size_mb(SpeedBlock)
+        if size is not None:
+            self.stdout.write(f"  원본 블록 크기: {size:.1f}MB (링크·시간당 {size * 1024 * 1024 / written:.0f}B)")
+
+    def bench_query(self, link_ids, options, rng):
+        days = options['days']
+        first_day = datetime(2020, 2, 1).date()
+
+        start = time.perf_counter()
+        rows = []
+        for d in range(days):
+            day = first_day + timedelta(days=d)
+            for link_id in link_ids:
+                hour_avg = bytearray(rng.randint(10, 100) for _ in range(24))
+                hour_samples = bytearray([60]) * 24
+                arrays = (hour_avg, bytearray(max(v - 10, 0) for v in hour_avg),
+                          bytearray(min(v + 10, 254) for v in hour_avg), hour_samples)
+                rows.append(daily_row(link_id, day, arrays))
+        bulk_upsert(SpeedDaily, DAILY_FIELDS, rows, DAILY_UNIQUE)
+        load_sec = time.perf_counter() - start
+
+        range_days = options['range_days']
+        timings = []
+        points = 0
+        for _ in range(options['queries']):
+            link_id = rng.choice(link_ids)
+            start_day = first_day + timedelta(days=rng.randint(0, max(days - range_days, 0)))
+            start = time.perf_counter()
+            points += len(speed_profile(link_id, start_day, start_day + timedelta(days=range_days - 1)))
+            timings.append((time.perf_counter() - start) * 1000)
+        timings.sort()
+
+        self.stdout.write(f"일별 집계 {len(rows):,}행 ({days}일 × 링크 {len(link_ids):,}개) 적재 {load_sec:.2f}초")
+        self.stdout.write(f"  {range_days}일 시간별 프로필 조회 {len(timings)}회: "
+                          f"p50 {timings[len(timings) // 2]:.2f}ms, p95 {timings[int(len(timings) * 0.95)]:.2f}ms, "
+                          f"평균 {points / len(timings):.0f}포인트")
+        size = table_size_mb(SpeedDaily)
+        if size is not None:
+            self.stdout.write(f"  일별 집계 크기: {size:.1f}MB (링크·일당 {size * 1024 * 1024 / len(rows):.0f}B)")
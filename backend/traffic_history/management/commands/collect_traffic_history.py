@@ -0,0 +1,95 @@
+"""
+교통정보 스냅샷 주기 수집 → 속도 이력 저장
+
+전국 trafficInfo를 TRAFFIC_SNAPSHOT_TTL 주기로 받아 시간 블록 버퍼에 기록하고,
+별도 스레드가 TRAFFIC_HISTORY_FLUSH_INTERVAL마다(또는 시간이 바뀌면 즉시) DB에 저장합니다.
+웹 워커마다 수집하면 같은 스냅샷을 중복 저장하므로 이 명령을 프로세스 하나로 실행하세요.
+"""
+import logging
+import queue
+import threading
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from traffic.upstream import fetch_national_traffic
+from traffic_history.writer import TrafficHistoryWriter
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = '전국 교통정보 스냅샷을 주기적으로 수집하여 속도 이력(시간 블록 + 일별 집계)으로 저장'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--interval', type=int, default=None, help='수집 주기 (초, 기본 TRAFFIC_SNAPSHOT_TTL)')
+        parser.add_argument('--flush-interval', type=int, default=None,
+                            help='중간 저장 주기 (초, 기본 TRAFFIC_HISTORY_FLUSH_INTERVAL)')
+        parser.add_argument('--once', action='store_true', help='스냅샷 한 번 수집 후 저장하고 종료')
+
+    def handle(self, *args, **options):
+        interval = options['interval'] or settings.TRAFFIC_SNAPSHOT_TTL
+        flush_interval = options['flush_interval'] or settings.TRAFFIC_HISTORY_FLUSH_INTERVAL
+        writer = TrafficHistoryWriter()
+
+        if options['once']:
+            recorded = writer.add_snapshot(fetch_national_traffic())
+            written = writer.flush()
+            self.stdout.write(f"기록 {recorded:,}건, 블록 저장 {written:,}개")
+            return
+
+        # 수집 주기가 DB 쓰기 시간에 밀리지 않도록 기록/저장은 별도 스레드에서 처리
+        snapshots = queue.Queue(maxsize=10)
+        worker = threading.Thread(
+            target=self.write_loop, args=(writer, snapshots, flush_interval),
+            daemon=True, name='traffic-history-writer',
+        )
+        worker.start()
+        self.stdout.write(f"교통 이력 수집 시작 (수집 {interval}초, 저장 {flush_interval}초 주기)")
+
+        try:
+            while True:
+                started = time.monotonic()
+                try:
+                    items = fetch_national_traffic()
+                    snapshots.put((items, time.time()), timeout=interval)
+                except queue.Full:
+                    logger.warning('교통 이력 저장 지연 - 스냅샷 1개 건너뜀')
+                except Exception:
+                    logger.exception('교통정보 스냅샷 수집 실패')
+                time.sleep(max(0.0, interval - (time.monotonic() - started)))
+        except KeyboardInterrupt:
+            self.stdout.write("종료 중 - 남은 이력 저장")
+            snapshots.put(None)
+            worker.join()
+
+    def write_loop(self, writer, snapshots, flush_interval):
+        last_flush = time.monotonic()
+        while True:
+            try:
+                entry = snapshots.get(timeout=1)
+            except queue.Empty:
+                entry = ()
+
+            if entry is None:
+                self.safe_flush(writer)
+                return
+            if entry:
+                items, fetched_at = entry
+                writer.add_snapshot(items, fetched_at)
+
+            if writer.has_completed or time.monotonic() - last_flush >= flush_interval:
+                self.safe_flush(writer)
+                last_flush = time.monotonic()
+
+    def safe_flush(self, writer):
+        try:
+            written = writer.flush()
+        except Exception:
+            logger.exception('교통 이력 저장 실패 - 다음 주기에 재시도')
+            return
+        self.stdout.write(
+            f"  블록 저장 {written:,}개 ({writer.metrics['lastFlushSeconds']}초, "
+            f"누적 기록 {writer.metrics['readings']:,}건)"
+        )
@@ -0,0 +1,41 @@
+"""
+속도 이력 일별 집계 재계산 및 원본 보관 기간 정리
+"""
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from traffic_history.partitions import drop_before
+from traffic_history.rollup import rebuild_day
+
+
+class Command(BaseCommand):
+    help = '원본 시간 블록으로 일별 집계를 다시 계산하고, 보관 기간이 지난 원본 블록(파티션) 삭제'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--day', action='append', default=[], help='재계산할 날짜 (YYYY-MM-DD, 여러 번 지정 가능)')
+        parser.add_argument('--days', type=int, default=0, help='오늘부터 과거 N일 재계산')
+        parser.add_argument('--prune', action='store_true',
+                            help='TRAFFIC_HISTORY_RAW_RETENTION_DAYS 이전 원본 블록 삭제')
+
+    def handle(self, *args, **options):
+        try:
+            days = [date.fromisoformat(value) for value in options['day']]
+        except ValueError:
+            raise CommandError('날짜 형식은 YYYY-MM-DD 입니다')
+        today = timezone.localdate()
+        days += [today - timedelta(days=i) for i in range(options['days'])]
+
+        for day in sorted(set(days)):
+            rows = rebuild_day(day)
+            self.stdout.write(f"{day}: 일별 집계 {rows:,}행")
+
+        if options['prune']:
+            cutoff = timezone.now() - timedelta(days=settings.TRAFFIC_HISTORY_RAW_RETENTION_DAYS)
+            dropped = drop_before(cutoff)
+            if isinstance(dropped, list):
+                self.stdout.write(f"원본 파티션 삭제: {', '.join(dropped) or '없음'}")
+            else:
+                self.stdout.write(f"원본 블록 삭제: {dropped:,}행")
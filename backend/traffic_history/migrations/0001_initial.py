@@ -0,0 +1,71 @@
+# Generated by Django 5.0 on 2026-10-18 07:35
+
+from django.db import migrations, models
+
+
+def create_speedblock(apps, schema_editor):
+    # PostgreSQL은 hour 기준 월별 파티션 테이블, 그 밖의 DB는 일반 테이블
+    from traffic_history.partitions import create_partitioned_table
+
+    SpeedBlock = apps.get_model('traffic_history', 'SpeedBlock')
+    if schema_editor.connection.vendor == 'postgresql':
+        create_partitioned_table(schema_editor, SpeedBlock._meta.db_table)
+    else:
+        schema_editor.create_model(SpeedBlock)
+
+
+def drop_speedblock(apps, schema_editor):
+    SpeedBlock = apps.get_model('traffic_history', 'SpeedBlock')
+    schema_editor.execute(f'DROP TABLE {schema_editor.quote_name(SpeedBlock._meta.db_table)}')
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.SeparateDatabaseAndState(
+            state_operations=[
+                migrations.CreateModel(
+                    name='SpeedBlock',
+                    fields=[
+                        ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                        ('link_id', models.CharField(max_length=20)),
+                        ('hour', models.DateTimeField()),
+                        ('speeds', models.BinaryField()),
+                        ('samples', models.PositiveSmallIntegerField(default=0)),
+                    ],
+                ),
+                migrations.AddConstraint(
+                    model_name='speedblock',
+                    constraint=models.UniqueConstraint(fields=('link_id', 'hour'), name='speedblock_link_hour_uniq'),
+                ),
+            ],
+            database_operations=[],
+        ),
+        # 상태에 SpeedBlock이 추가된 뒤 실행해야 apps.get_model로 이 시점의 모델을 받을 수 있음
+        migrations.RunPython(create_speedblock, drop_speedblock),
+        migrations.CreateModel(
+            name='SpeedDaily',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('link_id', models.CharField(max_length=20)),
+                ('day', models.DateField()),
+                ('hour_avg', models.BinaryField()),
+                ('hour_min', models.BinaryField()),
+                ('hour_max', models.BinaryField()),
+                ('hour_samples', models.BinaryField()),
+                ('avg_speed', models.FloatField(null=True)),
+                ('min_speed', models.PositiveSmallIntegerField(null=True)),
+                ('max_speed', models.PositiveSmallIntegerField(null=True)),
+                ('samples', models.PositiveIntegerField(default=0)),
+            ],
+        ),
+        migrations.AddConstraint(
+            model_name='speeddaily',
+            constraint=models.UniqueConstraint(fields=('link_id', 'day'), name='speeddaily_link_day_uniq'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+from django.db import models
+
+
+class SpeedBlock(models.Model):
+    """링크 하나의 한 시간 속도 원본 (슬롯마다 1바이트, packing 모듈 참고)
+
+    PostgreSQL에서는 hour 기준 월별 파티션 테이블로 생성되어 보관 기간이 지난 달은 파티션째 삭제합니다.
+    """
+
+    link_id = models.CharField(max_length=20)
+    hour = models.DateTimeField()
+    speeds = models.BinaryField()
+    samples = models.PositiveSmallIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['link_id', 'hour'], name='speedblock_link_hour_uniq'),
+        ]
+
+
+class SpeedDaily(models.Model):
+    """링크 하나의 하루 집계 (시간대별 평균/최소/최대/샘플 수 24바이트 배열 + 하루 요약)
+
+    day는 settings.TIME_ZONE 기준 날짜입니다.
+    """
+
+    link_id = models.CharField(max_length=20)
+    day = models.DateField()
+    hour_avg = models.BinaryField()
+    hour_min = models.BinaryField()
+    hour_max = models.BinaryField()
+    hour_samples = models.BinaryField()
+    avg_speed = models.FloatField(null=True)
+    min_speed = models.PositiveSmallIntegerField(null=True)
+    max_speed = models.PositiveSmallIntegerField(null=True)
+    samples = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['link_id', 'day'], name='speeddaily_link_day_uniq'),
+        ]
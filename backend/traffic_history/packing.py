@@ -0,0 +1,71 @@
+"""
+속도 배열 압축 표현
+
+한 링크의 한 시간 속도를 슬롯(TRAFFIC_HISTORY_SLOT_SECONDS)마다 1바이트(km/h, 0~254)로 담고,
+값이 없는 슬롯은 MISSING(255)으로 둡니다. 일별 집계는 시간대별 평균/최소/최대/샘플 수를
+각각 24바이트 배열로 담아 한 링크의 하루를 한 행에 저장합니다.
+"""
+HOURS_PER_DAY = 24
+MISSING = 255
+MAX_SPEED = 254
+
+
+def quantize_speed(value):
+    """trafficInfo speed(문자열/숫자, km/h) → 0~254 정수 (잘못된 값은 None)"""
+    try:
+        speed = float(value)
+    except (TypeError, ValueError):
+        return None
+    if speed != speed or speed < 0:  # NaN, 음수
+        return None
+    return min(int(speed + 0.5), MAX_SPEED)
+
+
+def empty_block(slots):
+    return bytearray([MISSING]) * slots
+
+
+def block_stats(speeds):
+    """시간 블록 → (평균, 최소, 최대, 샘플 수) (샘플이 없으면 None)"""
+    values = [v for v in speeds if v != MISSING]
+    if not values:
+        return None
+    return sum(values) / len(values), min(values), max(values), len(values)
+
+
+def merge_blocks(base, newer):
+    """두 블록을 슬롯 단위로 합침 (newer에 값이 있는 슬롯 우선)"""
+    merged = bytearray(base)
+    for i, v in enumerate(newer):
+        if v != MISSING:
+            merged[i] = v
+    return merged
+
+
+def empty_day():
+    """일별 집계의 시간대별 배열 (평균, 최소, 최대, 샘플 수)"""
+    return (
+        bytearray([MISSING]) * HOURS_PER_DAY,
+        bytearray([MISSING]) * HOURS_PER_DAY,
+        bytearray([MISSING]) * HOURS_PER_DAY,
+        bytearray(HOURS_PER_DAY),
+    )
+
+
+def day_stats(hour_avg, hour_min, hour_max, hour_samples):
+    """시간대별 배열 → 하루 (평균, 최소, 최대, 샘플 수)
+
+    평균은 시간대별 평균을 샘플 수로 가중한 값 (시간 평균이 정수로 반올림되어 있어 근사값)
+    """
+    total = sum(hour_samples)
+    if not total:
+        return None, None, None, 0
+    weighted = sum(avg * n for avg, n in zip(hour_avg, hour_samples) if n)
+    mins = [v for v, n in zip(hour_min, hour_samples) if n]
+    maxs = [v for v, n in zip(hour_max, hour_samples) if n]
+    return weighted / total, min(mins), max(maxs), total
+
+
+def unpack_hours(data):
+    """bytes → [값 또는 None] (MISSING은 None)"""
+    return [None if v == MISSING else v for v in data]
@@ -0,0 +1,97 @@
+"""
+SpeedBlock 월별 파티션 관리 (PostgreSQL 전용, 그 밖의 DB는 일반 테이블로 동작)
+"""
+from datetime import datetime, timezone
+
+from django.db import connection
+
+from .models import SpeedBlock
+
+TABLE = SpeedBlock._meta.db_table
+
+
+def month_start(value):
+    return datetime(value.year, value.month, 1, tzinfo=timezone.utc)
+
+
+def next_month(value):
+    if value.month == 12:
+        return value.replace(year=value.year + 1, month=1)
+    return value.replace(month=value.month + 1)
+
+
+def partition_name(start):
+    return f"{TABLE}_p{start:%Y%m}"
+
+
+def create_partitioned_table(schema_editor, table):
+    """SpeedBlock을 hour 기준 RANGE 파티션 테이블로 생성 (마이그레이션에서 과거 모델의 테이블 이름으로 호출)
+
+    파티션 테이블의 기본 키/유니크 제약에는 파티션 키가 포함되어야 하므로 PK는 (id, hour)입니다.
+    """
+    quote = schema_editor.quote_name
+    schema_editor.execute(f"""
+        CREATE TABLE {quote(table)} (
+            id bigint GENERATED BY DEFAULT AS IDENTITY,
+            link_id varchar(20) NOT NULL,
+            hour timestamp with time zone NOT NULL,
+            speeds bytea NOT NULL,
+            samples smallint NOT NULL CHECK (samples >= 0),
+            PRIMARY KEY (id, hour),
+            CONSTRAINT speedblock_link_hour_uniq UNIQUE (link_id, hour)
+        ) PARTITION BY RANGE (hour)
+    """)
+
+
+def ensure_partitions(start, end=None):
+    """start~end(포함)가 속한 달의 파티션 생성 (이미 있으면 무시), 생성한 파티션 이름 목록 반환"""
+    if connection.vendor != 'postgresql':
+        return []
+
+    month = month_start(start)
+    last = month_start(end or start)
+    created = []
+    with connection.cursor() as cursor:
+        while month <= last:
+            name = partition_name(month)
+            cursor.execute("SELECT to_regclass(%s)", [name])
+            if cursor.fetchone()[0] is None:
+                cursor.execute(
+                    f'CREATE TABLE IF NOT EXISTS "{name}" PARTITION OF "{TABLE}" '
+                    f"FOR VALUES FROM (%s) TO (%s)",
+                    [month, next_month(month)],
+                )
+                created.append(name)
+            month = next_month(month)
+    return created
+
+
+def drop_before(cutoff):
+    """cutoff 이전 원본 블록 삭제 → 삭제한 파티션 이름 목록 (PostgreSQL) 또는 삭제 행 수
+
+    PostgreSQL은 cutoff 이전에 끝나는 달의 파티션을 통째로 삭제하고 (DELETE 없이 즉시),
+    cutoff가 속한 달은 그대로 둡니다.
+    """
+    if connection.vendor != 'postgresql':
+        deleted, _ = SpeedBlock.objects.filter(hour__lt=cutoff).delete()
+        return deleted
+
+    boundary = month_start(cutoff)
+    dropped = []
+    with connection.cursor() as cursor:
+        cursor.execute("""
+            SELECT child.relname
+            FROM pg_inherits
+            JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+            JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+            WHERE parent.relname = %s AND child.relkind = 'r'
+        """, [TABLE])
+        for (name,) in cursor.fetchall():
+            try:
+                start = datetime.strptime(name.rsplit('_p', 1)[1], '%Y%m').replace(tzinfo=timezone.utc)
+            except (IndexError, ValueError):
+                continue
+            if next_month(start) <= boundary:
+                cursor.execute(f'DROP TABLE "{name}"')
+                dropped.append(name)
+    return sorted(dropped)
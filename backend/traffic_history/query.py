@@ -0,0 +1,53 @@
+"""
+링크 속도 프로필 조회 (일별 집계만 읽음, 원본 블록은 읽지 않음)
+"""
+from datetime import datetime, time, timedelta
+
+from django.utils import timezone
+
+from .models import SpeedDaily
+from .packing import HOURS_PER_DAY, MISSING
+
+RESOLUTIONS = ('hour', 'day')
+
+
+def speed_profile(link_id, start_day, end_day, resolution='hour'):
+    """start_day~end_day(포함) 링크 속도 프로필 → [{time, avgSpeed, minSpeed, maxSpeed, samples}]
+
+    resolution='hour'는 샘플이 있는 시간대만, 'day'는 샘플이 있는 날짜만 포함합니다.
+    """
+    rows = (
+        SpeedDaily.objects.filter(link_id=link_id, day__gte=start_day, day__lte=end_day)
+        .order_by('day')
+        .values_list('day', 'hour_avg', 'hour_min', 'hour_max', 'hour_samples',
+                     'avg_speed', 'min_speed', 'max_speed', 'samples')
+    )
+
+    points = []
+    for day, hour_avg, hour_min, hour_max, hour_samples, avg, low, high, samples in rows:
+        if resolution == 'day':
+            if samples:
+                points.append({
+                    'time': day.isoformat(),
+                    'avgSpeed': round(avg, 1),
+                    'minSpeed': low,
+                    'maxSpeed': high,
+                    'samples': samples,
+                })
+            continue
+
+        hour_avg, hour_min, hour_max, hour_samples = (
+            bytes(hour_avg), bytes(hour_min), bytes(hour_max), bytes(hour_samples)
+        )
+        start = timezone.make_aware(datetime.combine(day, time.min))
+        for h in range(HOURS_PER_DAY):
+            if not hour_samples[h] or hour_avg[h] == MISSING:
+                continue
+            points.append({
+                'time': (start + timedelta(hours=h)).isoformat(),
+                'avgSpeed': hour_avg[h],
+                'minSpeed': hour_min[h],
+                'maxSpeed': hour_max[h],
+                'samples': hour_samples[h],
+            })
+    return points
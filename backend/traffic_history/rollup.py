@@ -0,0 +1,96 @@
+"""
+시간 블록 → 일별 집계 (SpeedDaily)
+
+수집 중에는 저장한 시간 블록을 바로 해당 날짜 행의 시간대 칸에 반영하고(rollup_hour),
+원본에서 다시 만들 때는 하루치 블록을 링크 순으로 읽어 재계산합니다(rebuild_day).
+"""
+from datetime import datetime, time, timedelta
+from itertools import groupby
+
+from django.db import transaction
+from django.utils import timezone
+
+from common.bulk import bulk_upsert
+
+from .models import SpeedBlock, SpeedDaily
+from .packing import MISSING, block_stats, day_stats, empty_day
+
+DAILY_FIELDS = [
+    'link_id', 'day', 'hour_avg', 'hour_min', 'hour_max', 'hour_samples',
+    'avg_speed', 'min_speed', 'max_speed', 'samples',
+]
+DAILY_UNIQUE = ['link_id', 'day']
+
+
+def local_day_hour(hour):
+    """UTC 시간 블록 시작 → (settings.TIME_ZONE 기준 날짜, 시)"""
+    local = timezone.localtime(hour)
+    return local.date(), local.hour
+
+
+def day_bounds(day):
+    """날짜 → 그 날의 [시작, 끝) (aware datetime)"""
+    start = timezone.make_aware(datetime.combine(day, time.min))
+    return start, start + timedelta(days=1)
+
+
+def apply_hour(arrays, hour_index, speeds):
+    """일별 배열의 hour_index 칸을 시간 블록 통계로 채움"""
+    hour_avg, hour_min, hour_max, hour_samples = arrays
+    stats = block_stats(speeds)
+    if stats is None:
+        hour_avg[hour_index] = hour_min[hour_index] = hour_max[hour_index] = MISSING
+        hour_samples[hour_index] = 0
+        return
+    avg, low, high, count = stats
+    hour_avg[hour_index] = int(avg + 0.5)
+    hour_min[hour_index] = low
+    hour_max[hour_index] = high
+    hour_samples[hour_index] = min(count, 255)
+
+
+def daily_row(link_id, day, arrays):
+    avg, low, high, samples = day_stats(*arrays)
+    return (link_id, day, *(bytes(a) for a in arrays), avg, low, high, samples)
+
+
+def rollup_hour(hour, blocks):
+    """한 시간의 블록 {linkId: speeds}을 일별 집계에 반영, 갱신한 행 수 반환"""
+    day, hour_index = local_day_hour(hour)
+    existing = {
+        link_id: tuple(bytearray(a) for a in arrays)
+        for link_id, *arrays in SpeedDaily.objects.filter(day=day).values_list(
+            'link_id', 'hour_avg', 'hour_min', 'hour_max', 'hour_samples'
+        ).iterator(chunk_size=10000)
+    }
+
+    rows = []
+    for link_id, speeds in blocks.items():
+        arrays = existing.get(link_id) or empty_day()
+        apply_hour(arrays, hour_index, speeds)
+        rows.append(daily_row(link_id, day, arrays))
+    return bulk_upsert(SpeedDaily, DAILY_FIELDS, rows, DAILY_UNIQUE)
+
+
+def rebuild_day(day):
+    """원본 블록으로 하루 집계를 다시 계산 (원본이 없는 날은 기존 집계 유지), 행 수 반환"""
+    start, end = day_bounds(day)
+    blocks = (
+        SpeedBlock.objects.filter(hour__gte=start, hour__lt=end)
+        .order_by('link_id', 'hour')
+        .values_list('link_id', 'hour', 'speeds')
+        .iterator(chunk_size=10000)
+    )
+
+    rows = []
+    for link_id, link_blocks in groupby(blocks, key=lambda row: row[0]):
+        arrays = empty_day()
+        for _, hour, speeds in link_blocks:
+            apply_hour(arrays, local_day_hour(hour)[1], bytes(speeds))
+        rows.append(daily_row(link_id, day, arrays))
+
+    if not rows:
+        return 0
+    with transaction.atomic():
+        SpeedDaily.objects.filter(day=day).delete()
+        return bulk_upsert(SpeedDaily, DAILY_FIELDS, rows, DAILY_UNIQUE)
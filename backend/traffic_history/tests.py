@@ -0,0 +1,188 @@
+"""
+교통 속도 이력 테스트 (SQLite로 실행: DJANGO_DB_ENGINE=sqlite python manage.py test traffic_history)
+"""
+from datetime import date, datetime, timedelta, timezone as dt_timezone
+from unittest import mock, skipIf, skipUnless
+
+from django.db import connection
+from django.test import TestCase, override_settings
+
+from common.bulk import bulk_upsert
+
+from .models import SpeedBlock, SpeedDaily
+from .packing import MAX_SPEED, MISSING, merge_blocks, quantize_speed
+from .partitions import TABLE, drop_before, ensure_partitions, partition_name
+from .query import speed_profile
+from .rollup import rebuild_day, rollup_hour
+from .writer import TrafficHistoryWriter
+
+# 2026-01-05 12:59:30 / 13:00:30 (Asia/Seoul) - 같은 날짜의 연속된 두 시간
+HOUR_1 = datetime(2026, 1, 5, 3, tzinfo=dt_timezone.utc)
+HOUR_2 = HOUR_1 + timedelta(hours=1)
+DAY = date(2026, 1, 5)
+
+
+def daily_rows(day):
+    return {
+        link_id: (bytes(a), bytes(b), bytes(c), bytes(d), avg, low, high, samples)
+        for link_id, a, b, c, d, avg, low, high, samples in SpeedDaily.objects.filter(day=day).values_list(
+            'link_id', 'hour_avg', 'hour_min', 'hour_max', 'hour_samples',
+            'avg_speed', 'min_speed', 'max_speed', 'samples',
+        )
+    }
+
+
+class PackingTests(TestCase):
+    def test_quantize_speed(self):
+        self.assertEqual(quantize_speed('42.4'), 42)
+        self.assertEqual(quantize_speed(42.5), 43)
+        self.assertEqual(quantize_speed(0), 0)
+        self.assertEqual(quantize_speed(1000), MAX_SPEED)
+        for value in (None, '', 'abc', -1, float('nan')):
+            self.assertIsNone(quantize_speed(value))
+
+    def test_merge_blocks_prefers_newer_values(self):
+        base = bytes([10, 20, MISSING, MISSING])
+        newer = bytes([MISSING, 25, 30, MISSING])
+        self.assertEqual(merge_blocks(base, newer), bytearray([10, 25, 30, MISSING]))
+
+
+@override_settings(TRAFFIC_HISTORY_SLOT_SECONDS=60)
+class WriterTests(TestCase):
+    def add(self, writer, hour, seconds, speeds):
+        writer.add_snapshot(
+            [{'linkId': link_id, 'speed': speed} for link_id, speed in speeds.items()],
+            fetched_at=hour.timestamp() + seconds,
+        )
+
+    def test_flush_across_hour_boundary_retries_after_failure(self):
+        writer = TrafficHistoryWriter()
+        self.add(writer, HOUR_1, 3570, {'A': '50', 'B': '30'})
+        self.add(writer, HOUR_2, 30, {'A': '70', 'B': 'bad'})
+        self.assertTrue(writer.has_completed)
+
+        with mock.patch('traffic_history.writer.bulk_upsert', side_effect=RuntimeError('db down')):
+            with self.assertRaises(RuntimeError):
+                writer.flush()
+        self.assertFalse(SpeedBlock.objects.exists())
+        self.assertTrue(writer.has_completed)
+
+        self.assertEqual(writer.flush(), 3)
+        self.assertFalse(writer.has_completed)
+
+        blocks = {
+            (link_id, hour): bytes(speeds)
+            for link_id, hour, speeds in SpeedBlock.objects.values_list('link_id', 'hour', 'speeds')
+        }
+        self.assertEqual(set(blocks), {('A', HOUR_1), ('B', HOUR_1), ('A', HOUR_2)})
+        self.assertEqual(blocks[('A', HOUR_1)][59], 50)
+        self.assertEqual(blocks[('A', HOUR_2)][0], 70)
+        self.assertEqual(blocks[('A', HOUR_2)].count(MISSING), 59)
+
+        points = speed_profile('A', DAY, DAY)
+        self.assertEqual([p['avgSpeed'] for p in points], [50, 70])
+        self.assertEqual(speed_profile('A', DAY, DAY, 'day')[0]['avgSpeed'], 60.0)
+
+    def test_rollup_hour_matches_rebuild_day(self):
+        writer = TrafficHistoryWriter()
+        for minute in range(0, 60, 7):
+            self.add(writer, HOUR_1, minute * 60, {'A': 40 + minute, 'B': 90 - minute})
+            self.add(writer, HOUR_2, minute * 60, {'A': 20 + minute})
+        writer.flush()
+
+        incremental = daily_rows(DAY)
+        self.assertEqual(set(incremental), {'A', 'B'})
+        self.assertEqual(rebuild_day(DAY), 2)
+        self.assertEqual(daily_rows(DAY), incremental)
+
+    def test_rollup_hour_without_samples(self):
+        self.assertEqual(rollup_hour(HOUR_1, {'A': bytes([MISSING]) * 60}), 1)
+        self.assertEqual(speed_profile('A', DAY, DAY), [])
+
+
+class ViewTests(TestCase):
+    url = '/api/traffic/history/links/A/'
+
+    def test_invalid_parameters(self):
+        for params in (
+            {'to': '2026-13-01'},
+            {'from': 'yesterday'},
+            {'resolution': 'minute'},
+            {'from': '2026-01-05', 'to': '2026-01-04'},
+            {'from': '2020-01-01', 'to': '2026-01-01'},
+        ):
+            with self.subTest(params=params):
+                response = self.client.get(self.url, params)
+                self.assertEqual(response.status_code, 400)
+                self.assertIn('error', response.json())
+
+    def test_profile(self):
+        rollup_hour(HOUR_1, {'A': bytes([55]) * 60})
+        response = self.client.get(self.url, {'from': '2026-01-05', 'to': '2026-01-05'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['points'][0]['avgSpeed'], 55)
+
+
+@skipIf(connection.vendor == 'postgresql', 'PostgreSQL은 파티션 단위로 삭제')
+class DropBeforeTests(TestCase):
+    def test_deletes_rows_before_cutoff(self):
+        SpeedBlock.objects.create(link_id='A', hour=HOUR_1, speeds=b'\x01', samples=1)
+        SpeedBlock.objects.create(link_id='A', hour=HOUR_2, speeds=b'\x01', samples=1)
+        self.assertEqual(drop_before(HOUR_2), 1)
+        self.assertEqual(list(SpeedBlock.objects.values_list('hour', flat=True)), [HOUR_2])
+
+
+@skipUnless(connection.vendor == 'postgresql', 'PostgreSQL 파티션/COPY 경로')
+class PostgresPartitionTests(TestCase):
+    def partitions(self):
+        with connection.cursor() as cursor:
+            cursor.execute("""
+                SELECT child.relname FROM pg_inherits
+                JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+                JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+                WHERE parent.relname = %s
+            """, [TABLE])
+            return sorted(name for (name,) in cursor.fetchall())
+
+    def test_table_is_partitioned_by_hour(self):
+        with connection.cursor() as cursor:
+            cursor.execute("""
+                SELECT p.partstrat FROM pg_partitioned_table p
+                JOIN pg_class c ON c.oid = p.partrelid WHERE c.relname = %s
+            """, [TABLE])
+            self.assertEqual(cursor.fetchone(), ('r',))
+
+    def test_ensure_partitions_is_idempotent(self):
+        start = datetime(2025, 11, 20, tzinfo=dt_timezone.utc)
+        end = datetime(2026, 1, 3, tzinfo=dt_timezone.utc)
+        names = [partition_name(datetime(y, m, 1)) for y, m in ((2025, 11), (2025, 12), (2026, 1))]
+        self.assertEqual(ensure_partitions(start, end), names)
+        self.assertEqual(ensure_partitions(start, end), [])
+        self.assertEqual(self.partitions(), names)
+
+    def test_copy_upsert_updates_existing_rows(self):
+        ensure_partitions(HOUR_1)
+        fields = ['link_id', 'hour', 'speeds', 'samples']
+        unique = ['link_id', 'hour']
+        self.assertEqual(bulk_upsert(SpeedBlock, fields, [('A', HOUR_1, b'\x01\x02', 2)], unique), 1)
+        rows = [('A', HOUR_1, b'\x03', 1), ('B', HOUR_1, b'', 0)]
+        self.assertEqual(bulk_upsert(SpeedBlock, fields, rows, unique, batch_size=1), 2)
+
+        stored = {
+            link_id: (bytes(speeds), samples)
+            for link_id, speeds, samples in SpeedBlock.objects.values_list('link_id', 'speeds', 'samples')
+        }
+        self.assertEqual(stored, {'A': (b'\x03', 1), 'B': (b'', 0)})
+
+    def test_drop_before_drops_whole_months(self):
+        november = datetime(2025, 11, 2, tzinfo=dt_timezone.utc)
+        ensure_partitions(november, HOUR_1)
+        SpeedBlock.objects.create(link_id='A', hour=november, speeds=b'', samples=0)
+        SpeedBlock.objects.create(link_id='A', hour=HOUR_1, speeds=b'', samples=0)
+
+        # cutoff가 속한 1월 파티션은 남기고 그 전 달만 통째로 삭제
+        cutoff = datetime(2026, 1, 2, tzinfo=dt_timezone.utc)
+        dropped = [partition_name(datetime(2025, 11, 1)), partition_name(datetime(2025, 12, 1))]
+        self.assertEqual(drop_before(cutoff), dropped)
+        self.assertEqual(self.partitions(), [partition_name(datetime(2026, 1, 1))])
+        self.assertEqual(list(SpeedBlock.objects.values_list('hour', flat=True)), [HOUR_1])
@@ -0,0 +1,7 @@
+from django.urls import path
+
+from . import views
+
+urlpatterns = [
+    path('links/<str:link_id>/', views.link_speed_profile),
+]
@@ -0,0 +1,48 @@
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.http import JsonResponse
+from django.utils import timezone
+from django.views.decorators.gzip import gzip_page
+from django.views.decorators.http import require_GET
+
+from .query import RESOLUTIONS, speed_profile
+
+DEFAULT_RANGE_DAYS = 7
+
+
+def parse_day(value, name):
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f'Invalid {name} parameter (YYYY-MM-DD)')
+
+
+@require_GET
+@gzip_page
+def link_speed_profile(request, link_id):
+    """linkId 하나의 기간별 속도 프로필 (from/to: YYYY-MM-DD, 기본 최근 7일, resolution: hour|day)"""
+    try:
+        end_day = parse_day(request.GET['to'], 'to') if 'to' in request.GET else timezone.localdate()
+        start_day = (
+            parse_day(request.GET['from'], 'from') if 'from' in request.GET
+            else end_day - timedelta(days=DEFAULT_RANGE_DAYS - 1)
+        )
+    except ValueError as e:
+        return JsonResponse({'error': str(e)}, status=400)
+
+    resolution = request.GET.get('resolution', 'hour')
+    if resolution not in RESOLUTIONS:
+        return JsonResponse({'error': 'Invalid resolution'}, status=400)
+    if start_day > end_day:
+        return JsonResponse({'error': 'from must not be after to'}, status=400)
+    if (end_day - start_day).days + 1 > settings.TRAFFIC_HISTORY_MAX_DAYS:
+        return JsonResponse({'error': f'Range exceeds {settings.TRAFFIC_HISTORY_MAX_DAYS} days'}, status=400)
+
+    return JsonResponse({
+        'linkId': link_id,
+        'from': start_day.isoformat(),
+        'to': end_day.isoformat(),
+        'resolution': resolution,
+        'points': speed_profile(link_id, start_day, end_day, resolution),
+    })
@@ -0,0 +1,171 @@
+"""
+교통 스냅샷 → 시간 블록 버퍼 → DB
+
+스냅샷마다 링크별 속도를 진행 중인 시간 블록의 슬롯에 기록하고,
+주기적으로(또는 시간이 바뀌면) 블록 전체를 한 번에 upsert한 뒤 일별 집계에 반영합니다.
+버퍼는 진행 중인 시간 전체를 들고 있으므로 중간 저장은 항상 덮어쓰기이며,
+재시작 시에는 DB에 이미 저장된 그 시간의 블록을 읽어 이어 씁니다.
+"""
+import logging
+import threading
+import time
+from datetime import datetime, timezone
+
+from django.conf import settings
+
+from common.bulk import bulk_upsert
+
+from .models import SpeedBlock
+from .packing import block_stats, empty_block, merge_blocks, quantize_speed
+from .partitions import ensure_partitions, next_month
+from .rollup import rollup_hour
+
+logger = logging.getLogger(__name__)
+
+BLOCK_FIELDS = ['link_id', 'hour', 'speeds', 'samples']
+BLOCK_UNIQUE = ['link_id', 'hour']
+
+
+def floor_hour(timestamp):
+    """unix time → 그 시각이 속한 시간 블록 시작 (UTC aware datetime)"""
+    return datetime.fromtimestamp(timestamp - timestamp % 3600, tz=timezone.utc)
+
+
+class HourBuffer:
+    """한 시간의 링크별 속도 블록"""
+
+    def __init__(self, hour, slots):
+        self.hour = hour
+        self.slots = slots
+        self.blocks = {}
+        self.dirty = False
+
+    def record(self, link_id, slot, speed):
+        block = self.blocks.get(link_id)
+        if block is None:
+            block = self.blocks[link_id] = empty_block(self.slots)
+        block[slot] = speed
+        self.dirty = True
+
+    def load_existing(self):
+        """DB에 이미 저장된 이 시간의 블록을 합침 (재시작 후 이어쓰기)"""
+        rows = SpeedBlock.objects.filter(hour=self.hour).values_list('link_id', 'speeds')
+        loaded = 0
+        for link_id, speeds in rows.iterator(chunk_size=10000):
+            speeds = bytes(speeds)
+            if len(speeds) != self.slots:
+                continue  # 슬롯 간격 설정이 바뀐 블록은 이어쓰지 않음
+            current = self.blocks.get(link_id)
+            self.blocks[link_id] = merge_blocks(speeds, current) if current else bytearray(speeds)
+            loaded += 1
+        return loaded
+
+    def rows(self):
+        for link_id, speeds in self.blocks.items():
+            stats = block_stats(speeds)
+            yield link_id, self.hour, bytes(speeds), stats[3] if stats else 0
+
+
+class TrafficHistoryWriter:
+    """교통정보 스냅샷 기록기 (스레드 안전, DB 쓰기는 flush에서만)"""
+
+    def __init__(self, slot_seconds=None):
+        self.slot_seconds = slot_seconds or settings.TRAFFIC_HISTORY_SLOT_SECONDS
+        if 3600 % self.slot_seconds:
+            raise ValueError('TRAFFIC_HISTORY_SLOT_SECONDS must divide 3600')
+        self.slots = 3600 // self.slot_seconds
+        self._current = None
+        self._completed = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self.metrics = {
+            'snapshots': 0,
+            'readings': 0,
+            'skipped': 0,
+            'flushes': 0,
+            'blocksWritten': 0,
+            'dailyRowsWritten': 0,
+            'lastFlushSeconds': None,
+        }
+
+    def add_snapshot(self, items, fetched_at=None):
+        """trafficInfo item 목록 기록 (시간이 바뀌면 이전 시간 블록은 저장 대기열로 이동), 기록 수 반환"""
+        fetched_at = fetched_at or time.time()
+        hour = floor_hour(fetched_at)
+        slot = int(fetched_at % 3600) // self.slot_seconds
+
+        with self._lock:
+            if self._current is None or self._current.hour != hour:
+                if self._current is not None:
+                    self._completed.append(self._current)
+                self._current = HourBuffer(hour, self.slots)
+                try:
+                    self._current.load_existing()
+                except Exception:
+                    logger.exception('기존 시간 블록 로드 실패 - 새 블록으로 시작')
+
+            recorded = skipped = 0
+            for item in items:
+                link_id = item.get('linkId')
+                speed = quantize_speed(item.get('speed'))
+                if not link_id or speed is None:
+                    skipped += 1
+                    continue
+                self._current.record(link_id, slot, speed)
+                recorded += 1
+
+            self.metrics['snapshots'] += 1
+            self.metrics['readings'] += recorded
+            self.metrics['skipped'] += skipped
+        return recorded
+
+    @property
+    def has_completed(self):
+        return bool(self._completed)
+
+    def flush(self):
+        """완료된 시간과 진행 중인 시간 블록을 저장하고 일별 집계 반영, 저장한 블록 수 반환"""
+        with self._flush_lock:
+            with self._lock:
+                buffers = self._completed
+                self._completed = []
+                current = self._current
+                if current is not None and current.dirty:
+                    buffers = buffers + [current]
+                    # 스냅샷 추가와 겹치지 않도록 복사본 저장 (진행 중인 버퍼는 계속 기록)
+                    snapshot = HourBuffer(current.hour, current.slots)
+                    snapshot.blocks = {k: bytes(v) for k, v in current.blocks.items()}
+                    buffers[-1] = snapshot
+                    current.dirty = False
+
+            start = time.perf_counter()
+            written = 0
+            try:
+                for buffer in buffers:
+                    written += self._write(buffer)
+            except Exception:
+                # 실패한 버퍼는 다음 flush에서 다시 시도
+                with self._lock:
+                    retry = [b for b in buffers if b.hour != getattr(self._current, 'hour', None)]
+                    self._completed = retry + self._completed
+                    if self._current is not None:
+                        self._current.dirty = True
+                raise
+
+            self.metrics['flushes'] += 1
+            self.metrics['lastFlushSeconds'] = round(time.perf_counter() - start, 3)
+            return written
+
+    def _write(self, buffer):
+        if not buffer.blocks:
+            return 0
+        ahead = buffer.hour.replace(day=1)
+        for _ in range(settings.TRAFFIC_HISTORY_PARTITIONS_AHEAD):
+            ahead = next_month(ahead)
+        ensure_partitions(buffer.hour, ahead)
+        count = bulk_upsert(SpeedBlock, BLOCK_FIELDS, buffer.rows(), BLOCK_UNIQUE)
+        daily = rollup_hour(buffer.hour, buffer.blocks)
+        self.metrics['blocksWritten'] += count
+        self.metrics['dailyRowsWritten'] += daily
+        logger.info('교통 이력 저장: %s 블록 %d개, 일별 집계 %d행', buffer.hour.isoformat(), count, daily)
+        return count
@@ -0,0 +1,188 @@
+"""
+CCTV 조회 이벤트 버퍼
+
+요청 처리 중에는 메모리의 (cctvId, 시간) 카운터만 올리고 바로 응답합니다.
+백그라운드 스레드가 VIEW_EVENTS_FLUSH_INTERVAL마다 또는 대기 키가 VIEW_EVENTS_FLUSH_SIZE를 넘으면
+누적된 카운터를 한 번의 upsert(count = count + 증가분)로 저장하므로 DB 쓰기 지연이 요청 지연에 영향을 주지 않습니다.
+"지금 많이 보는 CCTV"는 최근 VIEW_EVENTS_TRENDING_WINDOW초의 분 단위 카운터로 메모리에서 계산합니다 (워커별 집계).
+"""
+import atexit
+import logging
+import threading
+import time
+from collections import Counter, deque
+from datetime import datetime, timezone
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+
+from .models import CCTVViewCount
+
+logger = logging.getLogger(__name__)
+
+
+def floor_hour(timestamp):
+    return datetime.fromtimestamp(timestamp - timestamp % 3600, tz=timezone.utc)
+
+
+def upsert_counts(counts, batch_size=1000):
+    """{(cctvId, hour): 증가분} → 누적 upsert (PostgreSQL/SQLite 공통 ON CONFLICT 구문)
+
+    원시 SQL이므로 hour는 ORM과 같은 형식으로 변환해서 넘김
+    (SQLite는 aware datetime을 '+00:00'이 붙은 문자열로 저장해 ORM이 만든 행과 유니크 키가 달라짐)
+    """
+    table = connection.ops.quote_name(CCTVViewCount._meta.db_table)
+    items = list(counts.items())
+    adapt_hour = connection.ops.adapt_datetimefield_value
+    with transaction.atomic(), connection.cursor() as cursor:
+        for start in range(0, len(items), batch_size):
+            batch = items[start:start + batch_size]
+            values = ', '.join(['(%s, %s, %s)'] * len(batch))
+            params = []
+            for (cctv_id, hour), count in batch:
+                params += [cctv_id, adapt_hour(hour), count]
+            cursor.execute(
+                f'INSERT INTO {table} (cctv_id, hour, count) VALUES {values} '
+                f'ON CONFLICT (cctv_id, hour) DO UPDATE SET count = {table}.count + EXCLUDED.count',
+                params,
+            )
+    return len(items)
+
+
+class TrendingWindow:
+    """최근 window초 동안의 CCTV별 조회 수 (분 단위 버킷)"""
+
+    def __init__(self, window, bucket_seconds=60):
+        self.window = window
+        self.bucket_seconds = bucket_seconds
+        self._buckets = deque()  # (버킷 시작, Counter)
+        self._total = Counter()
+
+    def _expire(self, now):
+        cutoff = now - self.window
+        while self._buckets and self._buckets[0][0] + self.bucket_seconds <= cutoff:
+            _, counter = self._buckets.popleft()
+            self._total.subtract(counter)
+            for key in counter:
+                if self._total[key] <= 0:
+                    del self._total[key]
+
+    def add(self, cctv_id, count, now):
+        bucket = now - now % self.bucket_seconds
+        if not self._buckets or self._buckets[-1][0] != bucket:
+            self._buckets.append((bucket, Counter()))
+        self._buckets[-1][1][cctv_id] += count
+        self._total[cctv_id] += count
+        self._expire(now)
+
+    def top(self, limit, now):
+        self._expire(now)
+        return self._total.most_common(limit)
+
+
+class ViewEventBuffer:
+    """조회 이벤트 버퍼 (스레드 안전, flush 스레드는 첫 이벤트 때 시작)
+
+    write: {(cctvId, hour): 증가분}을 저장하는 함수 (테스트/부하 테스트 시 교체)
+    autostart: False면 flush 스레드를 시작하지 않음 (테스트에서 flush를 직접 호출)
+    """
+
+    def __init__(self, write=upsert_counts, flush_interval=None, flush_size=None, trending_window=None,
+                 autostart=True):
+        self.write = write
+        self.autostart = autostart
+        self.flush_interval = flush_interval or settings.VIEW_EVENTS_FLUSH_INTERVAL
+        self.flush_size = flush_size or settings.VIEW_EVENTS_FLUSH_SIZE
+        self._pending = Counter()
+        self._trending = TrendingWindow(trending_window or settings.VIEW_EVENTS_TRENDING_WINDOW)
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._flusher = None
+        self._metrics = {
+            'events': 0,
+            'flushes': 0,
+            'flushErrors': 0,
+            'rowsWritten': 0,
+            'lastFlushSeconds': None,
+            'lastFlushRows': 0,
+        }
+
+    def add(self, cctv_id, now=None):
+        self.add_many([cctv_id], now)
+
+    def add_many(self, cctv_ids, now=None):
+        """이벤트 기록 (DB 접근 없음, 대기 키가 많으면 flush 스레드를 깨움)"""
+        now = now or time.time()
+        hour = floor_hour(now)
+        with self._lock:
+            for cctv_id in cctv_ids:
+                self._pending[(cctv_id, hour)] += 1
+                self._trending.add(cctv_id, 1, now)
+            self._metrics['events'] += len(cctv_ids)
+            full = len(self._pending) >= self.flush_size
+
+        if self._flusher is None and self.autostart:
+            self.start()
+        if full:
+            self._wake.set()
+
+    def most_watched(self, limit):
+        """최근 조회 수 상위 CCTV [(cctvId, 조회 수)]"""
+        with self._lock:
+            return self._trending.top(limit, time.time())
+
+    def flush(self):
+        """대기 중인 카운터 저장, 저장한 행 수 반환 (실패 시 카운터를 되돌려 다음 flush에서 재시도)"""
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, Counter()
+            if not pending:
+                return 0
+
+            start = time.perf_counter()
+            try:
+                rows = self.write(pending)
+            except Exception:
+                with self._lock:
+                    self._pending.update(pending)
+                    self._metrics['flushErrors'] += 1
+                raise
+
+            with self._lock:
+                self._metrics['flushes'] += 1
+                self._metrics['rowsWritten'] += rows
+                self._metrics['lastFlushRows'] = rows
+                self._metrics['lastFlushSeconds'] = round(time.perf_counter() - start, 4)
+            return rows
+
+    def start(self):
+        """주기 flush 데몬 스레드 시작 (중복 호출 무시), 프로세스 종료 시 남은 카운터 저장"""
+        with self._lock:
+            if self._flusher is not None:
+                return
+            self._flusher = threading.Thread(target=self._run, daemon=True, name='view-events-flush')
+        self._flusher.start()
+        atexit.register(self._flush_quietly)
+
+    def _run(self):
+        while True:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self._flush_quietly()
+            close_old_connections()
+
+    def _flush_quietly(self):
+        try:
+            self.flush()
+        except Exception:
+            logger.exception('CCTV 조회 카운터 저장 실패 - 다음 주기에 재시도')
+
+    def metrics(self):
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics['pendingKeys'] = len(self._pending)
+        return metrics
+
+
+view_events = ViewEventBuffer()
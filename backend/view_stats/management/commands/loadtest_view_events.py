@@ -0,0 +1,99 @@
+"""
+CCTV 조회 이벤트 엔드포인트 부하 테스트
+
+여러 스레드가 테스트 클라이언트로 POST /api/cctv/views/ 를 --duration초 동안 호출하여
+지속 처리량(이벤트/초)과 요청 지연 시간을 측정합니다. 그동안 백그라운드 flush가 실제 DB에 저장하며,
+--db-delay로 DB 쓰기를 인위적으로 느리게 해도 요청 지연이 유지되는지 확인할 수 있습니다.
+"""
+import json
+import random
+import tempfile
+import threading
+import time
+from itertools import accumulate
+from pathlib import Path
+
+from django.core.management.base import BaseCommand
+from django.test import Client, override_settings
+
+from cctv.store import cctv_store
+from view_stats.buffer import view_events
+from view_stats.models import CCTVViewCount
+
+
+class Command(BaseCommand):
+    help = 'CCTV 조회 이벤트 버퍼 부하 테스트 (처리량, 요청 지연, flush 통계)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--threads', type=int, default=8)
+        parser.add_argument('--duration', type=float, default=10.0, help='측정 시간 (초)')
+        parser.add_argument('--batch', type=int, default=1, help='요청당 이벤트 수')
+        parser.add_argument('--cameras', type=int, default=5000, help='CCTV 데이터가 없을 때 사용할 합성 ID 수')
+        parser.add_argument('--db-delay', type=float, default=0.0, help='flush마다 추가할 DB 쓰기 지연 (초)')
+        parser.add_argument('--seed', type=int, default=0)
+
+    def handle(self, *args, **options):
+        dataset = cctv_store.get()
+        if dataset is not None and dataset.offsets:
+            return self.run(list(dataset.offsets), options)
+
+        # 엔드포인트는 CCTV 데이터에 있는 ID만 받으므로 합성 데이터 파일을 임시로 사용
+        cctv_ids = [f"LOADTEST{i:06d}" for i in range(options['cameras'])]
+        records = [{'cctvId': cctv_id, 'coordx': 127.0, 'coordy': 37.5} for cctv_id in cctv_ids]
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'cctv-data-loadtest.json'
+            path.write_text(json.dumps({'response': {'coordtype': 1, 'data': records}}))
+            with override_settings(CCTV_DATA_FILE=path):
+                self.run(cctv_ids, options)
+
+    def run(self, cctv_ids, options):
+        if options['db_delay']:
+            write, delay = view_events.write, options['db_delay']
+
+            def slow_write(counts):
+                time.sleep(delay)
+                return write(counts)
+            view_events.write = slow_write
+
+        # 조회가 일부 CCTV에 몰리는 분포 (순위 역수 가중치)
+        cum_weights = list(accumulate(1 / (rank + 1) for rank in range(len(cctv_ids))))
+        before_rows = CCTVViewCount.objects.count()
+        deadline = time.perf_counter() + options['duration']
+        results = []
+
+        def worker(seed):
+            rng = random.Random(seed)
+            client = Client(HTTP_HOST='localhost')
+            latencies = []
+            events = 0
+            while time.perf_counter() < deadline:
+                batch = rng.choices(cctv_ids, cum_weights=cum_weights, k=options['batch'])
+                body = {'cctvIds': batch} if len(batch) > 1 else {'cctvId': batch[0]}
+                start = time.perf_counter()
+                response = client.post('/api/cctv/views/', json.dumps(body), content_type='application/json')
+                latencies.append((time.perf_counter() - start) * 1000)
+                if response.status_code == 202:
+                    events += len(batch)
+            results.append((latencies, events))
+
+        threads = [threading.Thread(target=worker, args=(options['seed'] + i,)) for i in range(options['threads'])]
+        start = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+
+        view_events.flush()
+        latencies = sorted(ms for thread_latencies, _ in results for ms in thread_latencies)
+        events = sum(count for _, count in results)
+        metrics = view_events.metrics()
+
+        self.stdout.write(f"요청 {len(latencies):,}회, 이벤트 {events:,}건, {elapsed:.1f}초 "
+                          f"→ {events / elapsed:,.0f}이벤트/초 ({options['threads']}스레드)")
+        self.stdout.write(f"요청 지연: p50 {latencies[len(latencies) // 2]:.2f}ms, "
+                          f"p99 {latencies[int(len(latencies) * 0.99)]:.2f}ms, 최대 {latencies[-1]:.2f}ms")
+        self.stdout.write(f"flush {metrics['flushes']}회 (마지막 {metrics['lastFlushSeconds']}초, "
+                          f"{metrics['lastFlushRows']:,}행), 실패 {metrics['flushErrors']}회, "
+                          f"DB 행 {before_rows:,} → {CCTVViewCount.objects.count():,}")
+        self.stdout.write(f"지금 많이 보는 CCTV: {view_events.most_watched(5)}")
@@ -0,0 +1,30 @@
+# Generated by Django 5.0 on 2026-10-18 07:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CCTVViewCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('cctv_id', models.CharField(max_length=64)),
+                ('hour', models.DateTimeField()),
+                ('count', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['hour'], name='cctvviewcount_hour_idx')],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='cctvviewcount',
+            constraint=models.UniqueConstraint(fields=('cctv_id', 'hour'), name='cctvviewcount_cctv_hour_uniq'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+from django.db import models
+
+
+class CCTVViewCount(models.Model):
+    """CCTV별 시간당 조회(플레이어 열기) 수 (버퍼에서 미리 합산한 값을 upsert로 누적)"""
+
+    cctv_id = models.CharField(max_length=64)
+    hour = models.DateTimeField()
+    count = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['cctv_id', 'hour'], name='cctvviewcount_cctv_hour_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['hour'], name='cctvviewcount_hour_idx'),
+        ]
@@ -0,0 +1,109 @@
+"""
+CCTV 조회 이벤트 테스트 (SQLite로 실행: DJANGO_DB_ENGINE=sqlite python manage.py test view_stats)
+"""
+import json
+from types import SimpleNamespace
+from unittest import mock
+
+from django.test import TestCase
+
+from .buffer import TrendingWindow, ViewEventBuffer, floor_hour, upsert_counts
+from .models import CCTVViewCount
+
+# 2026-01-05 12:00:00 (UTC)
+NOW = 1767614400.0
+HOUR = floor_hour(NOW)
+
+
+def stored_counts():
+    return {
+        (cctv_id, hour): count
+        for cctv_id, hour, count in CCTVViewCount.objects.values_list('cctv_id', 'hour', 'count')
+    }
+
+
+class UpsertTests(TestCase):
+    def test_upsert_matches_orm_rows(self):
+        CCTVViewCount.objects.create(cctv_id='C', hour=HOUR, count=2)
+        self.assertEqual(upsert_counts({('C', HOUR): 3, ('D', HOUR): 1}), 2)
+        self.assertEqual(stored_counts(), {('C', HOUR): 5, ('D', HOUR): 1})
+
+    def test_counts_accumulate_across_flushes(self):
+        buffer = ViewEventBuffer(autostart=False)
+        buffer.add_many(['A', 'A', 'B'], now=NOW)
+        self.assertEqual(buffer.flush(), 2)
+        buffer.add_many(['A'], now=NOW + 60)
+        buffer.add_many(['A'], now=NOW + 3600)
+        self.assertEqual(buffer.flush(), 2)
+        self.assertEqual(buffer.flush(), 0)
+
+        next_hour = floor_hour(NOW + 3600)
+        self.assertEqual(stored_counts(), {('A', HOUR): 3, ('B', HOUR): 1, ('A', next_hour): 1})
+        self.assertEqual(buffer.metrics()['rowsWritten'], 4)
+
+    def test_failed_write_restores_pending_counts(self):
+        buffer = ViewEventBuffer(write=mock.Mock(side_effect=RuntimeError('db down')), autostart=False)
+        buffer.add_many(['A', 'A'], now=NOW)
+        with self.assertRaises(RuntimeError):
+            buffer.flush()
+        buffer.add_many(['A'], now=NOW)
+
+        metrics = buffer.metrics()
+        self.assertEqual(metrics['flushErrors'], 1)
+        self.assertEqual(metrics['pendingKeys'], 1)
+
+        buffer.write = upsert_counts
+        self.assertEqual(buffer.flush(), 1)
+        self.assertEqual(stored_counts(), {('A', HOUR): 3})
+
+
+class TrendingWindowTests(TestCase):
+    def test_expires_buckets_outside_window(self):
+        trending = TrendingWindow(window=120)
+        trending.add('A', 2, NOW + 30)
+        trending.add('B', 1, NOW + 100)
+        trending.add('A', 1, NOW + 100)
+        self.assertEqual(trending.top(10, NOW + 179), [('A', 3), ('B', 1)])
+        # 첫 버킷(NOW ~ NOW+60)이 창(최근 120초)을 완전히 벗어남
+        self.assertEqual(trending.top(10, NOW + 180), [('A', 1), ('B', 1)])
+        self.assertEqual(trending.top(10, NOW + 240), [])
+
+
+class ViewEventViewTests(TestCase):
+    url = '/api/cctv/views/'
+
+    def setUp(self):
+        self.buffer = ViewEventBuffer(write=mock.Mock(return_value=0), autostart=False)
+        self.dataset = SimpleNamespace(offsets={'A': 0, 'B': 1}, records=[{'cctvname': 'a'}, {'cctvname': 'b'}])
+        self.store = mock.Mock()
+        self.store.get.return_value = self.dataset
+        for target, value in (('view_events', self.buffer), ('cctv_store', self.store)):
+            patcher = mock.patch(f'view_stats.views.{target}', value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def post(self, body):
+        return self.client.post(self.url, json.dumps(body), content_type='application/json')
+
+    def test_invalid_bodies(self):
+        for body in ({}, {'cctvIds': []}, {'cctvIds': 'A'}, {'cctvId': 1}, {'cctvIds': ['A', None]},
+                     {'cctvIds': ['']}, {'cctvIds': ['A'] * 101}):
+            with self.subTest(body=body):
+                self.assertEqual(self.post(body).status_code, 400)
+        self.assertEqual(self.buffer.metrics()['events'], 0)
+
+    def test_unknown_ids(self):
+        self.assertEqual(self.post({'cctvIds': ['X', 'Y']}).status_code, 404)
+        response = self.post({'cctvIds': ['A', 'X']})
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.json(), {'accepted': 1})
+
+    def test_data_not_loaded(self):
+        self.store.get.return_value = None
+        self.assertEqual(self.post({'cctvId': 'A'}).status_code, 503)
+        self.assertEqual(self.buffer.metrics()['events'], 0)
+
+    def test_most_watched(self):
+        self.post({'cctvIds': ['B', 'B', 'A']})
+        response = self.client.get('/api/cctv/views/most-watched/', {'limit': 1})
+        self.assertEqual(response.json()['results'], [{'cctvId': 'B', 'views': 2, 'cctvname': 'b'}])
@@ -0,0 +1,9 @@
+from django.urls import path
+
+from . import views
+
+urlpatterns = [
+    path('', views.view_event),
+    path('most-watched/', views.most_watched),
+    path('metrics/', views.view_event_metrics),
+]
@@ -0,0 +1,69 @@
+import json
+
+from django.conf import settings
+from django.http import JsonResponse
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_GET, require_POST
+
+from cctv.store import cctv_store
+
+from .buffer import view_events
+
+
+@csrf_exempt
+@require_POST
+def view_event(request):
+    """플레이어 열기 이벤트 기록 (버퍼에만 쌓고 즉시 202 응답)
+
+    POST {"cctvId": "..."} 또는 {"cctvIds": [...]} (여러 이벤트 한 번에)
+    """
+    try:
+        body = json.loads(request.body)
+        cctv_ids = body['cctvIds'] if 'cctvIds' in body else [body['cctvId']]
+    except (ValueError, KeyError, TypeError):
+        return JsonResponse({'error': 'Missing required parameters: cctvId'}, status=400)
+
+    if not isinstance(cctv_ids, list) or not cctv_ids:
+        return JsonResponse({'error': 'Missing required parameters: cctvId'}, status=400)
+    if not all(isinstance(cctv_id, str) and cctv_id for cctv_id in cctv_ids):
+        return JsonResponse({'error': 'cctvId must be a non-empty string'}, status=400)
+    if len(cctv_ids) > settings.VIEW_EVENTS_MAX_BATCH:
+        return JsonResponse({'error': f'Too many events (max {settings.VIEW_EVENTS_MAX_BATCH})'}, status=400)
+
+    # 임의의 ID로 카운터 키가 늘어나지 않도록 현재 CCTV 데이터에 있는 ID만 기록
+    # (데이터가 없으면 검증할 수 없으므로 버퍼에 쌓지 않음)
+    dataset = cctv_store.get()
+    if dataset is None:
+        return JsonResponse({'error': 'CCTV data not loaded'}, status=503)
+    cctv_ids = [cctv_id for cctv_id in cctv_ids if cctv_id in dataset.offsets]
+    if not cctv_ids:
+        return JsonResponse({'error': 'CCTV not found'}, status=404)
+
+    view_events.add_many(cctv_ids)
+    return JsonResponse({'accepted': len(cctv_ids)}, status=202)
+
+
+@require_GET
+def most_watched(request):
+    """최근 VIEW_EVENTS_TRENDING_WINDOW초 동안 많이 본 CCTV (이 워커의 메모리 집계)"""
+    try:
+        limit = min(int(request.GET.get('limit', settings.VIEW_EVENTS_TRENDING_DEFAULT_LIMIT)),
+                    settings.VIEW_EVENTS_TRENDING_MAX_LIMIT)
+    except ValueError:
+        return JsonResponse({'error': 'Invalid limit parameter'}, status=400)
+
+    dataset = cctv_store.get()
+    results = []
+    for cctv_id, views in view_events.most_watched(max(limit, 1)):
+        entry = {'cctvId': cctv_id, 'views': views}
+        if dataset is not None and cctv_id in dataset.offsets:
+            entry['cctvname'] = dataset.records[dataset.offsets[cctv_id]].get('cctvname')
+        results.append(entry)
+
+    return JsonResponse({'window': settings.VIEW_EVENTS_TRENDING_WINDOW, 'results': results})
+
+
+@require_GET
+def view_event_metrics(request):
+    """이벤트 수, flush 횟수/시간, 대기 중인 카운터 키 수"""
+    return JsonResponse(view_events.metrics())
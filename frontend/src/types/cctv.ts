@@ -20,6 +20,7 @@ export interface CCTVInfo {
   cctvresolution: string;
   roadsectionid: string;
   filecreatetime: string;
+  cctvId?: string; // 고유 ID (도로 타입 + 이름 + 좌표 기반, 갱신 간 유지)
   // 교통정보 매핑 필드 (선택적)
   linkId?: string; // 노드링크 linkId
   linkRoadName?: string; // 링크 도로명
@@ -0,0 +1,335 @@
+"""
+데이터 파이프라인 벤치마크
+
+가상 노드링크 Shapefile(MOCT 형식)과 가상 CCTV 데이터를 생성해
+Shapefile 로드 → 캐시 로드 → 범위 제한 로드 → 공간 인덱스 생성 → 매칭 → 저장 단계의 소요 시간과 최대 메모리를 측정합니다.
+네트워크 접근 없이 동작하며, 결과는 JSON으로 저장해 기준선(baseline)과 비교할 수 있습니다.
+
+사용법:
+    python benchmark_pipeline.py                       # small 크기
+    python benchmark_pipeline.py --preset all          # 10k~500k 링크 전체
+    python benchmark_pipeline.py --links 200000 --cctv 20000
+    python benchmark_pipeline.py --save-baseline       # 결과를 기준선으로 저장
+    python benchmark_pipeline.py --baseline            # 기준선과 비교 (느려지면 종료 코드 1)
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+try:
+    import geopandas as gpd
+    import numpy as np
+    import shapely
+    HAS_GEOPANDAS = True
+except ImportError:
+    HAS_GEOPANDAS = False
+
+from instrumentation import StageRecorder
+from map_cctv_to_traffic import build_cctv_extent, load_nodelink_shapefile, map_links_to_cctv_data, save_result
+from paths import BENCHMARK_BASELINE_FILE, BENCHMARK_RESULT_FILE
+
+BENCHMARK_VERSION = 1
+
+# 프리셋: (링크 수, CCTV 수)
+SIZE_PRESETS = {
+    'small': (10_000, 1_000),
+    'medium': (100_000, 10_000),
+    'large': (500_000, 50_000),
+}
+
+# 대한민국 대략적 범위 (EPSG:4326)
+KOREA_BOUNDS = (126.0, 33.2, 129.6, 38.6)
+
+# 원본 MOCT_LINK와 같은 좌표계 (Korea 2000 / Unified CS) - 로드 시 재투영 비용까지 측정
+SOURCE_CRS = 'EPSG:5179'
+
+ROAD_NAMES = ['경부고속도로', '서해안고속도로', '영동고속도로', '중부내륙고속도로', '국도1호선',
+              '국도3호선', '국도7호선', '국도17호선', '국도38호선', '국도77호선', '']
+
+# 기준선 대비 이 비율 이상 느려지거나 메모리가 늘면 회귀로 판단
+DEFAULT_THRESHOLD = 1.25
+
+# 이 값(초/MB)보다 작은 차이는 측정 오차로 보고 무시
+MIN_TIME_DELTA_SEC = 0.05
+MIN_MEMORY_DELTA_MB = 16
+
+
+def run_stage(recorder, name, fn, items=None):
+    """단계 실행 후 결과 반환 (시간/메모리는 recorder에 기록)"""
+    gc.collect()
+    with recorder.stage(name, items=items):
+        return fn()
+
+
+def generate_synthetic_links(link_count, seed=0):
+    """MOCT_LINK 형식의 가상 링크 레이어 (LINK_ID, ROAD_NAME, 2~4점 LineString, EPSG:5179)"""
+    rng = np.random.default_rng(seed)
+    min_x, min_y, max_x, max_y = KOREA_BOUNDS
+
+    # 링크 시작점 + 약 50~300m 길이의 꺾인 선분
+    vertex_count = rng.integers(2, 5, size=link_count)
+    start_x = rng.uniform(min_x, max_x, size=link_count)
+    start_y = rng.uniform(min_y, max_y, size=link_count)
+
+    total = int(vertex_count.sum())
+    steps = rng.normal(0, 0.001, size=(total, 2))
+    owner = np.repeat(np.arange(link_count), vertex_count)
+    first = np.concatenate([[0], np.cumsum(vertex_count)[:-1]])
+    steps[first] = 0
+    coords = np.cumsum(steps, axis=0)
+    # 링크별 누적값 초기화 후 시작점 더하기
+    coords -= np.repeat(coords[first], vertex_count, axis=0)
+    coords[:, 0] += start_x[owner]
+    coords[:, 1] += start_y[owner]
+
+    geometry = shapely.linestrings(coords, indices=owner)
+    link_ids = [f"{n:010d}" for n in rng.choice(9_000_000_000, size=link_count, replace=False) + 1_000_000_000]
+    road_names = rng.choice(ROAD_NAMES, size=link_count)
+
+    gdf = gpd.GeoDataFrame(
+        {'LINK_ID': link_ids, 'ROAD_NAME': road_names, 'LANES': rng.integers(1, 6, size=link_count)},
+        geometry=geometry,
+        crs='EPSG:4326',
+    )
+    return gdf.to_crs(SOURCE_CRS)
+
+
+def generate_synthetic_cctv(cctv_count, links_gdf, seed=0, near_ratio=0.8):
+    """API 응답 형식의 가상 CCTV 데이터 (near_ratio 비율은 링크 근처, 나머지는 임의 위치)"""
+    rng = np.random.default_rng(seed + 1)
+    min_x, min_y, max_x, max_y = KOREA_BOUNDS
+
+    near_count = int(cctv_count * near_ratio)
+    links = links_gdf.to_crs(epsg=4326).geometry.to_numpy()
+    picked = links[rng.integers(0, len(links), size=near_count)]
+    anchors = shapely.get_coordinates(shapely.get_point(picked, 0))
+    anchors += rng.normal(0, 0.0005, size=anchors.shape)
+
+    random_points = np.column_stack([
+        rng.uniform(min_x, max_x, size=cctv_count - near_count),
+        rng.uniform(min_y, max_y, size=cctv_count - near_count),
+    ])
+    points = np.vstack([anchors, random_points])
+
+    cctv_list = [
+        {
+            'roadsectionid': '',
+            'coordx': round(float(x), 6),
+            'coordy': round(float(y), 6),
+            'cctvresolution': '',
+            'filecreatetime': '',
+            'cctvtype': 1,
+            'cctvformat': 'HLS',
+            'cctvname': f"[가상] CCTV {i}",
+            'cctvurl': f"http://example.invalid/cctv/{i}/playlist.m3u8",
+            'roadType': 'ex' if i % 3 == 0 else 'its',
+        }
+        for i, (x, y) in enumerate(points)
+    ]
+    return {'response': {'coordtype': 1, 'datacount': len(cctv_list), 'data': cctv_list}}
+
+
+def run_case(name, link_count, cctv_count, seed, work_dir):
+    """한 크기 조합의 전체 단계 측정"""
+    print(f"\n[{name}] 링크 {link_count:,}개 / CCTV {cctv_count:,}개")
+    print("-" * 60)
+    recorder = StageRecorder(f"benchmark.{name}")
+    case_dir = Path(work_dir) / name
+    case_dir.mkdir(parents=True, exist_ok=True)
+    shapefile_path = case_dir / 'MOCT_LINK.shp'
+
+    def generate():
+        links = generate_synthetic_links(link_count, seed)
+        links.to_file(shapefile_path, encoding='cp949')
+        return generate_synthetic_cctv(cctv_count, links, seed)
+
+    cctv_data = run_stage(recorder, 'generate', generate, link_count + cctv_count)
+
+    # Shapefile 파싱 + 재투영 + 캐시 저장 (첫 실행 경로)
+    run_stage(recorder, 'load_shapefile',
+              lambda: load_nodelink_shapefile(shapefile_path, rebuild_cache=True), link_count)
+    # 캐시 적중 경로 (이후 실행)
+    links_gdf = run_stage(recorder, 'load_cache',
+                          lambda: load_nodelink_shapefile(shapefile_path), link_count)
+    # CCTV 주변 링크만 읽는 경로 (--prune-nodelink, 캐시 미사용)
+    run_stage(recorder, 'load_pruned',
+              lambda: load_nodelink_shapefile(shapefile_path, use_cache=False,
+                                              extent=build_cctv_extent(cctv_data['response']['data'])),
+              link_count)
+    run_stage(recorder, 'build_sindex', lambda: links_gdf.sindex, link_count)
+    matched = run_stage(recorder, 'match',
+                        lambda: map_links_to_cctv_data(cctv_data, links_gdf), cctv_count)
+    run_stage(recorder, 'save_result',
+              lambda: save_result(cctv_data, case_dir / 'cctv-data-with-links.json', compact=True),
+              cctv_count)
+
+    stages = {}
+    for record in recorder.records:
+        stage = record.to_dict()
+        del stage['name'], stage['status'], stage['profile']
+        stages[record.name] = stage
+
+    return {
+        'name': name,
+        'links': link_count,
+        'cctv': cctv_count,
+        'matched': matched,
+        'stages': stages,
+    }
+
+
+def get_environment():
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpuCount': os.cpu_count(),
+        'geopandas': gpd.__version__,
+        'shapely': shapely.__version__,
+        'numpy': np.__version__,
+    }
+
+
+def compare_with_baseline(result, baseline, threshold=DEFAULT_THRESHOLD):
+    """기준선 대비 단계별 시간/메모리 비율 비교 → 회귀 목록"""
+    baseline_cases = {case['name']: case for case in baseline.get('cases', [])}
+    regressions = []
+
+    print(f"\n기준선 비교 (임계값 {threshold:.2f}배)")
+    print("-" * 60)
+    for case in result['cases']:
+        base_case = baseline_cases.get(case['name'])
+        if base_case is None:
+            print(f"  [{case['name']}] 기준선 없음 - 건너뜀")
+            continue
+        if (base_case['links'], base_case['cctv']) != (case['links'], case['cctv']):
+            print(f"  [{case['name']}] 크기 불일치 - 건너뜀")
+            continue
+
+        for stage, current in case['stages'].items():
+            base = base_case['stages'].get(stage)
+            if base is None:
+                continue
+            time_ratio = current['wallSec'] / max(base['wallSec'], 1e-9)
+            memory_ratio = current['rssDeltaMb'] / max(base['rssDeltaMb'], 1.0)
+            slow = (time_ratio > threshold
+                    and current['wallSec'] - base['wallSec'] > MIN_TIME_DELTA_SEC)
+            heavy = (memory_ratio > threshold
+                     and current['rssDeltaMb'] - base['rssDeltaMb'] > MIN_MEMORY_DELTA_MB)
+            mark = '⚠️ ' if slow or heavy else '  '
+            print(f"  {mark}[{case['name']}] {stage:<16} 시간 {time_ratio:>5.2f}배  메모리 {memory_ratio:>5.2f}배")
+            if slow or heavy:
+                regressions.append({
+                    'case': case['name'],
+                    'stage': stage,
+                    'timeRatio': round(time_ratio, 3),
+                    'memoryRatio': round(memory_ratio, 3),
+                })
+
+    return regressions
+
+
+def save_json(data, path):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def parse_args():
+    """커맨드라인 인자 파싱"""
+    parser = argparse.ArgumentParser(description='데이터 파이프라인 벤치마크 (가상 데이터)')
+    parser.add_argument(
+        '--preset',
+        choices=[*SIZE_PRESETS, 'all'],
+        default='small',
+        help='측정 크기 (small=10k/1k, medium=100k/10k, large=500k/50k, all=전체)'
+    )
+    parser.add_argument('--links', type=int, help='링크 수 직접 지정 (--cctv와 함께 사용)')
+    parser.add_argument('--cctv', type=int, help='CCTV 수 직접 지정 (--links와 함께 사용)')
+    parser.add_argument('--seed', type=int, default=0, help='가상 데이터 난수 시드')
+    parser.add_argument(
+        '--output',
+        type=Path,
+        default=BENCHMARK_RESULT_FILE,
+        help=f'결과 JSON 경로 (기본: {BENCHMARK_RESULT_FILE.name})'
+    )
+    parser.add_argument(
+        '--baseline',
+        nargs='?',
+        type=Path,
+        const=BENCHMARK_BASELINE_FILE,
+        help='기준선 JSON과 비교 (경로 생략 시 기본 기준선), 회귀 시 종료 코드 1'
+    )
+    parser.add_argument('--save-baseline', action='store_true', help='이번 결과를 기준선으로 저장')
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=DEFAULT_THRESHOLD,
+        help=f'회귀 판단 비율 (기본: {DEFAULT_THRESHOLD})'
+    )
+    args = parser.parse_args()
+    if (args.links is None) != (args.cctv is None):
+        parser.error('--links와 --cctv는 함께 지정해야 합니다')
+    return args
+
+
+def main():
+    args = parse_args()
+
+    if not HAS_GEOPANDAS:
+        print("❌ geopandas가 필요합니다: pip install -r requirements.txt")
+        return 1
+
+    if args.links is not None:
+        cases = {f"custom-{args.links}-{args.cctv}": (args.links, args.cctv)}
+    elif args.preset == 'all':
+        cases = SIZE_PRESETS
+    else:
+        cases = {args.preset: SIZE_PRESETS[args.preset]}
+
+    print("=" * 60)
+    print("데이터 파이프라인 벤치마크")
+    print("=" * 60)
+
+    result = {
+        'version': BENCHMARK_VERSION,
+        'createdAt': datetime.now().isoformat(timespec='seconds'),
+        'seed': args.seed,
+        'environment': get_environment(),
+        'cases': [],
+    }
+
+    with tempfile.TemporaryDirectory(prefix='cctv-bench-') as work_dir:
+        for name, (link_count, cctv_count) in cases.items():
+            result['cases'].append(run_case(name, link_count, cctv_count, args.seed, work_dir))
+
+    save_json(result, args.output)
+    print(f"\n결과 저장: {args.output}")
+
+    if args.save_baseline:
+        save_json(result, BENCHMARK_BASELINE_FILE)
+        print(f"기준선 저장: {BENCHMARK_BASELINE_FILE}")
+
+    if args.baseline:
+        if not args.baseline.exists():
+            print(f"❌ 기준선 파일이 없습니다: {args.baseline}")
+            return 1
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_with_baseline(result, baseline, args.threshold)
+        if regressions:
+            print(f"\n❌ 성능 회귀 {len(regressions)}건")
+            return 1
+        print("\n✅ 기준선 대비 회귀 없음")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
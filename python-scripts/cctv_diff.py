@@ -0,0 +1,89 @@
+"""
+CCTV 데이터 변경분 비교 모듈
+
+새로 받은 CCTV 목록을 기존 linkId 매핑 결과와 비교하여
+변경되지 않은 CCTV는 매핑 결과를 그대로 가져오고, 추가/이동된 CCTV만 골라냅니다.
+
+기존 결과가 어떤 노드링크로 매핑되었는지는 response.nodelinkFingerprint에 기록되며,
+현재 노드링크와 다르면(원본 교체, 매칭 로직 변경, 노드링크 없이 만든 결과) 호출 측에서 전체 매핑합니다.
+"""
+
+import json
+from collections import Counter
+
+# 재사용 대상 매핑 필드
+LINK_FIELDS = ['linkId', 'linkRoadName', 'linkDistance']
+
+
+def get_cctv_key(cctv):
+    """동일 CCTV 판단 기준 (도로 타입 + 이름 + 좌표)"""
+    return (cctv.get('roadType'), cctv.get('cctvname'), float(cctv['coordx']), float(cctv['coordy']))
+
+
+def get_cctv_name_key(cctv):
+    """이동 판단 기준 (도로 타입 + 이름)"""
+    return (cctv.get('roadType'), cctv.get('cctvname'))
+
+
+def load_previous_cctv_list(links_file):
+    """기존 linkId 매핑 결과 로드 → (CCTV 목록, 매핑에 쓴 노드링크 식별값) (파일이 없으면 (None, None))"""
+    if not links_file.exists():
+        return None, None
+
+    with open(links_file, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    return data['response'].get('data') or [], data['response'].get('nodelinkFingerprint')
+
+
+def diff_cctv_list(new_list, previous_list, remap_unlinked=False):
+    """새 CCTV 목록과 기존 매핑 결과 비교
+
+    변경 없는 CCTV에는 기존 linkId/linkRoadName/linkDistance를 복사하고,
+    linkId 매핑이 필요한 CCTV(추가/이동)만 반환합니다.
+    remap_unlinked: 변경 없지만 linkId가 없는 CCTV도 매핑 대상에 포함 (노드링크를 쓸 수 있을 때)
+
+    반환: (매핑 대상 목록, {'added', 'removed', 'moved', 'unchanged', 'unlinked'})
+    """
+    previous_by_key = {get_cctv_key(cctv): cctv for cctv in previous_list}
+    new_keys = {get_cctv_key(cctv) for cctv in new_list}
+
+    # 좌표가 맞지 않는 기존 CCTV (이동 또는 삭제 후보)
+    unmatched_previous = Counter(
+        get_cctv_name_key(cctv) for key, cctv in previous_by_key.items() if key not in new_keys
+    )
+
+    to_map = []
+    summary = {'added': 0, 'removed': 0, 'moved': 0, 'unchanged': 0, 'unlinked': 0}
+
+    for cctv in new_list:
+        previous = previous_by_key.get(get_cctv_key(cctv))
+        if previous is not None:
+            for field in LINK_FIELDS:
+                if field in previous:
+                    cctv[field] = previous[field]
+            summary['unchanged'] += 1
+            if remap_unlinked and not cctv.get('linkId'):
+                summary['unlinked'] += 1
+                to_map.append(cctv)
+            continue
+
+        name_key = get_cctv_name_key(cctv)
+        if unmatched_previous[name_key] > 0:
+            unmatched_previous[name_key] -= 1
+            summary['moved'] += 1
+        else:
+            summary['added'] += 1
+        to_map.append(cctv)
+
+    summary['removed'] = sum(unmatched_previous.values())
+    return to_map, summary
+
+
+def print_diff_summary(summary):
+    """변경분 요약 출력"""
+    print(
+        f"  추가: {summary['added']:,}개 / 삭제: {summary['removed']:,}개 / "
+        f"이동: {summary['moved']:,}개 / 유지: {summary['unchanged']:,}개"
+    )
+    if summary['unlinked']:
+        print(f"  유지 중 linkId 없음: {summary['unlinked']:,}개 (다시 매핑)")
@@ -0,0 +1,121 @@
+"""
+CCTV 고유 ID 생성 모듈
+
+도로 타입 + 정규화된 이름 + 양자화된 좌표로 결정적(deterministic) ID를 만들어
+갱신 간에도 카메라가 움직이지 않으면 같은 ID가 유지되도록 합니다.
+"""
+
+import hashlib
+import json
+import re
+import unicodedata
+from pathlib import Path
+
+ID_INDEX_VERSION = 1
+
+# ID 생성용 좌표 양자화 자릿수 (4자리 ≈ 11m, 좌표 미세 변동 흡수)
+ID_COORD_PRECISION = 4
+
+ID_HASH_LENGTH = 10
+
+
+def normalize_name(name):
+    """이름 정규화 (유니코드 정규화, 공백 정리, 소문자)"""
+    name = unicodedata.normalize('NFKC', name or '')
+    return re.sub(r'\s+', ' ', name).strip().lower()
+
+
+def get_base_id(cctv):
+    """충돌 처리 전 기본 ID (예: 'ex-1a2b3c4d5e')"""
+    road_type = cctv.get('roadType') or 'unknown'
+    key = '|'.join([
+        road_type,
+        normalize_name(cctv.get('cctvname')),
+        f"{float(cctv['coordx']):.{ID_COORD_PRECISION}f}",
+        f"{float(cctv['coordy']):.{ID_COORD_PRECISION}f}",
+    ])
+    return f"{road_type}-{hashlib.sha1(key.encode('utf-8')).hexdigest()[:ID_HASH_LENGTH]}"
+
+
+def collision_sort_key(cctv):
+    """기본 ID가 겹칠 때 접미사 순서를 정하는 키 (원본 좌표/이름)"""
+    return (
+        float(cctv['coordx']), float(cctv['coordy']), cctv.get('cctvname') or '', cctv.get('roadsectionid') or ''
+    )
+
+
+def suffixed_id(base_id, n):
+    return base_id if n == 1 else f"{base_id}-{n}"
+
+
+def assign_cctv_ids(cctv_list):
+    """각 CCTV에 cctvId 부여 (레코드를 직접 수정)
+
+    기본 ID가 겹치면 원본 좌표/이름 순으로 정렬해 '-2', '-3' 접미사를 붙입니다.
+    반환: 충돌로 접미사가 붙은 CCTV 수
+    """
+    groups = {}
+    for cctv in cctv_list:
+        groups.setdefault(get_base_id(cctv), []).append(cctv)
+
+    collisions = 0
+    for base_id, group in groups.items():
+        if len(group) > 1:
+            group.sort(key=collision_sort_key)
+        for n, cctv in enumerate(group, 1):
+            cctv['cctvId'] = suffixed_id(base_id, n)
+            collisions += n > 1
+
+    return collisions
+
+
+def iter_assign_cctv_ids(cctv_iter, stats=None, renames=None):
+    """CCTV 스트림에 cctvId 부여 (스트리밍 파이프라인용)
+
+    전체 목록을 볼 수 없으므로 기본 ID가 겹치면 우선 도착 순서대로 '-2', '-3' 접미사를 붙이고,
+    스트림이 끝나면 assign_cctv_ids와 같은 (정렬 기준) 접미사가 되도록 renames에 {임시 ID: 최종 ID}를 채웁니다.
+    호출 측은 저장한 레코드에 renames를 적용해야 배치 모드와 같은 ID가 됩니다.
+    메모리는 기본 ID별 개수와 첫 레코드의 정렬 키만 유지합니다.
+    stats: {'collisions': n}을 갱신할 dict (선택)
+    """
+    seen = {}
+    first_keys = {}
+    groups = {}  # 충돌한 기본 ID → [(정렬 키, 도착 순번)]
+    for cctv in cctv_iter:
+        base_id = get_base_id(cctv)
+        n = seen.get(base_id, 0) + 1
+        seen[base_id] = n
+        if n == 1:
+            first_keys[base_id] = collision_sort_key(cctv)
+        else:
+            group = groups.setdefault(base_id, [(first_keys[base_id], 1)])
+            group.append((collision_sort_key(cctv), n))
+            if stats is not None:
+                stats['collisions'] = stats.get('collisions', 0) + 1
+        cctv['cctvId'] = suffixed_id(base_id, n)
+        yield cctv
+
+    if renames is not None:
+        for base_id, group in groups.items():
+            # 정렬 키가 같으면 도착 순서 유지 (assign_cctv_ids의 안정 정렬과 동일)
+            for rank, (_, n) in enumerate(sorted(group), 1):
+                if rank != n:
+                    renames[suffixed_id(base_id, n)] = suffixed_id(base_id, rank)
+
+
+def write_id_index(data, output_path):
+    """cctvId → 레코드 위치(response.data 배열 offset) 인덱스 파일 저장"""
+    if isinstance(output_path, str):
+        output_path = Path(output_path)
+
+    cctv_list = data['response'].get('data') or []
+    index = {
+        'version': ID_INDEX_VERSION,
+        'count': len(cctv_list),
+        'ids': {cctv['cctvId']: offset for offset, cctv in enumerate(cctv_list) if 'cctvId' in cctv},
+    }
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+    print(f"  ID 인덱스 저장: {output_path.name} ({len(index['ids']):,}개)")
+    return index
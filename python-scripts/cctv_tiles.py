@@ -0,0 +1,128 @@
+"""
+CCTV 공간 타일 생성 모듈
+
+linkId가 매핑된 CCTV 데이터를 고정 줌 레벨의 지도 타일(z/x/y, Web Mercator 타일 규칙) 단위로 나눠 저장합니다.
+클라이언트는 화면 영역과 겹치는 타일만 받아 개별 캐시할 수 있습니다.
+"""
+
+import hashlib
+import json
+import math
+from pathlib import Path
+
+TILE_FORMAT_VERSION = 1
+
+# 기본 타일 줌 레벨 (10 ≈ 위도 37도 기준 약 31km 격자)
+DEFAULT_TILE_ZOOM = 10
+
+MANIFEST_FILE_NAME = 'manifest.json'
+
+HASH_LENGTH = 12
+
+
+def lonlat_to_tile(lon, lat, zoom):
+    """경위도 → 타일 좌표 (x, y)"""
+    n = 2 ** zoom
+    x = int((lon + 180.0) / 360.0 * n)
+    lat_rad = math.radians(lat)
+    y = int((1.0 - math.asinh(math.tan(lat_rad)) / math.pi) / 2.0 * n)
+    return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+
+def tile_to_bounds(x, y, zoom):
+    """타일 좌표 → 경위도 범위 [minX, minY, maxX, maxY]"""
+    n = 2 ** zoom
+
+    def tile_lat(ty):
+        return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * ty / n))))
+
+    return [x / n * 360.0 - 180.0, tile_lat(y + 1), (x + 1) / n * 360.0 - 180.0, tile_lat(y)]
+
+
+def group_by_tile(cctv_list, zoom):
+    """CCTV 목록을 타일 키('z/x/y')별로 분류"""
+    tiles = {}
+    for cctv in cctv_list:
+        x, y = lonlat_to_tile(float(cctv['coordx']), float(cctv['coordy']), zoom)
+        tiles.setdefault(f"{zoom}/{x}/{y}", []).append(cctv)
+    return tiles
+
+
+def _percentile(sorted_values, ratio):
+    if not sorted_values:
+        return 0
+    return sorted_values[min(len(sorted_values) - 1, int(len(sorted_values) * ratio))]
+
+
+def print_tile_report(manifest):
+    """타일 크기 분포 출력"""
+    tiles = manifest['tiles'].values()
+    sizes = sorted(tile['bytes'] for tile in tiles)
+    counts = sorted(tile['count'] for tile in tiles)
+    if not sizes:
+        print("  타일 없음")
+        return
+
+    print(f"  타일 {len(sizes):,}개 (줌 {manifest['zoom']}), 총 {sum(sizes) / 1024:,.0f}KB")
+    print(f"  {'':<10} {'최소':>8} {'중앙값':>8} {'p90':>8} {'최대':>8}")
+    print(f"  {'크기(KB)':<10} " + ' '.join(
+        f"{_percentile(sizes, r) / 1024:>8.1f}" for r in (0, 0.5, 0.9, 1.0)
+    ))
+    print(f"  {'CCTV 수':<10} " + ' '.join(
+        f"{_percentile(counts, r):>8,}" for r in (0, 0.5, 0.9, 1.0)
+    ))
+
+
+def write_cctv_tiles(data, output_dir, zoom=DEFAULT_TILE_ZOOM):
+    """CCTV 데이터를 타일 파일({z}/{x}/{y}.json)과 manifest로 저장
+
+    반환: manifest dict
+    """
+    if isinstance(output_dir, str):
+        output_dir = Path(output_dir)
+
+    cctv_list = data['response'].get('data') or []
+    tiles = group_by_tile(cctv_list, zoom)
+
+    manifest = {
+        'version': TILE_FORMAT_VERSION,
+        'zoom': zoom,
+        'coordtype': data['response'].get('coordtype'),
+        'count': len(cctv_list),
+        'tiles': {},
+    }
+    written = set()
+
+    for key in sorted(tiles):
+        items = tiles[key]
+        payload = json.dumps(
+            {'key': key, 'data': items},
+            ensure_ascii=False,
+            separators=(',', ':')
+        ).encode('utf-8')
+
+        tile_path = output_dir / f"{key}.json"
+        tile_path.parent.mkdir(parents=True, exist_ok=True)
+        tile_path.write_bytes(payload)
+        written.add(tile_path)
+
+        xs = [float(cctv['coordx']) for cctv in items]
+        ys = [float(cctv['coordy']) for cctv in items]
+        manifest['tiles'][key] = {
+            'count': len(items),
+            'bounds': [min(xs), min(ys), max(xs), max(ys)],
+            'hash': hashlib.sha256(payload).hexdigest()[:HASH_LENGTH],
+            'bytes': len(payload),
+        }
+
+    # 더 이상 CCTV가 없는 타일 및 다른 줌 레벨 타일 삭제
+    for path in output_dir.glob('*/*/*.json'):
+        if path not in written:
+            path.unlink()
+
+    with open(output_dir / MANIFEST_FILE_NAME, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    print(f"  타일 저장: {output_dir}")
+    print_tile_report(manifest)
+    return manifest
@@ -0,0 +1,102 @@
+"""
+CCTV 마커 클러스터 피라미드 생성 모듈
+
+지도 줌 레벨(Web Mercator)마다 화면 픽셀 격자 단위로 CCTV를 묶어 클러스터를 미리 계산합니다.
+낮은 줌에서 응답 크기/렌더링 비용이 CCTV 수가 아닌 화면 셀 수에 비례하게 됩니다.
+"""
+
+import json
+import math
+from pathlib import Path
+
+PYRAMID_FORMAT_VERSION = 1
+
+MIN_CLUSTER_ZOOM = 5
+MAX_CLUSTER_ZOOM = 14
+
+# 클러스터 셀 크기 (화면 픽셀) / 타일 크기 (픽셀)
+CLUSTER_CELL_PX = 64
+TILE_SIZE_PX = 256
+
+# 클러스터 배열의 필드 순서
+CLUSTER_FIELDS = ['x', 'y', 'count', 'minX', 'minY', 'maxX', 'maxY', 'ex', 'its']
+
+
+def lonlat_to_pixel(lon, lat, zoom):
+    """경위도 → 해당 줌의 전역 픽셀 좌표"""
+    world = TILE_SIZE_PX * (2 ** zoom)
+    lat = max(min(lat, 85.05112878), -85.05112878)
+    px = (lon + 180.0) / 360.0 * world
+    py = (1.0 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2.0 * world
+    return px, py
+
+
+def build_zoom_clusters(cctv_list, zoom, cell_px=CLUSTER_CELL_PX):
+    """한 줌 레벨의 격자 클러스터 목록 (CLUSTER_FIELDS 순서의 배열)"""
+    cells = {}
+    for cctv in cctv_list:
+        x, y = float(cctv['coordx']), float(cctv['coordy'])
+        px, py = lonlat_to_pixel(x, y, zoom)
+        key = (int(px // cell_px), int(py // cell_px))
+
+        cell = cells.get(key)
+        if cell is None:
+            cell = cells[key] = {'sx': 0.0, 'sy': 0.0, 'count': 0, 'minX': x, 'minY': y, 'maxX': x, 'maxY': y,
+                                 'ex': 0, 'its': 0}
+        cell['sx'] += x
+        cell['sy'] += y
+        cell['count'] += 1
+        cell['minX'] = min(cell['minX'], x)
+        cell['minY'] = min(cell['minY'], y)
+        cell['maxX'] = max(cell['maxX'], x)
+        cell['maxY'] = max(cell['maxY'], y)
+        road_type = cctv.get('roadType')
+        if road_type in ('ex', 'its'):
+            cell[road_type] += 1
+
+    clusters = []
+    for key in sorted(cells):
+        cell = cells[key]
+        clusters.append([
+            round(cell['sx'] / cell['count'], 6),
+            round(cell['sy'] / cell['count'], 6),
+            cell['count'],
+            round(cell['minX'], 6),
+            round(cell['minY'], 6),
+            round(cell['maxX'], 6),
+            round(cell['maxY'], 6),
+            cell['ex'],
+            cell['its'],
+        ])
+    return clusters
+
+
+def build_cluster_pyramid(data, min_zoom=MIN_CLUSTER_ZOOM, max_zoom=MAX_CLUSTER_ZOOM, cell_px=CLUSTER_CELL_PX):
+    """줌 레벨별 클러스터 피라미드 생성"""
+    cctv_list = data['response'].get('data') or []
+    return {
+        'version': PYRAMID_FORMAT_VERSION,
+        'cellPx': cell_px,
+        'minZoom': min_zoom,
+        'maxZoom': max_zoom,
+        'count': len(cctv_list),
+        'fields': CLUSTER_FIELDS,
+        'zooms': {
+            str(zoom): build_zoom_clusters(cctv_list, zoom, cell_px)
+            for zoom in range(min_zoom, max_zoom + 1)
+        },
+    }
+
+
+def write_cluster_pyramid(data, output_path, min_zoom=MIN_CLUSTER_ZOOM, max_zoom=MAX_CLUSTER_ZOOM):
+    """클러스터 피라미드를 JSON 파일로 저장"""
+    if isinstance(output_path, str):
+        output_path = Path(output_path)
+
+    pyramid = build_cluster_pyramid(data, min_zoom, max_zoom)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(pyramid, f, ensure_ascii=False, separators=(',', ':'))
+
+    counts = ', '.join(f"z{zoom}:{len(clusters):,}" for zoom, clusters in pyramid['zooms'].items())
+    print(f"  클러스터 저장: {output_path.name} ({counts})")
+    return pyramid
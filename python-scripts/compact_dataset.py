@@ -0,0 +1,168 @@
+"""
+CCTV 데이터 compact 아티팩트 생성 모듈
+
+프론트엔드 배포용으로 CCTV 데이터를 열(column) 단위 배열로 변환합니다.
+- 반복되는 문자열(cctvformat, filecreatetime 등)은 문자열 테이블 + 인덱스로 저장
+- 좌표는 고정 소수점 정수로 저장
+- 레코드에 없는 필드는 null
+- 내용 해시가 포함된 파일명으로 .json / .json.gz / .json.br 를 함께 저장
+"""
+
+import gzip
+import hashlib
+import json
+from pathlib import Path
+
+try:
+    import brotli
+    HAS_BROTLI = True
+except ImportError:
+    HAS_BROTLI = False
+
+COMPACT_FORMAT_VERSION = 1
+
+# 좌표 고정 소수점 자릿수 (6자리 ≈ 0.1m)
+COORD_PRECISION = 6
+COORD_FIELDS = ['coordx', 'coordy']
+
+# 값이 반복되어 문자열 테이블로 저장하는 필드
+INTERNED_FIELDS = [
+    'cctvformat',
+    'cctvresolution',
+    'filecreatetime',
+    'roadsectionid',
+    'roadType',
+    'linkRoadName',
+]
+
+HASH_LENGTH = 12
+
+# 레코드에 필드가 없음을 나타내는 내부 표식
+MISSING = object()
+
+
+def build_compact_dataset(data):
+    """응답 구조({'response': {...}})를 열 단위 compact 구조로 변환"""
+    cctv_list = data['response'].get('data') or []
+
+    # 레코드에 등장한 순서대로 필드 목록 구성
+    fields = []
+    for cctv in cctv_list:
+        for field in cctv:
+            if field not in fields:
+                fields.append(field)
+
+    scale = 10 ** COORD_PRECISION
+    tables = {}
+    columns = {}
+
+    for field in fields:
+        values = [cctv.get(field, MISSING) for cctv in cctv_list]
+
+        if field in COORD_FIELDS:
+            columns[field] = [None if v in (None, MISSING) else round(float(v) * scale) for v in values]
+        elif field in INTERNED_FIELDS:
+            table = []
+            index = {}
+            column = []
+            for value in values:
+                # 필드가 없는 레코드는 null (테이블 인덱스 없음)
+                if value is MISSING:
+                    column.append(None)
+                    continue
+                if value not in index:
+                    index[value] = len(table)
+                    table.append(value)
+                column.append(index[value])
+            tables[field] = table
+            columns[field] = column
+        else:
+            columns[field] = [None if v is MISSING else v for v in values]
+
+    return {
+        'version': COMPACT_FORMAT_VERSION,
+        'coordtype': data['response'].get('coordtype'),
+        'count': len(cctv_list),
+        'coordScale': scale,
+        'fields': fields,
+        'tables': tables,
+        'columns': columns,
+    }
+
+
+def expand_compact_dataset(compact):
+    """compact 구조를 원래 응답 구조로 복원 (검증용)"""
+    scale = compact['coordScale']
+    cctv_list = [{} for _ in range(compact['count'])]
+
+    for field in compact['fields']:
+        column = compact['columns'][field]
+        table = compact['tables'].get(field)
+        for cctv, value in zip(cctv_list, column):
+            # null은 필드 없음 (일반 필드는 원본 null과 구분하지 않음)
+            if value is None:
+                continue
+            if table is not None:
+                value = table[value]
+            elif field in COORD_FIELDS:
+                value = value / scale
+            cctv[field] = value
+
+    return {
+        'response': {
+            'coordtype': compact['coordtype'],
+            'datacount': compact['count'],
+            'data': cctv_list,
+        }
+    }
+
+
+def _remove_stale_artifacts(output_dir, stem, keep_names):
+    """이전 해시의 compact 아티팩트 삭제"""
+    for path in output_dir.glob(f"{stem}.compact.*.json*"):
+        if path.name not in keep_names:
+            path.unlink()
+
+
+def write_compact_artifact(data, output_path):
+    """원본 JSON 경로 옆에 compact 아티팩트와 사전 압축본 저장
+
+    반환: manifest dict (파일명, 해시, 크기)
+    """
+    if isinstance(output_path, str):
+        output_path = Path(output_path)
+
+    compact = build_compact_dataset(data)
+    payload = json.dumps(compact, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    content_hash = hashlib.sha256(payload).hexdigest()[:HASH_LENGTH]
+
+    stem = output_path.stem
+    output_dir = output_path.parent
+    json_path = output_dir / f"{stem}.compact.{content_hash}.json"
+
+    files = {json_path: payload}
+    # mtime=0: 같은 내용이면 같은 gz 바이트 (배포 캐시 유지)
+    files[json_path.with_name(json_path.name + '.gz')] = gzip.compress(payload, compresslevel=9, mtime=0)
+    if HAS_BROTLI:
+        files[json_path.with_name(json_path.name + '.br')] = brotli.compress(payload, quality=11)
+    else:
+        print("  ⚠️  brotli 미설치 - .br 파일 생략")
+
+    for path, content in files.items():
+        path.write_bytes(content)
+
+    _remove_stale_artifacts(output_dir, stem, {path.name for path in files})
+
+    manifest = {
+        'version': COMPACT_FORMAT_VERSION,
+        'hash': content_hash,
+        'count': compact['count'],
+        'files': {path.name: len(content) for path, content in files.items()},
+    }
+    manifest_path = output_dir / f"{stem}.compact-manifest.json"
+    with open(manifest_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, ensure_ascii=False, indent=2)
+
+    sizes = ' / '.join(f"{path.name.rsplit('.', 1)[-1]} {len(content) / 1024:,.0f}KB" for path, content in files.items())
+    print(f"  compact 저장: {json_path.name} ({sizes})")
+    return manifest
@@ -2,51 +2,246 @@
 CCTV 데이터 생성 통합 스크립트
 
 HTTP/HTTPS 버전의 CCTV 데이터를 생성하고 교통정보 linkId를 매핑합니다.
-update-cctv-data.py와 map-cctv-to-traffic.py를 순차 실행합니다.
+update-cctv-data.py로 모든 버전을 동시에 다운로드한 뒤 map-cctv-to-traffic.py로 매핑합니다.
 
 사용법:
     python generate-cctv-data.py          # HTTP + HTTPS 둘 다 생성
     python generate-cctv-data.py --http   # HTTP 버전만 생성
     python generate-cctv-data.py --https  # HTTPS 버전만 생성
+    python generate-cctv-data.py --tiles 4x4  # 전국 범위를 4x4 타일로 나눠 다운로드
+    python generate-cctv-data.py --incremental  # 추가/이동된 CCTV만 linkId 매핑
+    python generate-cctv-data.py --rebuild-nodelink-cache  # 노드링크 캐시 재생성
+    python generate-cctv-data.py --profile match  # 매칭 단계 cProfile 저장
+    python generate-cctv-data.py --stream  # 스트리밍 모드 (메모리 사용량 일정, NDJSON 출력)
+    python generate-cctv-data.py --prune-nodelink  # CCTV 주변 링크만 로드
+    python generate-cctv-data.py --persist-match-cache  # 링크 매칭 결과를 파일로 저장해 다음 실행에 재사용
 """
 
 import argparse
 import sys
+from pathlib import Path
 
 from paths import (
     CCTV_DATA_FILE,
     CCTV_DATA_WITH_LINKS_FILE,
     CCTV_DATA_HTTPS_FILE,
     CCTV_DATA_HTTPS_WITH_LINKS_FILE,
+    CCTV_TILES_DIR,
+    LINK_MATCH_CACHE_FILE,
+    REPORTS_DIR,
+    RUN_REPORT_FILE,
 )
 
 # 기존 모듈에서 함수 import
-from update_cctv_data import download_and_merge, get_api_key
-from map_cctv_to_traffic import load_nodelink_shapefile, map_links_to_cctv_data, save_result
+from update_cctv_data import download_all_and_merge, get_api_key, iter_merged_cctv, parse_grid
+from map_cctv_to_traffic import (
+    DEFAULT_MAX_DISTANCE_KM,
+    build_cctv_extent,
+    get_nodelink_fingerprint,
+    iter_map_links,
+    load_cctv_data,
+    load_nodelink_shapefile,
+    map_links_to_cctv_data,
+    map_links_to_cctv_list,
+    nodelink_available,
+    save_result,
+)
+from cctv_tiles import DEFAULT_TILE_ZOOM, write_cctv_tiles
+from cluster_pyramid import write_cluster_pyramid
+from cctv_id import write_id_index
+from compact_dataset import write_compact_artifact
+from search_index import write_search_index
+from cctv_diff import diff_cctv_list, load_previous_cctv_list, print_diff_summary
+from instrumentation import StageRecorder
+from link_match_cache import LinkMatchCache
+from ndjson_output import NdjsonWriter, convert_ndjson_to_json, rewrite_ndjson
+
+
+def get_links_for(cctv_list, get_links_gdf, match_cache=None):
+    """매핑에 노드링크가 필요할 때만 로드 (모든 좌표가 링크 매칭 캐시에 있으면 None)"""
+    if match_cache is not None:
+        coords = [(cctv['coordx'], cctv['coordy']) for cctv in cctv_list]
+        if not match_cache.count_missing(coords, DEFAULT_MAX_DISTANCE_KM):
+            print("  모든 좌표가 링크 매칭 캐시에 있음 - 노드링크 로드 생략")
+            return None
+    return get_links_gdf()
+
 
+def generate_version(cctv_type, cctv_data, data_file, links_file, get_links_gdf, incremental=False,
+                     tile_zoom=DEFAULT_TILE_ZOOM, recorder=None, match_cache=None, nodelink_fingerprint=None):
+    """특정 버전(HTTP/HTTPS) linkId 매핑 및 저장
 
-def generate_version(cctv_type, data_file, links_file, links_gdf):
-    """특정 버전(HTTP/HTTPS) 데이터 생성"""
+    get_links_gdf: 노드링크 데이터 로더 (매핑할 CCTV가 있을 때만 호출)
+    incremental: 기존 매핑 결과와 비교하여 추가/이동된 CCTV만 매핑
+        (기존 결과의 노드링크 식별값이 현재와 다르면 전체 매핑, linkId 없는 기존 CCTV는 다시 매핑)
+    tile_zoom: 공간 타일 줌 레벨
+    recorder: 단계별 계측 기록기 (단계 이름은 'http.match'처럼 버전 접두어 사용)
+    match_cache: 버전 간 공유하는 링크 매칭 결과 캐시 (같은 좌표는 한 번만 공간 쿼리)
+    nodelink_fingerprint: 현재 노드링크 식별값 (노드링크를 쓸 수 없으면 None) - 결과의 response에 기록
+    """
     protocol = 'HTTPS' if cctv_type == '4' else 'HTTP'
+    prefix = protocol.lower()
+    recorder = recorder or StageRecorder(f"generate_version.{prefix}", verbose=False)
+    cctv_list = cctv_data['response']['data']
 
     print(f"\n{'=' * 60}")
     print(f" {protocol} 버전 생성")
     print(f"{'=' * 60}")
 
-    # 1. CCTV 데이터 다운로드 (update-cctv-data.py 호출)
-    print(f"\n[1/2] CCTV 데이터 다운로드 ({protocol})")
+    # linkId 매핑 (map-cctv-to-traffic.py 호출)
+    print(f"\n교통정보 linkId 매핑")
     print("-" * 40)
-    cctv_data = download_and_merge(cctv_type, data_file)
 
-    # 2. linkId 매핑 (map-cctv-to-traffic.py 호출)
-    print(f"\n[2/2] 교통정보 linkId 매핑")
-    print("-" * 40)
-    map_links_to_cctv_data(cctv_data, links_gdf)
-    save_result(cctv_data, links_file)
+    previous_list, previous_fingerprint = load_previous_cctv_list(links_file) if incremental else (None, None)
+    nodelink_ready = nodelink_fingerprint is not None
+    if incremental and previous_list is None:
+        print(f"  기존 매핑 결과 없음 - 전체 매핑")
+    elif previous_list is not None and nodelink_ready and previous_fingerprint != nodelink_fingerprint:
+        # 노드링크 원본 교체/매칭 로직 변경 또는 노드링크 없이 만든 결과 → 기존 linkId를 신뢰할 수 없음
+        print(f"  기존 매핑 결과의 노드링크가 현재와 다름 - 전체 매핑")
+        previous_list = None
+    elif previous_list is not None and not nodelink_ready:
+        # 지금은 노드링크를 쓸 수 없으므로 기존 linkId를 그대로 유지 (기존 식별값도 유지)
+        nodelink_fingerprint = previous_fingerprint
+
+    if previous_list is None:
+        links_gdf = get_links_for(cctv_list, get_links_gdf, match_cache)
+        with recorder.stage(f"{prefix}.match", items=len(cctv_list)):
+            map_links_to_cctv_data(cctv_data, links_gdf, match_cache=match_cache, label=prefix)
+    else:
+        with recorder.stage(f"{prefix}.diff", items=len(cctv_list)):
+            to_map, summary = diff_cctv_list(cctv_list, previous_list,
+                                             remap_unlinked=nodelink_ready)
+        print_diff_summary(summary)
+        if to_map:
+            links_gdf = get_links_for(to_map, get_links_gdf, match_cache)
+            with recorder.stage(f"{prefix}.match", items=len(to_map)):
+                map_links_to_cctv_list(to_map, links_gdf, match_cache=match_cache, label=prefix)
+        else:
+            print("  변경된 CCTV 없음 - 매핑 생략")
+
+    cctv_data['response']['nodelinkFingerprint'] = nodelink_fingerprint
+    with recorder.stage(f"{prefix}.save", items=len(cctv_list)):
+        save_result(cctv_data, links_file, compact=True)
+        index_file = links_file.with_name(f"{links_file.stem}.index.json")
+        write_id_index(cctv_data, index_file)
+
+    derived_names = write_derived_files(cctv_data, links_file, tile_zoom, recorder, prefix)
 
     print(f"\n✅ {protocol} 버전 완료")
     print(f"   - {data_file.name}")
     print(f"   - {links_file.name}")
+    print(f"   - {index_file.name}")
+    for name in derived_names:
+        print(f"   - {name}")
+
+
+def write_derived_files(cctv_data, links_file, tile_zoom, recorder, prefix):
+    """매핑 결과에서 공간 타일, 클러스터 피라미드, 검색 인덱스 생성 → 출력 이름 목록"""
+    cctv_list = cctv_data['response']['data']
+
+    print(f"\n공간 타일 생성")
+    print("-" * 40)
+    tiles_dir = CCTV_TILES_DIR / links_file.stem
+    with recorder.stage(f"{prefix}.tiles", items=len(cctv_list)):
+        write_cctv_tiles(cctv_data, tiles_dir, tile_zoom)
+
+    print(f"\n클러스터 피라미드 생성")
+    print("-" * 40)
+    clusters_file = links_file.with_name(f"{links_file.stem}.clusters.json")
+    with recorder.stage(f"{prefix}.clusters", items=len(cctv_list)):
+        write_cluster_pyramid(cctv_data, clusters_file)
+
+    print(f"\n검색 인덱스 생성")
+    print("-" * 40)
+    search_file = links_file.with_name(f"{links_file.stem}.search.json")
+    with recorder.stage(f"{prefix}.search", items=len(cctv_list)):
+        write_search_index(cctv_data, search_file)
+
+    return [f"{tiles_dir.name}/ (타일)", clusters_file.name, search_file.name]
+
+
+def generate_version_stream(cctv_type, data_file, links_file, get_links_gdf, recorder=None, match_cache=None,
+                            tile_zoom=DEFAULT_TILE_ZOOM):
+    """특정 버전(HTTP/HTTPS)을 스트리밍으로 생성
+
+    다운로드 → 병합(roadType/cctvId) → linkId 매핑(배치) → NDJSON 저장을 제너레이터로 연결하고,
+    마지막에 NDJSON을 기존 JSON 구조로 변환합니다. 레코드 전체를 메모리에 올리지 않는 것은 이 단계까지이며,
+    compact/ID 인덱스/타일/클러스터/검색 인덱스는 변환한 JSON을 한 번 읽어 배치 모드와 같게 다시 만듭니다
+    (이전 실행의 파생 파일이 새 데이터와 어긋난 채 남거나 백엔드 API가 꺼지지 않도록).
+    cctvId 충돌 접미사는 변환 전에 배치 모드와 같은 순서로 고쳐 씁니다.
+    """
+    protocol = 'HTTPS' if cctv_type == '4' else 'HTTP'
+    prefix = protocol.lower()
+    recorder = recorder or StageRecorder(f"generate_version_stream.{prefix}", verbose=False)
+
+    print(f"\n{'=' * 60}")
+    print(f" {protocol} 버전 생성 (스트리밍)")
+    print(f"{'=' * 60}")
+
+    # 레코드가 도착하기 전이라 매칭 캐시 적중 여부를 알 수 없으므로 노드링크는 항상 로드
+    links_gdf = get_links_gdf()
+    data_ndjson = data_file.with_suffix('.ndjson')
+    links_ndjson = links_file.with_suffix('.ndjson')
+
+    print(f"\n다운로드 + linkId 매핑")
+    print("-" * 40)
+    header = {'coordtype': 1}
+    id_stats = {'collisions': 0}
+    id_renames = {}
+    match_stats = {}
+
+    with recorder.stage(f"{prefix}.stream") as stage, \
+            NdjsonWriter(data_ndjson) as data_writer, \
+            NdjsonWriter(links_ndjson) as links_writer:
+        records = data_writer.tee(iter_merged_cctv(cctv_type, header=header, stats=id_stats, renames=id_renames))
+        for cctv in iter_map_links(records, links_gdf, stats=match_stats, match_cache=match_cache, label=prefix):
+            links_writer.write(cctv)
+
+        summary = {
+            'coordtype': header['coordtype'],
+            'datacount': data_writer.count,
+            'roadTypes': header.get('roadTypes', {}),
+            'idCollisions': id_stats['collisions'],
+        }
+        data_writer.finish(summary)
+        links_writer.finish({**summary, 'matched': match_stats['matched']})
+        stage.items = data_writer.count
+
+    total = match_stats['total']
+    if total:
+        print(f"  매핑 완료: {match_stats['matched']:,}/{total:,} ({match_stats['matched'] / total * 100:.1f}%)")
+    if id_stats['collisions']:
+        print(f"  ID 충돌: {id_stats['collisions']}개 (접미사 부여)")
+
+    print(f"\nJSON 변환")
+    print("-" * 40)
+    with recorder.stage(f"{prefix}.convert", items=total):
+        for ndjson_path, json_path in [(data_ndjson, data_file), (links_ndjson, links_file)]:
+            if id_renames:
+                rewrite_ndjson(ndjson_path, lambda cctv: cctv.update(
+                    cctvId=id_renames.get(cctv.get('cctvId'), cctv.get('cctvId'))
+                ))
+            convert_ndjson_to_json(ndjson_path, json_path)
+            print(f"  저장: {json_path}")
+    if id_renames:
+        print(f"  cctvId 충돌 접미사 {len(id_renames)}개를 배치 모드 순서로 변경")
+
+    print(f"\n파생 파일 생성")
+    print("-" * 40)
+    cctv_data, cctv_list = load_cctv_data(links_file)
+    with recorder.stage(f"{prefix}.save", items=len(cctv_list)):
+        write_compact_artifact(cctv_data, links_file)
+        index_file = links_file.with_name(f"{links_file.stem}.index.json")
+        write_id_index(cctv_data, index_file)
+    derived_names = write_derived_files(cctv_data, links_file, tile_zoom, recorder, prefix)
+
+    print(f"\n✅ {protocol} 버전 완료")
+    print(f"   - {data_ndjson.name} → {data_file.name}")
+    print(f"   - {links_ndjson.name} → {links_file.name}")
+    print(f"   - {index_file.name}")
+    for name in derived_names:
+        print(f"   - {name}")
 
 
 def main():
@@ -58,11 +253,78 @@ def main():
   python generate-cctv-data.py          # HTTP + HTTPS 둘 다
   python generate-cctv-data.py --http   # HTTP만
   python generate-cctv-data.py --https  # HTTPS만
+  python generate-cctv-data.py --tiles 4x4  # 4x4 타일 모드 다운로드
+  python generate-cctv-data.py --incremental  # 변경분만 매핑
+  python generate-cctv-data.py --rebuild-nodelink-cache  # 노드링크 캐시 재생성
+  python generate-cctv-data.py --profile match  # 매칭 단계 프로파일링
+  python generate-cctv-data.py --stream  # 스트리밍 모드 (NDJSON + JSON 변환)
+  python generate-cctv-data.py --prune-nodelink  # CCTV 주변 링크만 로드
+  python generate-cctv-data.py --persist-match-cache  # 링크 매칭 캐시 파일 재사용
         """
     )
     parser.add_argument('--http', action='store_true', help='HTTP 버전만 생성')
     parser.add_argument('--https', action='store_true', help='HTTPS 버전만 생성')
+    parser.add_argument(
+        '--tiles',
+        type=parse_grid,
+        default=None,
+        metavar='COLSxROWS',
+        help='전국 범위를 격자로 나눠 병렬 다운로드 (예: 4x4)'
+    )
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='기존 매핑 결과와 비교하여 추가/이동된 CCTV만 linkId 매핑 '
+             '(기존 결과의 노드링크가 현재와 다르면 전체 매핑)'
+    )
+    parser.add_argument(
+        '--tile-zoom',
+        type=int,
+        default=DEFAULT_TILE_ZOOM,
+        help=f'공간 타일 줌 레벨 (클수록 타일이 작아짐). 기본값: {DEFAULT_TILE_ZOOM}'
+    )
+    parser.add_argument(
+        '--rebuild-nodelink-cache',
+        action='store_true',
+        help='노드링크 전처리 캐시를 무시하고 Shapefile에서 다시 생성'
+    )
+    parser.add_argument(
+        '--report',
+        type=Path,
+        default=RUN_REPORT_FILE,
+        help=f'단계별 시간/메모리 실행 리포트 JSON 경로 (기본: {RUN_REPORT_FILE.name})'
+    )
+    parser.add_argument(
+        '--profile',
+        action='append',
+        default=[],
+        metavar='STAGE',
+        help='cProfile을 적용할 단계 (download, load_nodelink, build_sindex, match, save, tiles, '
+             'clusters, search 또는 http.match처럼 버전 지정). 여러 번 지정 가능'
+    )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='다운로드부터 저장까지 레코드를 스트리밍 처리 (메모리 사용량 일정, NDJSON 출력 후 JSON 변환). '
+             '파생 파일(compact/타일/클러스터/검색 인덱스)은 변환한 JSON에서 다시 생성'
+    )
+    parser.add_argument(
+        '--prune-nodelink',
+        action='store_true',
+        help='다운로드한 CCTV 주변(최대 매칭 거리 + 여유) 링크만 로드하여 로드 시간/메모리 절감'
+    )
+    parser.add_argument(
+        '--persist-match-cache',
+        action='store_true',
+        help=f'링크 매칭 결과(좌표 → 최근접 링크)를 {LINK_MATCH_CACHE_FILE.name}에 저장하고 다음 실행에 재사용 '
+             '(노드링크 원본이 바뀌면 자동 무효화)'
+    )
     args = parser.parse_args()
+    if args.stream and (args.tiles or args.incremental or args.prune_nodelink):
+        parser.error('--stream은 --tiles, --incremental, --prune-nodelink와 함께 사용할 수 없습니다')
+
+    recorder = StageRecorder('generate_cctv_data', profile_stages=args.profile, profile_dir=REPORTS_DIR)
+    recorder.metadata['args'] = sys.argv[1:]
 
     # 둘 다 지정 안 하면 둘 다 생성
     generate_http = args.http or (not args.http and not args.https)
@@ -85,26 +347,90 @@ def main():
         targets.append('HTTPS')
     print(f"생성 대상: {' + '.join(targets)}")
 
-    # 노드링크 데이터 로드 (1회만) - map-cctv-to-traffic.py에서 가져옴
-    print("\n노드링크 데이터 로드 (1회)")
-    print("-" * 40)
-    links_gdf = load_nodelink_shapefile()
+    # 노드링크 데이터 로드 (필요할 때 1회만) - map-cctv-to-traffic.py에서 가져옴
+    # extent: --prune-nodelink 시 다운로드 후 모든 버전 CCTV의 링크 범위
+    links_cache = {'extent': None}
+
+    def get_links_gdf():
+        if 'gdf' not in links_cache:
+            print("  노드링크 데이터 로드 (1회)")
+            with recorder.stage('load_nodelink') as stage:
+                gdf = load_nodelink_shapefile(rebuild_cache=args.rebuild_nodelink_cache,
+                                              extent=links_cache['extent'])
+                stage.items = len(gdf) if gdf is not None else 0
+            if gdf is not None:
+                # 공간 인덱스는 첫 쿼리 때 생성되므로 매칭 시간과 분리해서 측정
+                with recorder.stage('build_sindex', items=len(gdf)):
+                    gdf.sindex
+            links_cache['gdf'] = gdf
+        return links_cache['gdf']
+
+    # 노드링크 캐시를 재생성하면 기존 매핑 결과도 신뢰할 수 없으므로 전체 매핑
+    incremental = args.incremental and not args.rebuild_nodelink_cache
+
+    # 매핑 결과에 기록하는 노드링크 식별값 (다음 --incremental 실행에서 기존 linkId 재사용 여부 판단)
+    nodelink_fingerprint = get_nodelink_fingerprint() if nodelink_available() and not args.stream else None
+
+    # 링크 매칭 캐시: 버전(HTTP/HTTPS) 간 항상 공유, --persist-match-cache 시 파일로 저장/재사용
+    match_cache = LinkMatchCache()
+    if args.persist_match_cache:
+        fingerprint = nodelink_fingerprint or get_nodelink_fingerprint()
+        if args.rebuild_nodelink_cache:
+            match_cache = LinkMatchCache(fingerprint)
+        else:
+            match_cache = LinkMatchCache.load(LINK_MATCH_CACHE_FILE, fingerprint)
+
+    versions = []
+    if generate_http:
+        versions.append(('1', CCTV_DATA_FILE, CCTV_DATA_WITH_LINKS_FILE))
+    if generate_https:
+        versions.append(('4', CCTV_DATA_HTTPS_FILE, CCTV_DATA_HTTPS_WITH_LINKS_FILE))
 
     try:
-        if generate_http:
-            generate_version('1', CCTV_DATA_FILE, CCTV_DATA_WITH_LINKS_FILE, links_gdf)
+        if args.stream:
+            # 버전별로 다운로드 → 매핑 → NDJSON 저장을 레코드 단위로 처리
+            for cctv_type, data_file, links_file in versions:
+                generate_version_stream(cctv_type, data_file, links_file, get_links_gdf, recorder, match_cache,
+                                        args.tile_zoom)
+        else:
+            # CCTV 데이터 다운로드 (모든 버전 × 도로 유형 동시 요청) - update-cctv-data.py에서 가져옴
+            print("\nCCTV 데이터 다운로드")
+            print("-" * 40)
+            with recorder.stage('download') as stage:
+                downloaded = download_all_and_merge(
+                    [(cctv_type, data_file) for cctv_type, data_file, _ in versions],
+                    grid=args.tiles
+                )
+                stage.items = sum(len(data['response']['data']) for data in downloaded.values())
 
-        if generate_https:
-            generate_version('4', CCTV_DATA_HTTPS_FILE, CCTV_DATA_HTTPS_WITH_LINKS_FILE, links_gdf)
+            if args.prune_nodelink:
+                links_cache['extent'] = build_cctv_extent(
+                    [cctv for data in downloaded.values() for cctv in data['response']['data']]
+                )
 
+            for cctv_type, data_file, links_file in versions:
+                generate_version(cctv_type, downloaded[cctv_type], data_file, links_file, get_links_gdf,
+                                 incremental, args.tile_zoom, recorder, match_cache, nodelink_fingerprint)
+
+        match_cache.print_report()
+        recorder.metadata['linkMatchCache'] = match_cache.report()
+        if args.persist_match_cache:
+            match_cache.save(LINK_MATCH_CACHE_FILE)
+
+        recorder.print_summary()
         print(f"\n{'=' * 60}")
         print(" 모든 작업 완료!")
         print(f"{'=' * 60}")
 
     except Exception as e:
+        recorder.status = 'error'
+        recorder.metadata['error'] = str(e)
         print(f"\n❌ 오류 발생: {e}")
         sys.exit(1)
 
+    finally:
+        recorder.write_report(args.report)
+
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,179 @@
+"""
+로컬 HLS 테스트 서버 (스트림 상태 점검기 검증용)
+
+/cam/<종류>/<번호>/playlist.m3u8 경로로 종류별 동작을 흉내 내는 라이브 HLS를 제공합니다.
+    ok        최신 세그먼트가 방금 생성됨
+    stale     최신 세그먼트가 FIXTURE_STALE_AGE초 전에 생성됨 (멈춘 스트림)
+    master    마스터 플레이리스트 → 미디어 플레이리스트 (정상)
+    ended     #EXT-X-ENDLIST가 있는 플레이리스트 (방송 종료)
+    missing   플레이리스트 404
+    denied    플레이리스트 403 (토큰 만료 등)
+    empty     세그먼트가 없는 플레이리스트
+    segment404  플레이리스트는 정상이나 세그먼트 404
+    slow      응답 지연 (FIXTURE_SLOW_DELAY초, 점검기 타임아웃보다 길게)
+
+사용 예:
+    with HlsFixtureServer() as server:
+        data = build_fixture_dataset(server.base_url, 1000)
+"""
+
+import random
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+FIXTURE_KINDS = ['ok', 'stale', 'master', 'ended', 'missing', 'denied', 'empty', 'segment404', 'slow']
+
+# 종류별 점검 결과 기대값 (probe_streams.py 상태 값)
+EXPECTED_STATUS = {
+    'ok': 'ok',
+    'stale': 'stale',
+    'master': 'ok',
+    'ended': 'stale',
+    'missing': 'dead',
+    'denied': 'denied',
+    'empty': 'dead',
+    'segment404': 'dead',
+    'slow': 'timeout',
+}
+
+# 대부분 정상인 실제 분포에 가깝게 생성할 때의 비율
+DEFAULT_KIND_WEIGHTS = {
+    'ok': 70, 'stale': 8, 'master': 5, 'ended': 2, 'missing': 5,
+    'denied': 4, 'empty': 2, 'segment404': 2, 'slow': 2,
+}
+
+FIXTURE_SEGMENT_DURATION = 2
+FIXTURE_STALE_AGE = 600
+FIXTURE_SLOW_DELAY = 10.0
+
+
+def media_playlist(sequence, ended=False, count=3):
+    lines = [
+        '#EXTM3U',
+        '#EXT-X-VERSION:3',
+        f'#EXT-X-TARGETDURATION:{FIXTURE_SEGMENT_DURATION}',
+        f'#EXT-X-MEDIA-SEQUENCE:{sequence}',
+    ]
+    for seq in range(sequence, sequence + count):
+        lines += [f'#EXTINF:{FIXTURE_SEGMENT_DURATION}.000,', f'seg_{seq}.ts']
+    if ended:
+        lines.append('#EXT-X-ENDLIST')
+    return '\n'.join(lines) + '\n'
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def log_message(self, format, *args):
+        pass
+
+    def send_body(self, status, body=b'', content_type='application/vnd.apple.mpegurl', headers=None):
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        if self.command != 'HEAD':
+            self.wfile.write(body)
+
+    def do_HEAD(self):
+        self.do_GET()
+
+    def do_GET(self):
+        parts = self.path.split('?', 1)[0].strip('/').split('/')
+        if len(parts) != 4 or parts[0] != 'cam' or parts[1] not in FIXTURE_KINDS:
+            return self.send_body(404)
+        _, kind, _, name = parts
+        self.server.requests += 1
+
+        if kind == 'slow':
+            time.sleep(FIXTURE_SLOW_DELAY)
+        if kind == 'missing':
+            return self.send_body(404)
+        if kind == 'denied':
+            return self.send_body(403)
+
+        sequence = int(time.time()) // FIXTURE_SEGMENT_DURATION
+        if name == 'playlist.m3u8':
+            if kind == 'master':
+                body = '#EXTM3U\n#EXT-X-STREAM-INF:BANDWIDTH=800000\nchunklist.m3u8\n'
+            elif kind == 'empty':
+                body = '#EXTM3U\n#EXT-X-TARGETDURATION:2\n'
+            else:
+                body = media_playlist(sequence, ended=kind == 'ended')
+            return self.send_body(200, body.encode())
+        if name == 'chunklist.m3u8':
+            return self.send_body(200, media_playlist(sequence).encode())
+
+        if name.startswith('seg_'):
+            if kind == 'segment404':
+                return self.send_body(404)
+            age = FIXTURE_STALE_AGE if kind in ('stale', 'ended') else 0
+            modified = formatdate(time.time() - age, usegmt=True)
+            return self.send_body(200, b'\x47' * 188, 'video/mp2t', {'Last-Modified': modified})
+        return self.send_body(404)
+
+
+class FixtureHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    requests = 0
+
+    def handle_error(self, request, client_address):
+        # 점검기가 타임아웃으로 먼저 연결을 끊는 경우(slow)는 정상 동작
+        pass
+
+
+class HlsFixtureServer:
+    """백그라운드 스레드에서 동작하는 로컬 HLS 서버 (컨텍스트 매니저)"""
+
+    def __init__(self, host='127.0.0.1', port=0):
+        self.httpd = FixtureHTTPServer((host, port), FixtureHandler)
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    @property
+    def requests(self):
+        return self.httpd.requests
+
+    def __enter__(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        return False
+
+
+def build_fixture_dataset(base_urls, count, seed=0, weights=None):
+    """테스트 서버를 가리키는 가상 CCTV 데이터 (응답 구조, 레코드마다 fixtureKind 포함)
+
+    base_urls: 서버 주소 목록 (여러 개면 호스트별 제한 검증용으로 나눠 배정)
+    """
+    if isinstance(base_urls, str):
+        base_urls = [base_urls]
+    rng = random.Random(seed)
+    weights = weights or DEFAULT_KIND_WEIGHTS
+    kinds = list(weights)
+
+    records = []
+    for i in range(count):
+        kind = rng.choices(kinds, weights=[weights[k] for k in kinds])[0]
+        base_url = base_urls[i % len(base_urls)]
+        records.append({
+            'cctvId': f'FIXTURE-{i:06d}',
+            'cctvname': f'테스트 CCTV {i}',
+            'cctvurl': f'{base_url}/cam/{kind}/{i}/playlist.m3u8',
+            'coordx': 127.0,
+            'coordy': 37.5,
+            'fixtureKind': kind,
+        })
+    return {'response': {'coordtype': 1, 'datacount': count, 'data': records}}
@@ -0,0 +1,213 @@
+"""
+파이프라인 단계별 계측 모듈
+
+단계(다운로드, 노드링크 로드, 인덱스 생성, 매칭, 저장 등)마다 경과 시간, CPU 시간,
+최대 RSS, 처리 건수를 기록하고 JSON 실행 리포트로 저장합니다.
+지정한 단계는 cProfile로 프로파일링하여 .pstats 파일로 남길 수 있습니다.
+
+사용 예:
+    recorder = StageRecorder('generate_cctv_data', profile_stages=['match'])
+    with recorder.stage('http.match') as stage:
+        stage.items = map_links_to_cctv_data(cctv_data, links_gdf)
+    recorder.write_report(RUN_REPORT_FILE)
+"""
+
+import cProfile
+import json
+import os
+import pstats
+import resource
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+
+RUN_REPORT_VERSION = 1
+
+# 프로파일 요약 출력 줄 수
+PROFILE_PRINT_LIMIT = 15
+
+
+def read_rss_mb():
+    """현재 RSS (MB). /proc이 없으면 ru_maxrss(최대값)로 대체"""
+    try:
+        with open('/proc/self/statm', 'r') as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError):
+        return read_max_rss_mb()
+
+
+def read_max_rss_mb():
+    """프로세스 시작 이후 최대 RSS (MB)"""
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS는 바이트, Linux는 KB 단위
+    return maxrss / (1024 * 1024) if sys.platform == 'darwin' else maxrss / 1024
+
+
+class PeakRssSampler:
+    """구간 실행 중 RSS를 주기적으로 읽어 최대값 기록 (GEOS 등 네이티브 메모리 포함)"""
+
+    def __init__(self, interval=0.01):
+        self.interval = interval
+        self.start_mb = 0.0
+        self.peak_mb = 0.0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self.peak_mb = max(self.peak_mb, read_rss_mb())
+
+    def __enter__(self):
+        self.start_mb = self.peak_mb = read_rss_mb()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+        self.peak_mb = max(self.peak_mb, read_rss_mb())
+        return False
+
+
+class StageRecord:
+    """한 단계의 측정 결과 (items는 단계 안에서 채움)"""
+
+    def __init__(self, name):
+        self.name = name
+        self.items = None
+        self.wall_sec = 0.0
+        self.cpu_sec = 0.0
+        self.peak_rss_mb = 0.0
+        self.rss_delta_mb = 0.0
+        self.status = 'ok'
+        self.profile = None
+
+    def to_dict(self):
+        return {
+            'name': self.name,
+            'status': self.status,
+            'wallSec': round(self.wall_sec, 4),
+            'cpuSec': round(self.cpu_sec, 4),
+            'peakRssMb': round(self.peak_rss_mb, 1),
+            'rssDeltaMb': round(self.rss_delta_mb, 1),
+            'items': self.items,
+            'profile': self.profile,
+        }
+
+
+class StageRecorder:
+    """단계별 계측 기록기
+
+    profile_stages: cProfile을 적용할 단계 이름 ('http.match'처럼 전체 이름 또는 'match'처럼 마지막 부분)
+    profile_dir: .pstats 파일 저장 폴더
+    verbose: 단계 종료 시 한 줄 요약 출력
+    """
+
+    def __init__(self, name, profile_stages=(), profile_dir=None, verbose=True):
+        self.name = name
+        self.profile_stages = set(profile_stages or ())
+        self.profile_dir = Path(profile_dir) if profile_dir else Path.cwd()
+        self.verbose = verbose
+        self.records = []
+        self.status = 'ok'
+        self.metadata = {}
+        self._started_at = datetime.now()
+        self._start = time.perf_counter()
+
+    def should_profile(self, name):
+        return name in self.profile_stages or name.rsplit('.', 1)[-1] in self.profile_stages
+
+    @contextmanager
+    def stage(self, name, items=None):
+        """단계 측정 컨텍스트 (예외 발생 시 status='error'로 기록 후 다시 발생)"""
+        record = StageRecord(name)
+        record.items = items
+        profiler = cProfile.Profile() if self.should_profile(name) else None
+
+        sampler = PeakRssSampler()
+        try:
+            with sampler:
+                wall_start = time.perf_counter()
+                cpu_start = time.process_time()
+                if profiler:
+                    profiler.enable()
+                try:
+                    yield record
+                except BaseException:
+                    record.status = 'error'
+                    raise
+                finally:
+                    if profiler:
+                        profiler.disable()
+                    record.wall_sec = time.perf_counter() - wall_start
+                    record.cpu_sec = time.process_time() - cpu_start
+        finally:
+            # 실패한 단계도 리포트에 남도록 예외와 관계없이 기록
+            record.peak_rss_mb = sampler.peak_mb
+            record.rss_delta_mb = sampler.peak_mb - sampler.start_mb
+            if profiler:
+                record.profile = str(self._save_profile(name, profiler))
+            self.records.append(record)
+
+            if self.verbose:
+                items = f"  {record.items:,}건" if isinstance(record.items, int) else ''
+                status = ' [실패]' if record.status == 'error' else ''
+                print(f"  ⏱  {name}{status}: {record.wall_sec:.3f}초 (CPU {record.cpu_sec:.3f}초, "
+                      f"최대 RSS {record.peak_rss_mb:.1f}MB){items}")
+
+    def _save_profile(self, name, profiler):
+        """프로파일 결과를 .pstats로 저장하고 누적 시간 상위 항목 출력"""
+        self.profile_dir.mkdir(parents=True, exist_ok=True)
+        path = self.profile_dir / f"profile-{name}.pstats"
+        profiler.dump_stats(path)
+        print(f"\n  프로파일 저장: {path}  (python -m pstats {path.name})")
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(PROFILE_PRINT_LIMIT)
+        return path
+
+    def get(self, name):
+        """이름으로 마지막 측정 결과 조회"""
+        for record in reversed(self.records):
+            if record.name == name:
+                return record
+        return None
+
+    def to_report(self):
+        return {
+            'version': RUN_REPORT_VERSION,
+            'script': self.name,
+            'status': self.status,
+            'startedAt': self._started_at.isoformat(timespec='seconds'),
+            'finishedAt': datetime.now().isoformat(timespec='seconds'),
+            'totalWallSec': round(time.perf_counter() - self._start, 4),
+            'maxRssMb': round(read_max_rss_mb(), 1),
+            'metadata': self.metadata,
+            'stages': [record.to_dict() for record in self.records],
+        }
+
+    def write_report(self, path):
+        """JSON 실행 리포트 저장 (원자적 교체)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_report(), f, ensure_ascii=False, indent=2)
+        os.replace(tmp_path, path)
+        print(f"  실행 리포트 저장: {path}")
+
+    def print_summary(self):
+        """단계별 소요 시간 표"""
+        total = time.perf_counter() - self._start
+        print(f"\n{'단계':<20} {'경과(초)':>10} {'CPU(초)':>10} {'최대RSS(MB)':>12} {'건수':>10}")
+        print("-" * 66)
+        for record in self.records:
+            items = f"{record.items:,}" if isinstance(record.items, int) else '-'
+            print(f"{record.name:<20} {record.wall_sec:>10.3f} {record.cpu_sec:>10.3f} "
+                  f"{record.peak_rss_mb:>12.1f} {items:>10}")
+        print("-" * 66)
+        print(f"{'합계':<20} {total:>10.3f}")
@@ -0,0 +1,129 @@
+"""
+링크 매칭 결과 캐시 모듈
+
+(양자화된 좌표, 최대 매칭 거리) → 최근접 링크 결과를 저장하여
+HTTP/HTTPS 등 같은 카메라 좌표를 가진 버전들이 한 실행 안에서 공간 쿼리를 한 번만 하도록 합니다.
+노드링크 식별값(전처리/매칭 로직 버전 + 원본 SHA-256)과 함께 파일로 저장하면 다음 실행에서도 재사용합니다.
+"""
+
+import json
+import os
+from pathlib import Path
+
+MATCH_CACHE_VERSION = 2
+
+# 좌표 양자화 자릿수 (6자리 ≈ 0.1m, 같은 카메라의 버전 간 좌표 표기 차이 흡수)
+MATCH_COORD_PRECISION = 6
+
+
+class LinkMatchCache:
+    """좌표 기반 링크 매칭 결과 캐시
+
+    fingerprint: 노드링크 원본 식별값 (파일 저장/로드 시 원본이 바뀌었는지 판단)
+    결과가 없는 좌표(최대 거리 안에 링크 없음)도 None으로 캐시합니다.
+    """
+
+    def __init__(self, fingerprint=None, precision=MATCH_COORD_PRECISION):
+        self.fingerprint = fingerprint
+        self.precision = precision
+        self.entries = {}
+        self.loaded = 0
+        self.stats = {}
+
+    def make_key(self, x, y, max_distance_km):
+        return f"{float(x):.{self.precision}f},{float(y):.{self.precision}f},{max_distance_km:g}"
+
+    def lookup(self, coords, max_distance_km, label='default'):
+        """좌표 목록 조회 → (결과 리스트, 캐시에 없는 위치 목록)
+
+        label: 적중률 집계 단위 (예: 'http', 'https')
+        """
+        stats = self.stats.setdefault(label, {'lookups': 0, 'hits': 0})
+        results = [None] * len(coords)
+        missing = []
+        for i, (x, y) in enumerate(coords):
+            key = self.make_key(x, y, max_distance_km)
+            if key in self.entries:
+                results[i] = self.entries[key]
+            else:
+                missing.append(i)
+        stats['lookups'] += len(coords)
+        stats['hits'] += len(coords) - len(missing)
+        return results, missing
+
+    def count_missing(self, coords, max_distance_km):
+        """캐시에 없는 좌표 수 (적중률 집계 없이 확인만)"""
+        return sum(1 for x, y in coords if self.make_key(x, y, max_distance_km) not in self.entries)
+
+    def store(self, coords, max_distance_km, matches):
+        for (x, y), match in zip(coords, matches):
+            self.entries[self.make_key(x, y, max_distance_km)] = match
+
+    def report(self):
+        lookups = sum(s['lookups'] for s in self.stats.values())
+        hits = sum(s['hits'] for s in self.stats.values())
+        return {
+            'entries': len(self.entries),
+            'loaded': self.loaded,
+            'lookups': lookups,
+            'hits': hits,
+            'hitRate': round(hits / lookups, 4) if lookups else None,
+            'byLabel': self.stats,
+        }
+
+    def print_report(self):
+        """실행 종료 시 적중률 요약"""
+        report = self.report()
+        print(f"\n링크 매칭 캐시")
+        print("-" * 40)
+        for label, stats in self.stats.items():
+            rate = stats['hits'] / stats['lookups'] * 100 if stats['lookups'] else 0
+            print(f"  {label:<10} 조회 {stats['lookups']:>7,}  적중 {stats['hits']:>7,} ({rate:.1f}%)")
+        if report['lookups']:
+            print(f"  {'전체':<10} 조회 {report['lookups']:>7,}  적중 {report['hits']:>7,} "
+                  f"({report['hitRate'] * 100:.1f}%)")
+        print(f"  저장 항목 {report['entries']:,}개 (파일에서 로드 {report['loaded']:,}개)")
+
+    @classmethod
+    def load(cls, path, fingerprint):
+        """파일에서 캐시 로드 (없거나 노드링크 원본/버전이 다르면 빈 캐시)"""
+        cache = cls(fingerprint)
+        path = Path(path)
+        if not path.exists():
+            return cache
+
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+
+        if data.get('version') != MATCH_CACHE_VERSION or data.get('precision') != cache.precision:
+            print("  링크 매칭 캐시 버전 불일치 - 새로 생성")
+            return cache
+        if data.get('fingerprint') != fingerprint:
+            print("  노드링크 원본 변경 감지 - 링크 매칭 캐시 새로 생성")
+            return cache
+
+        cache.entries = {
+            key: {'linkId': value[0], 'roadName': value[1], 'distance': value[2]} if value else None
+            for key, value in data['entries'].items()
+        }
+        cache.loaded = len(cache.entries)
+        print(f"  링크 매칭 캐시 로드: {path.name} ({cache.loaded:,}개)")
+        return cache
+
+    def save(self, path):
+        """캐시 파일 저장 (원자적 교체)"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': MATCH_CACHE_VERSION,
+                'fingerprint': self.fingerprint,
+                'precision': self.precision,
+                'entries': {
+                    key: [match['linkId'], match['roadName'], match['distance']] if match else None
+                    for key, match in self.entries.items()
+                },
+            }, f, ensure_ascii=False, separators=(',', ':'))
+        os.replace(tmp_path, path)
+        print(f"  링크 매칭 캐시 저장: {path.name} ({len(self.entries):,}개)")
@@ -4,17 +4,57 @@ CCTV → 교통정보 linkId 매핑 모듈
 CCTV 좌표를 기준으로 가장 가까운 도로 링크를 찾아 매핑합니다.
 """
 
+import argparse
+import hashlib
 import json
+import math
+import os
+import time
+import warnings
 from pathlib import Path
 
 try:
     import geopandas as gpd
+    import numpy as np
+    import pandas as pd
+    import shapely
     from shapely.geometry import Point
     HAS_GEOPANDAS = True
 except ImportError:
     HAS_GEOPANDAS = False
 
-from paths import CCTV_DATA_FILE, CCTV_DATA_WITH_LINKS_FILE, NODELINK_SHAPEFILE
+from compact_dataset import write_compact_artifact
+from paths import (
+    CCTV_DATA_FILE,
+    CCTV_DATA_WITH_LINKS_FILE,
+    NODELINK_SHAPEFILE,
+    NODELINK_CACHE_FILE,
+    NODELINK_CACHE_META_FILE,
+)
+
+# 매칭에 사용하는 노드링크 속성 컬럼 (geometry 제외)
+NODELINK_COLUMNS = ['LINK_ID', 'ROAD_NAME']
+
+# 최대 매칭 거리 기본값 (km)
+DEFAULT_MAX_DISTANCE_KM = 0.5
+
+# 스트리밍 매칭 시 한 번의 bulk 공간 쿼리로 처리하는 CCTV 수
+STREAM_BATCH_SIZE = 5000
+
+# 캐시 포맷이 바뀌면 올려서 기존 캐시 무효화
+NODELINK_CACHE_VERSION = 2
+
+# 링크 범위 제한(prune) 시 CCTV를 묶는 격자 크기 (도) - 격자별 외곽 사각형 + 버퍼만 읽음
+NODELINK_PRUNE_CELL_DEG = 0.25
+
+# 범위 제한 버퍼 여유 배율 (원본 좌표계 변환 오차 흡수)
+NODELINK_PRUNE_MARGIN = 2.0
+
+# 범위 geometry를 원본 좌표계로 변환하기 전 변을 나누는 간격 (도)
+NODELINK_PRUNE_SEGMENT_DEG = 0.01
+
+# Shapefile 구성 파일 (캐시 무효화 판단 대상)
+SHAPEFILE_SIDECAR_SUFFIXES = ['.shp', '.shx', '.dbf', '.prj', '.cpg']
 
 
 def load_cctv_data(cctv_path):
@@ -28,8 +68,193 @@ def load_cctv_data(cctv_path):
     return data, cctv_list
 
 
-def load_nodelink_shapefile(shapefile_path=None):
-    """노드링크 Shapefile 로드 (도로 좌표 포함)"""
+def get_nodelink_cache_paths(shapefile_path):
+    """Shapefile에 대응하는 캐시 파일/메타 파일 경로"""
+    if shapefile_path == NODELINK_SHAPEFILE:
+        return NODELINK_CACHE_FILE, NODELINK_CACHE_META_FILE
+    return shapefile_path.with_suffix('.cache.pkl'), shapefile_path.with_suffix('.cache.json')
+
+
+def _source_files(shapefile_path):
+    """Shapefile 구성 파일 목록 (.shp/.dbf 등 존재하는 것만)"""
+    files = [shapefile_path.with_suffix(suffix) for suffix in SHAPEFILE_SIDECAR_SUFFIXES]
+    return [f for f in files if f.exists()]
+
+
+def _source_stat(shapefile_path):
+    """구성 파일별 (mtime, size) - 빠른 변경 감지용"""
+    return {
+        f.suffix: [f.stat().st_mtime_ns, f.stat().st_size]
+        for f in _source_files(shapefile_path)
+    }
+
+
+def _source_hash(shapefile_path):
+    """구성 파일 내용 SHA-256 - mtime만 바뀐 경우(복사/압축 해제) 재사용 판단용"""
+    digest = hashlib.sha256()
+    for f in _source_files(shapefile_path):
+        digest.update(f.suffix.encode())
+        with open(f, 'rb') as fp:
+            for chunk in iter(lambda: fp.read(1024 * 1024), b''):
+                digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _write_json_atomic(data, path):
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def nodelink_available(shapefile_path=None):
+    """노드링크 레이어를 로드할 수 있는지 (geopandas 설치 + Shapefile 존재)"""
+    return HAS_GEOPANDAS and (shapefile_path or NODELINK_SHAPEFILE).exists()
+
+
+def get_nodelink_fingerprint(shapefile_path=None):
+    """노드링크 원본 + 전처리/매칭 로직 식별값 ('v<NODELINK_CACHE_VERSION>:<원본 SHA-256>')
+
+    원본 SHA-256은 캐시 메타 값을 재사용하고 원본이 바뀌었으면 다시 계산합니다.
+    전처리·매칭 결과가 달라지는 변경은 NODELINK_CACHE_VERSION을 올리므로, 이 값을 포함해
+    링크 매칭 캐시 파일도 함께 무효화되게 합니다.
+    """
+    if shapefile_path is None:
+        shapefile_path = NODELINK_SHAPEFILE
+
+    _, meta_path = get_nodelink_cache_paths(shapefile_path)
+    source_hash = None
+    if meta_path.exists():
+        with open(meta_path, 'r', encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('sha256') and meta.get('stat') == _source_stat(shapefile_path):
+            source_hash = meta['sha256']
+    return f"v{NODELINK_CACHE_VERSION}:{source_hash or _source_hash(shapefile_path)}"
+
+
+def load_nodelink_cache(shapefile_path):
+    """유효한 노드링크 캐시가 있으면 로드, 없거나 원본이 바뀌었으면 None"""
+    cache_path, meta_path = get_nodelink_cache_paths(shapefile_path)
+    if not cache_path.exists() or not meta_path.exists():
+        return None
+
+    with open(meta_path, 'r', encoding='utf-8') as f:
+        meta = json.load(f)
+
+    if meta.get('version') != NODELINK_CACHE_VERSION:
+        print("  캐시 버전 불일치 - 재생성")
+        return None
+
+    stat = _source_stat(shapefile_path)
+    if stat != meta.get('stat'):
+        # mtime/size가 다르면 내용 해시로 한 번 더 확인
+        if _source_hash(shapefile_path) != meta.get('sha256'):
+            print("  원본 Shapefile 변경 감지 - 캐시 재생성")
+            return None
+        meta['stat'] = stat
+        _write_json_atomic(meta, meta_path)
+
+    print(f"  노드링크 캐시 로드: {cache_path.name}")
+    return pd.read_pickle(cache_path)
+
+
+def save_nodelink_cache(gdf, shapefile_path):
+    """전처리된 노드링크 레이어를 캐시 파일로 저장"""
+    cache_path, meta_path = get_nodelink_cache_paths(shapefile_path)
+
+    tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+    gdf.to_pickle(tmp_path)
+    os.replace(tmp_path, cache_path)
+
+    _write_json_atomic({
+        'version': NODELINK_CACHE_VERSION,
+        'source': shapefile_path.name,
+        'stat': _source_stat(shapefile_path),
+        'sha256': _source_hash(shapefile_path),
+        'crs': 'EPSG:4326',
+        'columns': list(gdf.columns),
+        'linkCount': len(gdf),
+    }, meta_path)
+    print(f"  노드링크 캐시 저장: {cache_path.name}")
+
+
+def clean_road_name(value):
+    """ROAD_NAME 값 → 문자열 (결측(NaN/None)은 빈 문자열, JSON에 NaN이 기록되지 않도록)"""
+    return value if isinstance(value, str) else ''
+
+
+def compact_nodelink_columns(gdf):
+    """매칭용 컬럼만 남기고 메모리 사용이 적은 타입으로 변환 (ROAD_NAME은 category, 결측은 빈 문자열)"""
+    columns = [c for c in NODELINK_COLUMNS if c in gdf.columns]
+    gdf = gdf[columns + ['geometry']]
+    if 'ROAD_NAME' in gdf.columns:
+        gdf = gdf.assign(ROAD_NAME=gdf['ROAD_NAME'].fillna('').astype('category'))
+    return gdf
+
+
+def build_cctv_extent(cctv_list, max_distance_km=0.5, cell_deg=NODELINK_PRUNE_CELL_DEG):
+    """매칭에 필요한 링크 범위 (EPSG:4326)
+
+    CCTV를 cell_deg 격자로 묶고, 격자별 CCTV 외곽 사각형에 최대 매칭 거리만큼 버퍼를 더한 영역의 합집합.
+    이 영역과 겹치지 않는 링크는 어떤 CCTV와도 max_distance_km 안에 있을 수 없습니다.
+    """
+    buffer_deg = max_distance_km / 111.0 * NODELINK_PRUNE_MARGIN
+    cells = {}
+    for cctv in cctv_list:
+        x, y = float(cctv['coordx']), float(cctv['coordy'])
+        key = (math.floor(x / cell_deg), math.floor(y / cell_deg))
+        if key in cells:
+            min_x, min_y, max_x, max_y = cells[key]
+            cells[key] = (min(min_x, x), min(min_y, y), max(max_x, x), max(max_y, y))
+        else:
+            cells[key] = (x, y, x, y)
+
+    if not cells:
+        return None
+
+    boxes = [
+        shapely.box(min_x - buffer_deg, min_y - buffer_deg, max_x + buffer_deg, max_y + buffer_deg)
+        for min_x, min_y, max_x, max_y in cells.values()
+    ]
+    return shapely.union_all(boxes)
+
+
+def clip_nodelink_to_extent(gdf, extent):
+    """이미 로드된 링크 레이어를 범위와 겹치는 링크만 남기기 (원래 행 순서/인덱스 유지)"""
+    positions = np.sort(gdf.sindex.query(extent, predicate='intersects'))
+    return gdf.iloc[positions]
+
+
+def read_nodelink_shapefile(shapefile_path, extent=None):
+    """Shapefile에서 필요한 컬럼만 읽기 (extent가 있으면 범위와 겹치는 링크만 읽음)
+
+    인덱스는 원본 feature 번호(FID)로 맞춰 범위 제한 여부와 관계없이 같은 링크는 같은 인덱스를 가집니다.
+    """
+    available = gpd.read_file(shapefile_path, rows=1, encoding='cp949').columns
+    columns = [c for c in NODELINK_COLUMNS if c in available]
+
+    mask = None
+    if extent is not None:
+        # 변을 잘게 나눠 원본 좌표계(EPSG:5179 등)로 변환해도 영역이 줄어들지 않게 함
+        mask = gpd.GeoSeries([shapely.segmentize(extent, NODELINK_PRUNE_SEGMENT_DEG)], crs='EPSG:4326')
+
+    gdf = gpd.read_file(shapefile_path, encoding='cp949', columns=columns, mask=mask, fid_as_index=True)
+
+    if gdf.crs.to_epsg() != 4326:
+        gdf = gdf.to_crs(epsg=4326)
+
+    return compact_nodelink_columns(gdf)
+
+
+def load_nodelink_shapefile(shapefile_path=None, use_cache=True, rebuild_cache=False, extent=None):
+    """노드링크 Shapefile 로드 (도로 좌표 포함)
+
+    use_cache: 전처리 캐시 사용 여부 (원본 mtime/해시가 같으면 Shapefile 파싱 생략)
+    rebuild_cache: 캐시를 무시하고 Shapefile에서 다시 만들어 저장
+    extent: 매칭 대상 범위 (EPSG:4326 geometry, build_cctv_extent 결과).
+            지정하면 범위와 겹치는 링크만 남김 - 캐시가 있으면 캐시에서 잘라내고,
+            없으면 Shapefile에서 범위만 읽음 (부분 레이어는 캐시로 저장하지 않음)
+    """
     if not HAS_GEOPANDAS:
         print("  ⚠️  geopandas 미설치 - linkId 매핑 불가")
         return None
@@ -41,13 +266,35 @@ def load_nodelink_shapefile(shapefile_path=None):
         print(f"  ⚠️  노드링크 파일 없음: {shapefile_path}")
         return None
 
+    if use_cache and not rebuild_cache:
+        gdf = load_nodelink_cache(shapefile_path)
+        if gdf is not None:
+            if extent is not None:
+                total = len(gdf)
+                gdf = clip_nodelink_to_extent(gdf, extent)
+                print(f"  범위 제한: {len(gdf):,}/{total:,}개 링크")
+            else:
+                print(f"  총 {len(gdf):,}개 링크")
+            return gdf
+
+    if extent is not None and not rebuild_cache:
+        print(f"  노드링크 데이터 로드 중... (CCTV 주변 범위만)")
+        gdf = read_nodelink_shapefile(shapefile_path, extent)
+        print(f"  범위 제한: {len(gdf):,}개 링크 (부분 레이어 - 캐시 저장 안 함)")
+        return gdf
+
     print(f"  노드링크 데이터 로드 중...")
-    gdf = gpd.read_file(shapefile_path, encoding='cp949')
+    gdf = read_nodelink_shapefile(shapefile_path)
 
-    if gdf.crs.to_epsg() != 4326:
-        gdf = gdf.to_crs(epsg=4326)
+    if use_cache or rebuild_cache:
+        save_nodelink_cache(gdf, shapefile_path)
 
-    print(f"  총 {len(gdf):,}개 링크")
+    if extent is not None:
+        total = len(gdf)
+        gdf = clip_nodelink_to_extent(gdf, extent)
+        print(f"  범위 제한: {len(gdf):,}/{total:,}개 링크")
+    else:
+        print(f"  총 {len(gdf):,}개 링크")
     return gdf
 
 
@@ -74,44 +321,193 @@ def find_nearest_link(cctv_point, links_gdf, sindex, max_distance_km=0.5):
 
     return {
         'linkId': nearest['LINK_ID'],
-        'roadName': nearest.get('ROAD_NAME', ''),
+        'roadName': clean_road_name(nearest.get('ROAD_NAME')),
         'distance': round(distance_km, 3)
     }
 
 
-def map_links_to_cctv_data(cctv_data, links_gdf, max_distance_km=0.5):
-    """CCTV 데이터에 linkId 매핑 (외부 호출용)"""
-    if links_gdf is None:
+def match_nearest_links(coords, links_gdf, max_distance_km=0.5):
+    """좌표 목록의 최근접 도로 링크를 한 번의 bulk 공간 쿼리로 찾기
+
+    coords: [(x, y), ...] (EPSG:4326)
+    반환: coords와 같은 길이의 리스트 (매칭 실패 시 None)
+    """
+    results = [None] * len(coords)
+    if not coords:
+        return results
+
+    xs = [float(x) for x, _ in coords]
+    ys = [float(y) for _, y in coords]
+    points = gpd.points_from_xy(xs, ys, crs=links_gdf.crs)
+
+    max_distance_deg = max_distance_km / 111.0
+    (point_idx, link_idx), distances = links_gdf.sindex.nearest(
+        points,
+        max_distance=max_distance_deg,
+        return_distance=True,
+        return_all=True,
+    )
+
+    # 같은 거리의 링크가 여럿이면(교차점 등) 원본 행 번호가 가장 작은 링크 선택
+    # → 범위 제한 로드 여부와 관계없이 같은 결과
+    order = np.lexsort((links_gdf.index.to_numpy()[link_idx], point_idx))
+    point_idx, link_idx, distances = point_idx[order], link_idx[order], distances[order]
+    first = np.concatenate([[True], point_idx[1:] != point_idx[:-1]]) if len(point_idx) else []
+    point_idx, link_idx, distances = point_idx[first], link_idx[first], distances[first]
+
+    link_ids = links_gdf['LINK_ID'].to_numpy()
+    road_names = links_gdf['ROAD_NAME'].to_numpy() if 'ROAD_NAME' in links_gdf.columns else None
+
+    for p_idx, l_idx, distance in zip(point_idx, link_idx, distances):
+        distance_km = float(distance) * 111
+        if distance_km > max_distance_km:
+            continue
+        results[p_idx] = {
+            'linkId': link_ids[l_idx],
+            'roadName': clean_road_name(road_names[l_idx]) if road_names is not None else '',
+            'distance': round(distance_km, 3)
+        }
+
+    return results
+
+
+def match_nearest_links_cached(coords, links_gdf, max_distance_km=0.5, match_cache=None, label='default'):
+    """match_nearest_links + 좌표 캐시 (캐시에 없는 좌표만 bulk 쿼리, 같은 좌표는 한 번만 계산)
+
+    links_gdf가 None이면 캐시에 있는 결과만 채움
+    """
+    if match_cache is None:
+        return match_nearest_links(coords, links_gdf, max_distance_km)
+
+    results, missing = match_cache.lookup(coords, max_distance_km, label)
+    if not missing or links_gdf is None:
+        return results
+
+    # 같은 좌표가 여러 번 나와도 한 번만 계산
+    positions = {}
+    for i in missing:
+        positions.setdefault(match_cache.make_key(*coords[i], max_distance_km), []).append(i)
+    unique_coords = [coords[group[0]] for group in positions.values()]
+
+    computed = match_nearest_links(unique_coords, links_gdf, max_distance_km)
+    match_cache.store(unique_coords, max_distance_km, computed)
+    for group, match in zip(positions.values(), computed):
+        for i in group:
+            results[i] = match
+    return results
+
+
+def apply_link_match(cctv, nearest):
+    """매칭 결과를 CCTV 레코드에 기록"""
+    cctv['linkId'] = nearest['linkId']
+    cctv['linkRoadName'] = nearest['roadName']
+    cctv['linkDistance'] = nearest['distance']
+
+
+def map_links_to_cctv_list(cctv_list, links_gdf, max_distance_km=0.5, match_cache=None, label='default'):
+    """CCTV 레코드 목록에 linkId 매핑 (레코드를 직접 수정)
+
+    match_cache: 좌표 기반 매칭 결과 캐시 (LinkMatchCache). 모든 좌표가 캐시에 있으면 links_gdf 없이도 매핑
+    label: 캐시 적중률 집계 단위
+    """
+    coords = [(cctv['coordx'], cctv['coordy']) for cctv in cctv_list]
+
+    if links_gdf is None and (match_cache is None or match_cache.count_missing(coords, max_distance_km)):
         print("  건너뜀 (노드링크 데이터 없음)")
         return 0
 
-    cctv_list = cctv_data['response']['data']
-
-    print(f"  공간 인덱스 생성 중...")
-    sindex = links_gdf.sindex
-
-    matched_count = 0
     total = len(cctv_list)
 
-    for idx, cctv in enumerate(cctv_list):
-        if (idx + 1) % 500 == 0:
-            print(f"  진행: {idx + 1:,}/{total:,}")
-
-        cctv_point = Point(cctv['coordx'], cctv['coordy'])
-        nearest = find_nearest_link(cctv_point, links_gdf, sindex, max_distance_km)
+    print(f"  최근접 링크 일괄 매칭 중... (최대 거리: {max_distance_km}km)")
+    matches = match_nearest_links_cached(coords, links_gdf, max_distance_km, match_cache, label)
 
+    matched_count = 0
+    for cctv, nearest in zip(cctv_list, matches):
         if nearest:
-            cctv['linkId'] = nearest['linkId']
-            cctv['linkRoadName'] = nearest['roadName']
-            cctv['linkDistance'] = nearest['distance']
+            apply_link_match(cctv, nearest)
             matched_count += 1
 
-    print(f"  매핑 완료: {matched_count:,}/{total:,} ({matched_count / total * 100:.1f}%)")
+    if total:
+        print(f"  매핑 완료: {matched_count:,}/{total:,} ({matched_count / total * 100:.1f}%)")
     return matched_count
 
 
-def save_result(data, output_path):
-    """결과 저장"""
+def map_links_to_cctv_data(cctv_data, links_gdf, max_distance_km=0.5, match_cache=None, label='default'):
+    """CCTV 데이터에 linkId 매핑 (외부 호출용)"""
+    return map_links_to_cctv_list(cctv_data['response']['data'], links_gdf, max_distance_km, match_cache, label)
+
+
+def iter_map_links(cctv_iter, links_gdf, max_distance_km=0.5, batch_size=STREAM_BATCH_SIZE, stats=None,
+                   match_cache=None, label='default'):
+    """CCTV 레코드 스트림에 linkId 매핑 (batch_size개씩 모아 bulk 매칭 후 순서대로 생성)
+
+    stats: {'total': n, 'matched': m}을 갱신할 dict (선택)
+    match_cache: 좌표 기반 매칭 결과 캐시 (LinkMatchCache)
+    """
+    if stats is None:
+        stats = {}
+    stats.setdefault('total', 0)
+    stats.setdefault('matched', 0)
+
+    def flush(batch):
+        stats['total'] += len(batch)
+        if links_gdf is None and match_cache is None:
+            return batch
+        coords = [(cctv['coordx'], cctv['coordy']) for cctv in batch]
+        matches = match_nearest_links_cached(coords, links_gdf, max_distance_km, match_cache, label)
+        for cctv, nearest in zip(batch, matches):
+            if nearest:
+                apply_link_match(cctv, nearest)
+                stats['matched'] += 1
+        return batch
+
+    batch = []
+    for cctv in cctv_iter:
+        batch.append(cctv)
+        if len(batch) >= batch_size:
+            yield from flush(batch)
+            batch = []
+    if batch:
+        yield from flush(batch)
+
+
+def benchmark_matching(cctv_list, links_gdf, max_distance_km=0.5):
+    """기존 CCTV별 루프 방식과 bulk 매칭 방식의 소요 시간/결과 비교"""
+    coords = [(cctv['coordx'], cctv['coordy']) for cctv in cctv_list]
+
+    # 공간 인덱스는 두 방식이 공유하므로 측정 전에 미리 생성
+    sindex = links_gdf.sindex
+
+    start = time.perf_counter()
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore')
+        legacy = [
+            find_nearest_link(Point(float(x), float(y)), links_gdf, sindex, max_distance_km)
+            for x, y in coords
+        ]
+    legacy_sec = time.perf_counter() - start
+
+    start = time.perf_counter()
+    bulk = match_nearest_links(coords, links_gdf, max_distance_km)
+    bulk_sec = time.perf_counter() - start
+
+    mismatches = sum(
+        1 for a, b in zip(legacy, bulk)
+        if a != b
+    )
+
+    print(f"  기존 루프: {legacy_sec:.3f}초")
+    print(f"  bulk 매칭: {bulk_sec:.3f}초 ({legacy_sec / max(bulk_sec, 1e-9):.1f}배)")
+    print(f"  결과 불일치: {mismatches:,}/{len(coords):,}")
+
+    return {'legacy_sec': legacy_sec, 'bulk_sec': bulk_sec, 'mismatches': mismatches}
+
+
+def save_result(data, output_path, compact=False):
+    """결과 저장
+
+    compact: 프론트엔드 배포용 compact 아티팩트(.json/.gz/.br)도 함께 저장
+    """
     if isinstance(output_path, str):
         output_path = Path(output_path)
     output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -120,8 +516,34 @@ def save_result(data, output_path):
         json.dump(data, f, ensure_ascii=False, indent=2)
     print(f"  저장: {output_path}")
 
+    if compact:
+        write_compact_artifact(data, output_path)
+
+
+def parse_args():
+    """커맨드라인 인자 파싱"""
+    parser = argparse.ArgumentParser(description='CCTV → 교통정보 linkId 매핑')
+    parser.add_argument(
+        '--benchmark',
+        action='store_true',
+        help='기존 CCTV별 루프 방식과 bulk 매칭 방식의 소요 시간 비교'
+    )
+    parser.add_argument(
+        '--rebuild-nodelink-cache',
+        action='store_true',
+        help='노드링크 전처리 캐시를 무시하고 Shapefile에서 다시 생성'
+    )
+    parser.add_argument(
+        '--prune-nodelink',
+        action='store_true',
+        help='CCTV 주변(최대 매칭 거리 + 여유) 링크만 로드하여 로드 시간/메모리 절감'
+    )
+    return parser.parse_args()
+
 
 def main():
+    args = parse_args()
+
     if not CCTV_DATA_FILE.exists():
         print(f"❌ CCTV 데이터 파일을 찾을 수 없습니다: {CCTV_DATA_FILE}")
         return
@@ -136,33 +558,23 @@ def main():
     print()
 
     cctv_data, cctv_list = load_cctv_data(CCTV_DATA_FILE)
-    links_gdf = load_nodelink_shapefile(NODELINK_SHAPEFILE)
+    extent = build_cctv_extent(cctv_list) if args.prune_nodelink else None
+    links_gdf = load_nodelink_shapefile(NODELINK_SHAPEFILE, rebuild_cache=args.rebuild_nodelink_cache,
+                                        extent=extent)
 
-    print("\n공간 인덱스 생성 중... (1회만)")
-    sindex = links_gdf.sindex
-    print("완료!\n")
+    if args.benchmark:
+        print("\n매핑 방식 비교 (기존 루프 vs bulk)...")
+        benchmark_matching(cctv_list, links_gdf)
+        return
 
-    print("CCTV → 링크 매핑 시작...")
+    print("\nCCTV → 링크 매핑 시작...")
     print("최대 검색 거리: 0.5km\n")
 
-    matched_count = 0
-    for idx, cctv in enumerate(cctv_list):
-        if (idx + 1) % 100 == 0:
-            print(f"진행: {idx + 1:,}/{len(cctv_list):,}")
-
-        cctv_point = Point(cctv['coordx'], cctv['coordy'])
-        nearest = find_nearest_link(cctv_point, links_gdf, sindex)
-
-        if nearest:
-            cctv['linkId'] = nearest['linkId']
-            cctv['linkRoadName'] = nearest['roadName']
-            cctv['linkDistance'] = nearest['distance']
-            matched_count += 1
+    matched_count = map_links_to_cctv_data(cctv_data, links_gdf)
 
-    print(f"\n매핑 완료: {matched_count:,}/{len(cctv_list):,} ({matched_count / len(cctv_list) * 100:.1f}%)")
     print(f"미매핑: {len(cctv_list) - matched_count:,}개\n")
 
-    save_result(cctv_data, CCTV_DATA_WITH_LINKS_FILE)
+    save_result(cctv_data, CCTV_DATA_WITH_LINKS_FILE, compact=True)
 
     print("\n샘플 데이터 (linkId 매핑된 것):")
     matched_samples = [c for c in cctv_list if 'linkId' in c][:3]
@@ -0,0 +1,153 @@
+"""
+NDJSON 출력 모듈
+
+스트리밍 파이프라인의 CCTV 레코드를 한 줄에 하나씩 기록하고 마지막 줄에 요약을 남깁니다.
+convert_ndjson_to_json은 레코드를 하나씩 읽어 기존 출력과 같은 JSON 구조
+({"response": {"coordtype", "datacount", "data"}}, indent=2)로 변환합니다.
+
+NDJSON 형식:
+    {"coordx": ..., "cctvname": ..., ...}
+    ...
+    {"_summary": {"coordtype": 1, "datacount": 15000, ...}}
+"""
+
+import json
+import os
+import textwrap
+from pathlib import Path
+
+SUMMARY_KEY = '_summary'
+
+# 요약 줄을 찾기 위해 파일 끝에서 읽는 단위
+TAIL_CHUNK_SIZE = 64 * 1024
+
+
+class NdjsonWriter:
+    """레코드를 한 줄씩 기록하는 NDJSON 작성기
+
+    임시 파일에 기록하고 finish() 시 요약 줄을 추가한 뒤 원자적으로 교체합니다.
+    finish() 없이 종료(예외 등)되면 임시 파일을 지우고 기존 파일을 유지합니다.
+    """
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._tmp_path = self.path.with_name(self.path.name + '.tmp')
+        self._file = open(self._tmp_path, 'w', encoding='utf-8')
+        self.count = 0
+
+    def write(self, record):
+        self._file.write(json.dumps(record, ensure_ascii=False, separators=(',', ':')))
+        self._file.write('\n')
+        self.count += 1
+
+    def tee(self, records):
+        """레코드를 기록하면서 그대로 다음 단계로 전달 (기록 시점의 내용이 저장됨)"""
+        for record in records:
+            self.write(record)
+            yield record
+
+    def finish(self, summary):
+        """요약 줄 기록 후 파일 확정"""
+        self._file.write(json.dumps({SUMMARY_KEY: summary}, ensure_ascii=False, separators=(',', ':')))
+        self._file.write('\n')
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self):
+        self._file.close()
+        self._tmp_path.unlink(missing_ok=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        if not self._file.closed:
+            self.abort()
+        return False
+
+
+def read_ndjson_summary(path):
+    """파일 끝에서 요약 줄만 읽기 (요약이 없으면 None)"""
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        end = f.tell()
+        tail = b''
+        pos = end
+        # 마지막 줄(끝의 개행 제외) 시작 위치를 찾을 때까지 뒤에서부터 읽기
+        while pos > 0 and tail.rstrip(b'\n').count(b'\n') == 0:
+            size = min(TAIL_CHUNK_SIZE, pos)
+            pos -= size
+            f.seek(pos)
+            tail = f.read(size) + tail
+
+    lines = tail.rstrip(b'\n').split(b'\n')
+    if not lines or not lines[-1]:
+        return None
+    last = json.loads(lines[-1])
+    return last.get(SUMMARY_KEY) if isinstance(last, dict) else None
+
+
+def iter_ndjson_records(path):
+    """요약 줄을 제외한 레코드를 하나씩 생성"""
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if SUMMARY_KEY in record:
+                break
+            yield record
+
+
+def rewrite_ndjson(path, transform):
+    """NDJSON 레코드마다 transform(record)을 적용해 다시 저장 (요약 줄 유지, 원자적 교체)"""
+    summary = read_ndjson_summary(path)
+    if summary is None:
+        raise ValueError(f"NDJSON 요약 줄이 없습니다 (작성 중단된 파일?): {path}")
+    with NdjsonWriter(path) as writer:
+        for record in iter_ndjson_records(path):
+            transform(record)
+            writer.write(record)
+        writer.finish(summary)
+    return writer.count
+
+
+def convert_ndjson_to_json(ndjson_path, json_path):
+    """NDJSON → 기존 JSON 구조 (json.dump(..., indent=2)와 같은 바이트 출력)
+
+    레코드를 하나씩 변환하므로 데이터셋 크기와 관계없이 메모리 사용량이 일정합니다.
+    반환: 요약 dict
+    """
+    summary = read_ndjson_summary(ndjson_path)
+    if summary is None:
+        raise ValueError(f"NDJSON 요약 줄이 없습니다 (작성 중단된 파일?): {ndjson_path}")
+
+    json_path = Path(json_path)
+    json_path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = json_path.with_name(json_path.name + '.tmp')
+
+    header = json.dumps(
+        {'coordtype': summary.get('coordtype', 1), 'datacount': summary['datacount']},
+        ensure_ascii=False, indent=2,
+    )
+    # '{\n  "coordtype": 1,\n  "datacount": N\n}' → response 객체 안쪽 줄로 재배치
+    header_lines = textwrap.indent(header[2:-2], '  ')
+
+    count = 0
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write('{\n  "response": {\n')
+        f.write(header_lines)
+        f.write(',\n    "data": [')
+        for record in iter_ndjson_records(ndjson_path):
+            f.write('\n' if count == 0 else ',\n')
+            f.write(textwrap.indent(json.dumps(record, ensure_ascii=False, indent=2), ' ' * 6))
+            count += 1
+        f.write('\n    ]\n  }\n}' if count else ']\n  }\n}')
+
+    if count != summary['datacount']:
+        tmp_path.unlink(missing_ok=True)
+        raise ValueError(f"레코드 수 불일치: 요약 {summary['datacount']:,}개, 실제 {count:,}개")
+
+    os.replace(tmp_path, json_path)
+    return summary
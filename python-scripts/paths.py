@@ -6,6 +6,7 @@ from pathlib import Path
 PROJECT_ROOT = Path(__file__).parent.parent
 FRONTEND_ROOT = PROJECT_ROOT / 'frontend'
 SRC_DIR = FRONTEND_ROOT / 'src'
+PUBLIC_DIR = FRONTEND_ROOT / 'public'
 DATAS_DIR = SRC_DIR / 'datas'
 
 # CCTV 데이터 경로
@@ -17,6 +18,25 @@ CCTV_DATA_WITH_LINKS_FILE = CCTV_DIR / 'cctv-data-with-links.json'
 CCTV_DATA_HTTPS_FILE = CCTV_DIR / 'cctv-data-https.json'
 CCTV_DATA_HTTPS_WITH_LINKS_FILE = CCTV_DIR / 'cctv-data-https-with-links.json'
 
+# CCTV 공간 타일 경로 (정적 파일로 배포, 버전별 하위 폴더)
+CCTV_TILES_DIR = PUBLIC_DIR / 'cctv-tiles'
+
 # 노드링크 데이터 경로
 NODELINK_DIR = DATAS_DIR / 'nodelink'
 NODELINK_SHAPEFILE = NODELINK_DIR / 'MOCT_LINK.shp'
+
+# 노드링크 전처리 캐시 경로 (재투영/컬럼 정리된 링크 레이어)
+NODELINK_CACHE_FILE = NODELINK_DIR / 'MOCT_LINK.cache.pkl'
+NODELINK_CACHE_META_FILE = NODELINK_DIR / 'MOCT_LINK.cache.json'
+
+# 파이프라인 벤치마크 결과/기준선 경로
+BENCHMARK_DIR = Path(__file__).parent / 'benchmarks'
+BENCHMARK_RESULT_FILE = BENCHMARK_DIR / 'latest.json'
+BENCHMARK_BASELINE_FILE = BENCHMARK_DIR / 'baseline.json'
+
+# 파이프라인 실행 리포트/프로파일 경로
+REPORTS_DIR = Path(__file__).parent / 'reports'
+RUN_REPORT_FILE = REPORTS_DIR / 'generate-run.json'
+
+# 링크 매칭 결과 캐시 (좌표 → 최근접 링크, 실행 간 재사용)
+LINK_MATCH_CACHE_FILE = NODELINK_DIR / 'MOCT_LINK.match-cache.json'
@@ -0,0 +1,410 @@
+"""
+CCTV HLS 스트림 상태 점검
+
+cctv-data-with-links.json의 모든 cctvurl을 asyncio로 동시에 점검합니다.
+플레이리스트를 받고(마스터면 첫 미디어 플레이리스트까지) 최신 세그먼트를 HEAD로 확인하여
+응답 지연, 세그먼트 생성 후 경과 시간, 상태를 레코드의 health 필드로 기록합니다.
+
+    "health": {"status": "ok", "latencyMs": 182, "segmentAge": 3, "checkedAt": 1760000000}
+
+status: ok | stale(세그먼트가 오래됨/방송 종료) | dead(404·5xx·빈 플레이리스트·세그먼트 없음)
+        | denied(401/403, 토큰 만료 가능) | timeout | error(그 밖의 연결 오류, 잘못된 URL)
+
+전체 동시 점검 수(--concurrency)와 호스트별 동시 요청 수/초당 요청 수(--per-host, --host-rate)를 제한하여
+스트리밍 서버에 부담을 주지 않으면서 전국 점검을 수 분 안에 끝냅니다.
+
+사용법:
+    python probe_streams.py                  # HTTP + HTTPS 데이터 점검 후 health 기록
+    python probe_streams.py --https --limit 100 --dry-run
+    python probe_streams.py --fixture 2000   # 로컬 HLS 테스트 서버로 점검기 검증 (네트워크 불필요)
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from collections import Counter
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+from urllib.parse import urljoin, urlsplit
+
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+
+from compact_dataset import write_compact_artifact
+from hls_fixture import EXPECTED_STATUS, HlsFixtureServer, build_fixture_dataset
+from paths import CCTV_DATA_HTTPS_WITH_LINKS_FILE, CCTV_DATA_WITH_LINKS_FILE
+
+DEFAULT_CONCURRENCY = 200
+DEFAULT_PER_HOST = 16
+DEFAULT_HOST_RATE = 50.0  # 호스트별 초당 요청 수
+DEFAULT_TIMEOUT = 5.0  # 요청별 타임아웃 (초)
+
+# 최신 세그먼트가 이 시간(초)보다 오래되면 멈춘 스트림으로 판단
+STALE_SEGMENT_AGE = 120
+
+# 마스터 → 미디어 플레이리스트 최대 단계
+MAX_PLAYLIST_DEPTH = 2
+
+HEALTH_FIELD = 'health'
+
+
+class HostLimiter:
+    """호스트 하나의 동시 요청 수 + 최소 요청 간격 제한"""
+
+    def __init__(self, max_concurrency, rate):
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.interval = 1.0 / rate if rate else 0.0
+        self.next_at = 0.0
+
+    async def __aenter__(self):
+        await self.semaphore.acquire()
+        if self.interval:
+            # 요청 시각을 interval 간격으로 예약 (단일 스레드 이벤트 루프라 별도 락 불필요)
+            now = time.monotonic()
+            start_at = max(now, self.next_at)
+            self.next_at = start_at + self.interval
+            if start_at > now:
+                await asyncio.sleep(start_at - now)
+        return self
+
+    async def __aexit__(self, *exc):
+        self.semaphore.release()
+        return False
+
+
+class StreamProber:
+    """CCTV 스트림 점검기
+
+    concurrency: 동시에 점검하는 CCTV 수
+    per_host / host_rate: 호스트별 동시 요청 수 / 초당 요청 수
+    """
+
+    def __init__(self, concurrency=DEFAULT_CONCURRENCY, per_host=DEFAULT_PER_HOST,
+                 host_rate=DEFAULT_HOST_RATE, timeout=DEFAULT_TIMEOUT, stale_age=STALE_SEGMENT_AGE):
+        self.concurrency = concurrency
+        self.per_host = per_host
+        self.host_rate = host_rate
+        self.timeout = timeout
+        self.stale_age = stale_age
+        self.hosts = {}
+        self.host_requests = Counter()
+
+    def limiter(self, url):
+        host = urlsplit(url).netloc
+        if host not in self.hosts:
+            self.hosts[host] = HostLimiter(self.per_host, self.host_rate)
+        self.host_requests[host] += 1
+        return self.hosts[host]
+
+    async def request(self, client, method, url, **kwargs):
+        """호스트 제한 안에서 요청 → (응답, 응답 지연 ms) - 지연 시간에 제한 대기 시간은 포함하지 않음"""
+        async with self.limiter(url):
+            start = time.perf_counter()
+            response = await client.request(method, url, **kwargs)
+            return response, round((time.perf_counter() - start) * 1000)
+
+    async def fetch_playlist(self, client, url, timing):
+        """(미디어 플레이리스트 URL, 본문) - 마스터면 첫 변형 스트림으로 이동
+
+        timing['latencyMs']: 첫 플레이리스트 응답 지연 (오류 응답이어도 기록)
+        """
+        for _ in range(MAX_PLAYLIST_DEPTH):
+            response, elapsed_ms = await self.request(client, 'GET', url)
+            timing.setdefault('latencyMs', elapsed_ms)
+            response.raise_for_status()
+            url = str(response.url)
+            text = response.text
+
+            variant = next_variant(text)
+            if variant is None:
+                return url, text
+            url = urljoin(url, variant)
+        return url, ''
+
+    async def probe(self, client, url):
+        """URL 하나 점검 → health dict"""
+        checked_at = int(time.time())
+        timing = {}
+        try:
+            playlist_url, text = await self.fetch_playlist(client, url, timing)
+            latency_ms = timing['latencyMs']
+            playlist = parse_media_playlist(text)
+            if not playlist['segments']:
+                return make_health('dead', latency_ms, None, checked_at)
+
+            segment_url = urljoin(playlist_url, playlist['segments'][-1])
+            response, _ = await self.request(client, 'HEAD', segment_url)
+            if response.status_code == 405:
+                # HEAD를 지원하지 않는 서버는 첫 바이트만 요청
+                response, _ = await self.request(client, 'GET', segment_url, headers={'Range': 'bytes=0-0'})
+            response.raise_for_status()
+
+            age = segment_age(response.headers.get('last-modified'), playlist, checked_at)
+            if playlist['ended'] or (age is not None and age > self.stale_age):
+                return make_health('stale', latency_ms, age, checked_at)
+            return make_health('ok', latency_ms, age, checked_at)
+
+        except httpx.TimeoutException:
+            return make_health('timeout', timing.get('latencyMs'), None, checked_at)
+        except httpx.HTTPStatusError as e:
+            status = 'denied' if e.response.status_code in (401, 403) else 'dead'
+            return make_health(status, timing.get('latencyMs'), None, checked_at)
+        except (httpx.HTTPError, httpx.InvalidURL, ValueError):
+            # 잘못된 URL(urlsplit/httpx의 ValueError, InvalidURL)도 점검 전체를 멈추지 않고 error로 기록
+            return make_health('error', timing.get('latencyMs'), None, checked_at)
+
+    async def probe_all(self, urls, progress_every=1000):
+        """URL 목록 점검 → {url: health} (같은 URL은 한 번만 점검)"""
+        unique = list(dict.fromkeys(url for url in urls if url))
+        results = {}
+        semaphore = asyncio.Semaphore(self.concurrency)
+        limits = httpx.Limits(max_connections=self.concurrency, max_keepalive_connections=self.concurrency)
+        timeout = httpx.Timeout(self.timeout)
+        start = time.perf_counter()
+
+        async with httpx.AsyncClient(limits=limits, timeout=timeout, follow_redirects=True) as client:
+            async def run(url):
+                async with semaphore:
+                    results[url] = await self.probe(client, url)
+                if progress_every and len(results) % progress_every == 0:
+                    elapsed = time.perf_counter() - start
+                    print(f"  {len(results):,}/{len(unique):,} 점검 ({len(results) / elapsed:,.0f}개/초)")
+
+            await asyncio.gather(*(run(url) for url in unique))
+        return results
+
+
+def next_variant(text):
+    """마스터 플레이리스트면 첫 변형 스트림 URI, 아니면 None"""
+    lines = [line.strip() for line in text.splitlines()]
+    for i, line in enumerate(lines):
+        if line.startswith('#EXT-X-STREAM-INF'):
+            for uri in lines[i + 1:]:
+                if uri and not uri.startswith('#'):
+                    return uri
+    return None
+
+
+def parse_media_playlist(text):
+    """미디어 플레이리스트 → {segments, durations, programDateTime(마지막 세그먼트), ended}"""
+    segments = []
+    durations = []
+    program_time = None
+    last_program_time = None
+    duration = 0.0
+    ended = False
+
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith('#EXTINF:'):
+            try:
+                duration = float(line[8:].split(',', 1)[0])
+            except ValueError:
+                duration = 0.0
+        elif line.startswith('#EXT-X-PROGRAM-DATE-TIME:'):
+            program_time = line.split(':', 1)[1]
+        elif line.startswith('#EXT-X-ENDLIST'):
+            ended = True
+        elif not line.startswith('#'):
+            segments.append(line)
+            durations.append(duration)
+            last_program_time = program_time
+            program_time = None
+            duration = 0.0
+
+    return {
+        'segments': segments,
+        'durations': durations,
+        'programDateTime': last_program_time,
+        'ended': ended,
+    }
+
+
+def segment_age(last_modified, playlist, now):
+    """최신 세그먼트 생성 후 경과 시간 (초) - Last-Modified 우선, 없으면 PROGRAM-DATE-TIME, 둘 다 없으면 None"""
+    if last_modified:
+        try:
+            return max(0, round(now - parsedate_to_datetime(last_modified).timestamp()))
+        except (TypeError, ValueError):
+            pass
+
+    if playlist['programDateTime']:
+        try:
+            started = datetime.fromisoformat(playlist['programDateTime'].replace('Z', '+00:00'))
+            return max(0, round(now - started.timestamp() - playlist['durations'][-1]))
+        except ValueError:
+            pass
+    return None
+
+
+def make_health(status, latency_ms, age, checked_at):
+    """compact health 필드 (값이 없는 항목은 생략)"""
+    health = {'status': status}
+    if latency_ms is not None:
+        health['latencyMs'] = latency_ms
+    if age is not None:
+        health['segmentAge'] = age
+    health['checkedAt'] = checked_at
+    return health
+
+
+def apply_health(data, results):
+    """점검 결과를 레코드의 health 필드로 기록 (URL이 없는 레코드는 health 제거)"""
+    for cctv in data['response'].get('data') or []:
+        health = results.get(cctv.get('cctvurl'))
+        if health is None:
+            cctv.pop(HEALTH_FIELD, None)
+        else:
+            cctv[HEALTH_FIELD] = health
+
+
+def percentile(values, q):
+    if not values:
+        return None
+    values = sorted(values)
+    return values[min(int(len(values) * q), len(values) - 1)]
+
+
+def print_summary(results, elapsed, prober):
+    statuses = Counter(health['status'] for health in results.values())
+    latencies = [h['latencyMs'] for h in results.values() if 'latencyMs' in h]
+    print(f"\n점검 {len(results):,}개, {elapsed:.1f}초 ({len(results) / max(elapsed, 1e-9):,.0f}개/초)")
+    for status, count in statuses.most_common():
+        print(f"  {status:<8} {count:>7,}개 ({count / len(results) * 100:.1f}%)")
+    if latencies:
+        print(f"  플레이리스트 응답: p50 {percentile(latencies, 0.5)}ms, p95 {percentile(latencies, 0.95)}ms")
+    print(f"  호스트 {len(prober.host_requests)}개, 요청 {sum(prober.host_requests.values()):,}회 "
+          f"(호스트당 최대 {max(prober.host_requests.values(), default=0):,}회)")
+    return statuses
+
+
+def save_data(data, path):
+    """데이터 파일 원자적 교체 저장 (파이프라인과 같은 형식) + compact 아티팩트 재생성"""
+    tmp_path = path.with_name(path.name + '.tmp')
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+    print(f"  저장: {path}")
+    write_compact_artifact(data, path)
+
+
+def probe_file(path, prober, limit=None, dry_run=False):
+    """데이터 파일 하나 점검 후 health 기록 (compact 아티팩트도 다시 생성)"""
+    if not path.exists():
+        print(f"  건너뜀 (파일 없음): {path}")
+        return None
+
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    cctv_list = data['response'].get('data') or []
+    urls = [cctv.get('cctvurl') for cctv in cctv_list[:limit] if cctv.get('cctvurl')]
+
+    print(f"\n{path.name}: CCTV {len(cctv_list):,}개 중 {len(urls):,}개 점검")
+    start = time.perf_counter()
+    results = asyncio.run(prober.probe_all(urls))
+    print_summary(results, time.perf_counter() - start, prober)
+
+    if dry_run:
+        print("  (--dry-run: 파일에 기록하지 않음)")
+        return results
+    if limit is not None:
+        # 일부만 점검한 경우 점검하지 않은 레코드의 기존 health 유지
+        for cctv in cctv_list:
+            if cctv.get('cctvurl') not in results and HEALTH_FIELD in cctv:
+                results[cctv['cctvurl']] = cctv[HEALTH_FIELD]
+    apply_health(data, results)
+    save_data(data, path)
+    return results
+
+
+def run_fixture(count, prober, seed):
+    """로컬 HLS 테스트 서버 점검 → 종류별 기대 상태와 다르면 종료 코드 1"""
+    with HlsFixtureServer() as server:
+        port = server.httpd.server_address[1]
+        # 같은 서버를 두 호스트 이름으로 나눠 호스트별 제한 적용 확인
+        data = build_fixture_dataset([f'http://127.0.0.1:{port}', f'http://localhost:{port}'], count, seed)
+        records = data['response']['data']
+
+        print(f"테스트 서버 {server.base_url}: 가상 CCTV {count:,}개")
+        start = time.perf_counter()
+        results = asyncio.run(prober.probe_all([cctv['cctvurl'] for cctv in records]))
+        print_summary(results, time.perf_counter() - start, prober)
+        print(f"  서버 수신 요청 {server.requests:,}회")
+
+    mismatches = Counter()
+    for cctv in records:
+        expected = EXPECTED_STATUS[cctv['fixtureKind']]
+        actual = results[cctv['cctvurl']]['status']
+        if actual != expected:
+            mismatches[(cctv['fixtureKind'], actual)] += 1
+
+    if mismatches:
+        print("\n기대 상태와 다른 결과:")
+        for (kind, actual), n in mismatches.most_common():
+            print(f"  {kind} → {actual} (기대 {EXPECTED_STATUS[kind]}): {n}개")
+        return 1
+    print("\n모든 가상 CCTV가 기대 상태와 일치")
+    return 0
+
+
+def parse_args():
+    """커맨드라인 인자 파싱"""
+    parser = argparse.ArgumentParser(description='CCTV HLS 스트림 상태 점검 (health 필드 기록)')
+    parser.add_argument('--http', action='store_true', help='HTTP 버전만 점검')
+    parser.add_argument('--https', action='store_true', help='HTTPS 버전만 점검')
+    parser.add_argument('--limit', type=int, help='파일별 앞에서부터 N개만 점검 (나머지는 기존 health 유지)')
+    parser.add_argument('--dry-run', action='store_true', help='점검만 하고 파일에 기록하지 않음')
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY,
+                        help=f'동시에 점검할 CCTV 수 (기본: {DEFAULT_CONCURRENCY})')
+    parser.add_argument('--per-host', type=int, default=DEFAULT_PER_HOST,
+                        help=f'호스트별 동시 요청 수 (기본: {DEFAULT_PER_HOST})')
+    parser.add_argument('--host-rate', type=float, default=DEFAULT_HOST_RATE,
+                        help=f'호스트별 초당 요청 수, 0이면 무제한 (기본: {DEFAULT_HOST_RATE:g})')
+    parser.add_argument('--timeout', type=float, default=DEFAULT_TIMEOUT,
+                        help=f'요청별 타임아웃 초 (기본: {DEFAULT_TIMEOUT:g})')
+    parser.add_argument('--stale-age', type=int, default=STALE_SEGMENT_AGE,
+                        help=f'이 시간(초)보다 오래된 세그먼트는 stale (기본: {STALE_SEGMENT_AGE})')
+    parser.add_argument('--fixture', type=int, metavar='N',
+                        help='로컬 HLS 테스트 서버에 가상 CCTV N개를 만들어 점검기 검증')
+    parser.add_argument('--seed', type=int, default=0, help='--fixture 가상 데이터 난수 시드')
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    if not HAS_HTTPX:
+        print("httpx가 필요합니다: pip install -r requirements.txt")
+        return 1
+
+    prober = StreamProber(
+        concurrency=args.concurrency,
+        per_host=args.per_host,
+        host_rate=args.host_rate,
+        timeout=args.timeout,
+        stale_age=args.stale_age,
+    )
+
+    if args.fixture:
+        return run_fixture(args.fixture, prober, args.seed)
+
+    targets = []
+    if not args.https:
+        targets.append(CCTV_DATA_WITH_LINKS_FILE)
+    if not args.http:
+        targets.append(CCTV_DATA_HTTPS_WITH_LINKS_FILE)
+
+    for path in targets:
+        probe_file(path, prober, limit=args.limit, dry_run=args.dry_run)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
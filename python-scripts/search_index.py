@@ -0,0 +1,118 @@
+"""
+CCTV 이름 검색 인덱스 생성 모듈
+
+CCTV 이름(cctvname)과 매핑된 도로명(linkRoadName)에 대해 n-gram 역색인을 만듭니다.
+한글은 자모 분해형(부분 음절 입력 대응)과 초성형(초성 검색 대응)을 함께 색인합니다.
+
+예: '강남역' → 자모형 'ㄱㅏㅇㄴㅏㅁㅇㅕㄱ', 초성형 'ㄱㄴㅇ'
+
+정규화/자모 분해 규칙은 backend/cctv/search.py에도 같은 코드가 있습니다 (백엔드 이미지에는 이 폴더가 없음).
+두 사본이 같은지는 backend/cctv/tests.py에서 확인합니다.
+"""
+
+import json
+import re
+import unicodedata
+from pathlib import Path
+
+SEARCH_INDEX_VERSION = 2
+
+# 색인하는 n-gram 길이
+# 백엔드는 변환 후 2글자 미만인 검색어('ㄱ', 'a' 등)를 검색하지 않으므로 unigram은 색인하지 않음
+# (unigram 포스팅은 거의 모든 문서를 담고 있어 인덱스 크기와 교집합 비용만 키움)
+NGRAM_SIZES = (2,)
+
+HANGUL_BASE = 0xAC00
+HANGUL_END = 0xD7A3
+
+# 호환용 자모 (사용자 키보드 입력과 같은 문자)
+CHOSEONG = 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ'
+JUNGSEONG = 'ㅏㅐㅑㅒㅓㅔㅕㅖㅗㅘㅙㅚㅛㅜㅝㅞㅟㅠㅡㅢㅣ'
+JONGSEONG = ['', 'ㄱ', 'ㄲ', 'ㄳ', 'ㄴ', 'ㄵ', 'ㄶ', 'ㄷ', 'ㄹ', 'ㄺ', 'ㄻ', 'ㄼ', 'ㄽ', 'ㄾ', 'ㄿ', 'ㅀ',
+             'ㅁ', 'ㅂ', 'ㅄ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+
+# 공백/괄호/구분 기호 제거 (한글, 자모, 영문, 숫자만 유지)
+_STRIP_PATTERN = re.compile(r'[^0-9a-z가-힣ㄱ-ㆎ]')
+
+
+def normalize_text(text):
+    """검색용 정규화 (유니코드 정규화, 소문자, 공백/기호 제거)"""
+    # 호환용 자모(ㄱ, ㅏ 등)는 NFKC에서 조합용 자모로 바뀌므로 그대로 둠
+    text = ''.join(
+        ch if 'ㄱ' <= ch <= 'ㆎ' else unicodedata.normalize('NFKC', ch)
+        for ch in text
+    )
+    return _STRIP_PATTERN.sub('', text.lower())
+
+
+def to_jamo(text):
+    """한글 음절을 자모로 분해 ('강남' → 'ㄱㅏㅇㄴㅏㅁ')"""
+    result = []
+    for ch in text:
+        code = ord(ch)
+        if HANGUL_BASE <= code <= HANGUL_END:
+            offset = code - HANGUL_BASE
+            result.append(CHOSEONG[offset // 588])
+            result.append(JUNGSEONG[(offset % 588) // 28])
+            result.append(JONGSEONG[offset % 28])
+        else:
+            result.append(ch)
+    return ''.join(result)
+
+
+def to_choseong(text):
+    """한글 음절을 초성으로 변환 ('강남' → 'ㄱㄴ')"""
+    return ''.join(
+        CHOSEONG[(ord(ch) - HANGUL_BASE) // 588] if HANGUL_BASE <= ord(ch) <= HANGUL_END else ch
+        for ch in text
+    )
+
+
+def ngrams(text):
+    """NGRAM_SIZES 길이의 n-gram 집합"""
+    return {text[i:i + n] for n in NGRAM_SIZES for i in range(len(text) - n + 1)}
+
+
+def build_search_index(data):
+    """CCTV 데이터 → 검색 인덱스 (문서 = CCTV, 문서 번호 = response.data 위치)"""
+    cctv_list = data['response'].get('data') or []
+
+    docs = []
+    postings = {'jamo': {}, 'cho': {}}
+
+    for doc_id, cctv in enumerate(cctv_list):
+        # 매핑되지 않은 CCTV는 linkRoadName이 없음
+        name = normalize_text(cctv.get('cctvname') or '')
+        road = normalize_text(cctv.get('linkRoadName') or '')
+        forms = {
+            'jamo': [to_jamo(name), to_jamo(road)],
+            'cho': [to_choseong(name), to_choseong(road)],
+        }
+        docs.append([cctv.get('cctvId'), *forms['jamo'], *forms['cho']])
+
+        for form, texts in forms.items():
+            for gram in set().union(*(ngrams(text) for text in texts)):
+                postings[form].setdefault(gram, []).append(doc_id)
+
+    return {
+        'version': SEARCH_INDEX_VERSION,
+        'count': len(docs),
+        'ngramSizes': list(NGRAM_SIZES),
+        # [cctvId, 이름 자모형, 도로명 자모형, 이름 초성형, 도로명 초성형]
+        'docs': docs,
+        'postings': postings,
+    }
+
+
+def write_search_index(data, output_path):
+    """검색 인덱스를 JSON 파일로 저장"""
+    if isinstance(output_path, str):
+        output_path = Path(output_path)
+
+    index = build_search_index(data)
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+
+    grams = sum(len(p) for p in index['postings'].values())
+    print(f"  검색 인덱스 저장: {output_path.name} (문서 {index['count']:,}개, 고유 n-gram {grams:,}개)")
+    return index
@@ -7,11 +7,22 @@ API에서 CCTV 데이터를 다운로드하고 저장합니다.
 import argparse
 import json
 import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import requests
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
 
+try:
+    import ijson
+    HAS_IJSON = True
+except ImportError:
+    HAS_IJSON = False
+
+from cctv_id import assign_cctv_ids, iter_assign_cctv_ids
 from paths import CCTV_DATA_FILE
 
 load_dotenv()
@@ -19,8 +30,12 @@ load_dotenv()
 # cctvType: 1=HLS(HTTP), 2=MP4(HTTP), 3=정지영상, 4=HLS(HTTPS), 5=MP4(HTTPS)
 DEFAULT_CCTV_TYPE = '1'
 
+# 도로 유형: ex=고속도로, its=국도
+ROAD_TYPES = ['ex', 'its']
+
 CONFIG = {
-    'api_url': 'https://openapi.its.go.kr:9443/cctvInfo',
+    # 로컬 스텁 서버 테스트 시 ITS_CCTV_API_URL로 교체
+    'api_url': os.getenv('ITS_CCTV_API_URL', 'https://openapi.its.go.kr:9443/cctvInfo'),
     'api_key': os.getenv('REACT_APP_OPENAPI_ITS_KEY', ''),
     'min_x': '124.0',
     'max_x': '132.0',
@@ -29,15 +44,91 @@ CONFIG = {
     'get_type': 'json'
 }
 
+# 다운로드 설정 (동시 요청 수, 타임아웃, 재시도)
+DOWNLOAD_CONFIG = {
+    'max_workers': 4,
+    'timeout': 30,
+    'max_retries': 3,
+    'backoff_base': 1.0,  # 초
+    'backoff_max': 16.0,  # 초
+}
+
+# 타일 모드 설정 (전국 범위를 격자로 나눠 병렬 요청)
+TILE_CONFIG = {
+    'max_rounds': 3,  # 실패 타일만 다시 요청하는 최대 라운드 수
+    'dedupe_precision': 5,  # 경계 중복 제거용 좌표 반올림 자릿수 (약 1m)
+}
+
+# 재시도 대상 HTTP 상태 코드
+RETRY_STATUS_CODES = {500, 502, 503, 504}
+
+
+class RetryableError(Exception):
+    """재시도 가능한 응답 오류 (5xx)"""
+
 
 def get_api_key():
     """API 키 반환"""
     return CONFIG['api_key']
 
 
-def fetch_cctv_data(road_type, cctv_type):
+def get_road_type_name(road_type):
+    """도로 유형 표시명"""
+    return '고속도로' if road_type == 'ex' else '국도'
+
+
+def create_session(pool_size=None):
+    """커넥션 풀을 공유하는 HTTP 세션 생성"""
+    if pool_size is None:
+        pool_size = DOWNLOAD_CONFIG['max_workers']
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def get_backoff_delay(attempt):
+    """지수 백오프 + full jitter 대기 시간 (초)"""
+    cap = min(DOWNLOAD_CONFIG['backoff_max'], DOWNLOAD_CONFIG['backoff_base'] * (2 ** attempt))
+    return random.uniform(0, cap)
+
+
+def request_json(session, params, label):
+    """API 호출 (타임아웃/연결 오류/5xx는 백오프 후 재시도)
+
+    반환: (응답 JSON, 소요 시간(초))
+    """
+    max_retries = DOWNLOAD_CONFIG['max_retries']
+    start = time.perf_counter()
+
+    for attempt in range(max_retries + 1):
+        try:
+            response = session.get(CONFIG['api_url'], params=params, timeout=DOWNLOAD_CONFIG['timeout'])
+            if response.status_code in RETRY_STATUS_CODES:
+                raise RetryableError(f"HTTP {response.status_code}")
+            response.raise_for_status()
+            data = response.json()
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError, RetryableError) as e:
+            if attempt == max_retries:
+                raise Exception(f"API 호출 오류 ({label}): {e} (재시도 {max_retries}회 초과)")
+            delay = get_backoff_delay(attempt)
+            print(f"  ↻ {label}: {e} - {delay:.1f}초 후 재시도 ({attempt + 1}/{max_retries})")
+            time.sleep(delay)
+            continue
+        except (requests.exceptions.RequestException, ValueError) as e:
+            raise Exception(f"API 호출 오류 ({label}): {e}")
+
+        elapsed = time.perf_counter() - start
+        retry_note = f" (재시도 {attempt}회)" if attempt else ""
+        print(f"  ✓ {label}: {elapsed:.2f}초{retry_note}")
+        return data, elapsed
+
+
+def fetch_cctv_data(road_type, cctv_type, session=None):
     """API 호출하여 CCTV 데이터 가져오기"""
-    road_type_name = '고속도로' if road_type == 'ex' else '국도'
+    road_type_name = get_road_type_name(road_type)
     print(f"  {road_type_name} CCTV 데이터를 가져오는 중...")
 
     params = {
@@ -51,28 +142,202 @@ def fetch_cctv_data(road_type, cctv_type):
         'getType': CONFIG['get_type']
     }
 
-    try:
-        response = requests.get(CONFIG['api_url'], params=params, timeout=30)
-        response.raise_for_status()
-        return response.json()
-    except requests.exceptions.RequestException as e:
-        raise Exception(f"API 호출 오류 ({road_type_name}): {e}")
+    if session is None:
+        session = create_session(pool_size=1)
 
+    data, _ = request_json(session, params, f"{road_type_name}/cctvType={cctv_type}")
+    return data
 
-def save_to_file(data, file_path):
-    """JSON 파일 저장"""
-    if isinstance(file_path, str):
-        file_path = Path(file_path)
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(file_path, 'w', encoding='utf-8') as f:
-        json.dump(data, f, ensure_ascii=False, indent=2)
 
+def fetch_all_cctv_data(cctv_types, session=None):
+    """모든 도로 유형 × cctvType 조합을 동시에 다운로드
 
-def download_and_merge(cctv_type, output_file):
-    """CCTV 데이터 다운로드 및 병합 후 저장 (외부 호출용)"""
-    ex_data = fetch_cctv_data('ex', cctv_type)
-    its_data = fetch_cctv_data('its', cctv_type)
+    반환: {(road_type, cctv_type): 응답 JSON}
+    """
+    jobs = [(road_type, cctv_type) for cctv_type in cctv_types for road_type in ROAD_TYPES]
+    max_workers = min(DOWNLOAD_CONFIG['max_workers'], len(jobs))
+
+    if session is None:
+        session = create_session(pool_size=max_workers)
 
+    print(f"  {len(jobs)}개 요청 동시 실행 (최대 {max_workers}개 병렬)")
+    start = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            job: executor.submit(fetch_cctv_data, job[0], job[1], session)
+            for job in jobs
+        }
+        results = {job: future.result() for job, future in futures.items()}
+
+    print(f"  다운로드 완료: {time.perf_counter() - start:.2f}초")
+    return results
+
+
+def parse_grid(value):
+    """'4x4' 형식의 격자 크기 파싱 → (열 수, 행 수)"""
+    try:
+        cols, rows = (int(v) for v in value.lower().split('x'))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"격자 형식 오류: {value} (예: 4x4)")
+    if cols < 1 or rows < 1:
+        raise argparse.ArgumentTypeError(f"격자 크기는 1 이상이어야 합니다: {value}")
+    return cols, rows
+
+
+def build_tiles(grid):
+    """전국 좌표 범위를 cols × rows 타일로 분할"""
+    cols, rows = grid
+    min_x, max_x = float(CONFIG['min_x']), float(CONFIG['max_x'])
+    min_y, max_y = float(CONFIG['min_y']), float(CONFIG['max_y'])
+    step_x = (max_x - min_x) / cols
+    step_y = (max_y - min_y) / rows
+
+    tiles = []
+    for row in range(rows):
+        for col in range(cols):
+            tiles.append({
+                'key': f"r{row}c{col}",
+                'min_x': f"{min_x + step_x * col:.6f}",
+                'max_x': f"{min_x + step_x * (col + 1):.6f}",
+                'min_y': f"{min_y + step_y * row:.6f}",
+                'max_y': f"{min_y + step_y * (row + 1):.6f}",
+            })
+    return tiles
+
+
+def get_response_items(data):
+    """응답의 data 필드를 리스트로 정규화 (결과가 1개면 객체, 0개면 누락될 수 있음)"""
+    items = data.get('response', {}).get('data') or []
+    return items if isinstance(items, list) else [items]
+
+
+def fetch_tile(session, road_type, cctv_type, tile):
+    """타일 하나의 CCTV 데이터 요청 → (응답 JSON, 소요 시간)"""
+    params = {
+        'apiKey': CONFIG['api_key'],
+        'type': road_type,
+        'cctvType': cctv_type,
+        'minX': tile['min_x'],
+        'maxX': tile['max_x'],
+        'minY': tile['min_y'],
+        'maxY': tile['max_y'],
+        'getType': CONFIG['get_type']
+    }
+    label = f"{get_road_type_name(road_type)}/cctvType={cctv_type}/{tile['key']}"
+    return request_json(session, params, label)
+
+
+def dedupe_cctv_items(items):
+    """타일 경계에서 중복 수신된 CCTV 제거 (이름 + 반올림 좌표 기준)"""
+    precision = TILE_CONFIG['dedupe_precision']
+    seen = set()
+    unique = []
+    for cctv in items:
+        key = (
+            cctv.get('cctvname'),
+            round(float(cctv['coordx']), precision),
+            round(float(cctv['coordy']), precision),
+        )
+        if key in seen:
+            continue
+        seen.add(key)
+        unique.append(cctv)
+    return unique
+
+
+def print_tile_stats(tile_stats):
+    """타일별 소요 시간/건수 요약 (느린 타일, 빈 타일)"""
+    stats = sorted(tile_stats.values(), key=lambda t: t['elapsed'], reverse=True)
+
+    print(f"\n  타일 통계 ({len(stats)}개)")
+    print(f"  {'타일':<8} {'CCTV':>7} {'최대 소요(초)':>13} {'시도':>5}")
+    for tile in stats[:5]:
+        print(f"  {tile['key']:<8} {tile['count']:>7,} {tile['elapsed']:>13.2f} {tile['attempts']:>5}")
+
+    empty = [tile['key'] for tile in stats if tile['count'] == 0]
+    if empty:
+        print(f"  빈 타일 {len(empty)}개: {', '.join(sorted(empty))}")
+
+
+def fetch_tiled_cctv_data(cctv_types, grid, session=None):
+    """타일 모드 다운로드: 타일을 병렬 요청하고 실패한 타일만 재요청
+
+    반환: {(road_type, cctv_type): 타일 병합/중복 제거된 응답 JSON}
+    """
+    tiles = build_tiles(grid)
+    pending = [
+        (road_type, cctv_type, tile)
+        for cctv_type in cctv_types
+        for road_type in ROAD_TYPES
+        for tile in tiles
+    ]
+    max_workers = min(DOWNLOAD_CONFIG['max_workers'], len(pending))
+
+    if session is None:
+        session = create_session(pool_size=max_workers)
+
+    print(f"  타일 모드: {grid[0]}x{grid[1]} 격자, {len(pending)}개 요청 (최대 {max_workers}개 병렬)")
+    start = time.perf_counter()
+
+    responses = {}
+    tile_stats = {
+        tile['key']: {'key': tile['key'], 'count': 0, 'elapsed': 0.0, 'attempts': 0}
+        for tile in tiles
+    }
+
+    for round_no in range(1, TILE_CONFIG['max_rounds'] + 1):
+        failed = []
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [(job, executor.submit(fetch_tile, session, *job)) for job in pending]
+            for job, future in futures:
+                road_type, cctv_type, tile = job
+                stats = tile_stats[tile['key']]
+                stats['attempts'] += 1
+                try:
+                    data, elapsed = future.result()
+                except Exception as e:
+                    print(f"  ✗ {e}")
+                    failed.append(job)
+                    continue
+                responses[(road_type, cctv_type, tile['key'])] = data
+                stats['count'] += len(get_response_items(data))
+                stats['elapsed'] = max(stats['elapsed'], elapsed)
+
+        pending = failed
+        if not pending:
+            break
+        if round_no < TILE_CONFIG['max_rounds']:
+            print(f"  실패 타일 {len(pending)}개 재요청 (라운드 {round_no + 1}/{TILE_CONFIG['max_rounds']})")
+
+    if pending:
+        failed_keys = sorted({tile['key'] for _, _, tile in pending})
+        raise Exception(f"타일 다운로드 실패: {', '.join(failed_keys)}")
+
+    print(f"  다운로드 완료: {time.perf_counter() - start:.2f}초")
+    print_tile_stats(tile_stats)
+
+    results = {}
+    for cctv_type in cctv_types:
+        for road_type in ROAD_TYPES:
+            tile_responses = [responses[(road_type, cctv_type, tile['key'])] for tile in tiles]
+            items = [cctv for data in tile_responses for cctv in get_response_items(data)]
+            unique = dedupe_cctv_items(items)
+            coordtype = next(
+                (data['response']['coordtype'] for data in tile_responses if 'coordtype' in data.get('response', {})),
+                1
+            )
+            if len(items) != len(unique):
+                print(f"  {get_road_type_name(road_type)}/cctvType={cctv_type}: 경계 중복 {len(items) - len(unique)}개 제거")
+            results[(road_type, cctv_type)] = {
+                'response': {'coordtype': coordtype, 'datacount': len(unique), 'data': unique}
+            }
+
+    return results
+
+
+def merge_cctv_data(ex_data, its_data):
+    """고속도로/국도 응답을 하나의 응답 구조로 병합"""
     if not ex_data or 'response' not in ex_data or not its_data or 'response' not in its_data:
         raise Exception('유효하지 않은 API 응답')
 
@@ -90,16 +355,163 @@ def download_and_merge(cctv_type, output_file):
         }
     }
 
+    collisions = assign_cctv_ids(merged_data['response']['data'])
+
     print(f"  고속도로: {len(ex_data['response']['data'])}개")
     print(f"  국도: {len(its_data['response']['data'])}개")
     print(f"  총: {merged_data['response']['datacount']}개")
-
-    save_to_file(merged_data, output_file)
-    print(f"  저장: {output_file}")
+    if collisions:
+        print(f"  ID 충돌: {collisions}개 (접미사 부여)")
 
     return merged_data
 
 
+def save_to_file(data, file_path):
+    """JSON 파일 저장"""
+    if isinstance(file_path, str):
+        file_path = Path(file_path)
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(file_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def open_stream(session, params, label):
+    """API 호출 후 본문을 읽지 않은 응답 반환 (스트리밍 파싱용)
+
+    연결 오류/타임아웃/5xx는 request_json과 같이 재시도하지만,
+    본문 수신 중 오류는 이미 전달한 레코드가 있으므로 재시도하지 않습니다.
+    """
+    max_retries = DOWNLOAD_CONFIG['max_retries']
+
+    for attempt in range(max_retries + 1):
+        try:
+            response = session.get(CONFIG['api_url'], params=params, timeout=DOWNLOAD_CONFIG['timeout'],
+                                   stream=True)
+            if response.status_code in RETRY_STATUS_CODES:
+                response.close()
+                raise RetryableError(f"HTTP {response.status_code}")
+            response.raise_for_status()
+            return response
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError, RetryableError) as e:
+            if attempt == max_retries:
+                raise Exception(f"API 호출 오류 ({label}): {e} (재시도 {max_retries}회 초과)")
+            delay = get_backoff_delay(attempt)
+            print(f"  ↻ {label}: {e} - {delay:.1f}초 후 재시도 ({attempt + 1}/{max_retries})")
+            time.sleep(delay)
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"API 호출 오류 ({label}): {e}")
+
+
+def iter_response_items(response, header):
+    """응답 본문을 읽으면서 response.data 항목을 하나씩 생성
+
+    header: 응답의 coordtype을 기록할 dict
+    ijson이 없으면 본문 전체를 파싱한 뒤 순회합니다 (메모리 절감 없음).
+    """
+    if not HAS_IJSON:
+        data = response.json()
+        header['coordtype'] = data.get('response', {}).get('coordtype', header.get('coordtype'))
+        yield from get_response_items(data)
+        return
+
+    # gzip 등 전송 인코딩을 풀어서 파서에 전달
+    response.raw.decode_content = True
+    events = ijson.parse(response.raw, use_float=True)
+    for prefix, event, value in events:
+        if prefix == 'response.coordtype':
+            header['coordtype'] = value
+        # 결과가 1개면 data가 배열이 아닌 객체로 옴
+        elif event == 'start_map' and prefix in ('response.data', 'response.data.item'):
+            builder = ijson.ObjectBuilder()
+            builder.event(event, value)
+            depth = 1
+            for _, event, value in events:
+                builder.event(event, value)
+                if event in ('start_map', 'start_array'):
+                    depth += 1
+                elif event in ('end_map', 'end_array'):
+                    depth -= 1
+                    if depth == 0:
+                        break
+            yield builder.value
+
+
+def iter_cctv_items(road_type, cctv_type, session, header):
+    """도로 유형 하나의 CCTV 항목 스트림 (roadType 부여)"""
+    road_type_name = get_road_type_name(road_type)
+    label = f"{road_type_name}/cctvType={cctv_type}"
+    params = {
+        'apiKey': CONFIG['api_key'],
+        'type': road_type,
+        'cctvType': cctv_type,
+        'minX': CONFIG['min_x'],
+        'maxX': CONFIG['max_x'],
+        'minY': CONFIG['min_y'],
+        'maxY': CONFIG['max_y'],
+        'getType': CONFIG['get_type']
+    }
+
+    start = time.perf_counter()
+    count = 0
+    with open_stream(session, params, label) as response:
+        for cctv in iter_response_items(response, header):
+            cctv['roadType'] = road_type
+            count += 1
+            yield cctv
+
+    header.setdefault('roadTypes', {})[road_type] = count
+    print(f"  ✓ {label}: {count:,}개 ({time.perf_counter() - start:.2f}초, 스트리밍)")
+
+
+def iter_merged_cctv(cctv_type, session=None, header=None, stats=None, renames=None):
+    """고속도로 → 국도 순으로 CCTV 항목을 이어서 생성 (merge_cctv_data의 스트리밍 버전)
+
+    header: coordtype/도로 유형별 건수를 기록할 dict
+    stats: cctvId 충돌 수를 기록할 dict
+    renames: 스트림 종료 후 충돌 ID의 {임시 ID: 최종 ID}를 채울 dict (iter_assign_cctv_ids 참고)
+    """
+    if session is None:
+        session = create_session(pool_size=1)
+    if header is None:
+        header = {}
+
+    items = (
+        cctv
+        for road_type in ROAD_TYPES
+        for cctv in iter_cctv_items(road_type, cctv_type, session, header)
+    )
+    yield from iter_assign_cctv_ids(items, stats, renames)
+
+
+def download_all_and_merge(targets, session=None, grid=None):
+    """여러 cctvType 데이터를 동시에 다운로드하여 병합 후 저장 (외부 호출용)
+
+    targets: [(cctv_type, output_file), ...]
+    grid: (열 수, 행 수) 지정 시 타일 모드로 다운로드
+    반환: {cctv_type: 병합된 데이터}
+    """
+    cctv_types = [cctv_type for cctv_type, _ in targets]
+    if grid:
+        results = fetch_tiled_cctv_data(cctv_types, grid, session)
+    else:
+        results = fetch_all_cctv_data(cctv_types, session)
+
+    merged = {}
+    for cctv_type, output_file in targets:
+        print(f"\n  [cctvType={cctv_type}]")
+        merged_data = merge_cctv_data(results[('ex', cctv_type)], results[('its', cctv_type)])
+        save_to_file(merged_data, output_file)
+        print(f"  저장: {output_file}")
+        merged[cctv_type] = merged_data
+
+    return merged
+
+
+def download_and_merge(cctv_type, output_file, session=None, grid=None):
+    """CCTV 데이터 다운로드 및 병합 후 저장 (외부 호출용)"""
+    return download_all_and_merge([(cctv_type, output_file)], session, grid)[cctv_type]
+
+
 def parse_args():
     """커맨드라인 인자 파싱"""
     parser = argparse.ArgumentParser(description='CCTV 데이터 업데이트 스크립트')
@@ -116,6 +528,19 @@ def parse_args():
         default=None,
         help='출력 파일 경로. 기본값: cctv-data.json'
     )
+    parser.add_argument(
+        '--max-retries',
+        type=int,
+        default=DOWNLOAD_CONFIG['max_retries'],
+        help=f"타임아웃/5xx 응답 시 최대 재시도 횟수. 기본값: {DOWNLOAD_CONFIG['max_retries']}"
+    )
+    parser.add_argument(
+        '--tiles',
+        type=parse_grid,
+        default=None,
+        metavar='COLSxROWS',
+        help='전국 범위를 격자로 나눠 병렬 요청 (예: 4x4). 기본값: 단일 요청'
+    )
     return parser.parse_args()
 
 
@@ -123,6 +548,7 @@ def main():
     args = parse_args()
     cctv_type = args.cctv_type
     output_file = args.output if args.output else CCTV_DATA_FILE
+    DOWNLOAD_CONFIG['max_retries'] = args.max_retries
 
     print('========================================')
     print('CCTV 데이터 업데이트 시작')
@@ -138,7 +564,7 @@ def main():
     print(f"좌표 범위: ({CONFIG['min_x']}, {CONFIG['min_y']}) ~ ({CONFIG['max_x']}, {CONFIG['max_y']})\n")
 
     try:
-        download_and_merge(cctv_type, output_file)
+        download_and_merge(cctv_type, output_file, grid=args.tiles)
 
         print('\n========================================')
         print('✓ CCTV 데이터 업데이트 완료')